@@ -0,0 +1,269 @@
+"""
+Acquisition dans un processus séparé
+Le processus d'acquisition possède sa propre session Keithley2000 et écrit
+les mesures dans un buffer circulaire en mémoire partagée
+(SharedSampleRingBuffer); l'interface s'y attache en lecture seule. Le
+graphique et les statistiques ne partagent plus le GIL de la boucle de
+mesure: leurs calculs ne retardent plus les instants de mesure
+
+Messages du processus vers l'interface (file multiprocessing):
+    ('stats', dict)   Compteurs de cadencement / streaming (périodique)
+    ('error', str)    Erreur ayant arrêté l'acquisition
+    ('done', str)     Fin: 'complete' (durée / points atteints) ou 'stopped'
+"""
+import multiprocessing
+import queue
+import time
+
+from pacing import PacedScheduler
+from ring_buffer import SampleRingBuffer, SharedSampleRingBuffer
+
+
+def configure_keithley(keithley, config):
+    """
+    Applique la configuration de mesure (une ligne synchronisée par *OPC?)
+    Args:
+        keithley (Keithley2000): Instrument connecté
+        config (dict): Réglages (voir AcquisitionProcess)
+    """
+    with keithley.batch():
+        keithley.configure_measurement(config['meas_type'], config.get('range', 'AUTO'))
+        if config.get('nplc') is not None:
+            keithley.set_nplc(config['nplc'], config['meas_type'])
+        if config.get('filter'):
+            keithley.set_filter(True, config.get('filter_count', 10))
+        else:
+            keithley.set_filter(False)
+        if config.get('display_off'):
+            keithley.set_display(False)
+        if config.get('autozero_off'):
+            keithley.set_autozero(False)
+
+
+def restore_keithley(keithley, config):
+    """Arrête l'acquisition en cours et restaure les réglages de fin de mesure"""
+    if config.get('mode') == 'stream':
+        keithley.abort(clear=True)
+    if config.get('display_off'):
+        keithley.set_display(True)
+    if config.get('autozero_off'):
+        keithley.set_autozero(True)
+    if config.get('timer_interval'):
+        keithley.set_trigger_source('IMM')
+
+
+def run_paced(keithley, ring, stop_event, config, report=None, resume_event=None):
+    """
+    Mesures cadencées par le PC (mesure simple, rapide ou par lots)
+    Args:
+        keithley (Keithley2000): Instrument configuré
+        ring (SampleRingBuffer): Destination des mesures (temps depuis le départ)
+        stop_event: threading.Event ou multiprocessing.Event d'arrêt
+        config (dict): 'interval', 'fast', 'batch', 'batch_fill', 'max_duration'
+        report (callable): report(scheduler, batch_points) après chaque mesure
+        resume_event: Pause tant qu'il est baissé (None = pas de pause);
+                      stop_event doit aussi le lever pour réveiller la pause
+    Returns:
+        str: 'complete' (durée atteinte) ou 'stopped'
+    """
+    interval = config['interval']
+    max_duration = config.get('max_duration') or float('inf')
+    batch_points = None
+
+    scheduler = PacedScheduler(interval)
+    t0 = scheduler.start
+    while not stop_event.is_set():
+        # Pause: attente sans scrutation, la grille reprend au créneau suivant
+        if resume_event is not None and not resume_event.is_set():
+            resume_event.wait()
+            scheduler.resume()
+            continue
+
+        slot = scheduler.wait_next(stop_event)
+        if slot is None:
+            break
+        if slot[1] - t0 >= max_duration:
+            return 'complete'
+
+        if config.get('batch'):
+            batch_points = keithley.batch_size(interval * config.get('batch_fill', 0.8))
+            batch = keithley.measure_batch_timed(batch_points, stop_event=stop_event)
+            if batch is None:
+                break
+            values, times = batch
+            ring.extend(times - t0, values)
+        else:
+            elapsed = time.perf_counter() - t0
+            value = keithley.measure_fast() if config.get('fast') else keithley.measure_single()
+            ring.append(elapsed, value)
+
+        if report is not None:
+            report(scheduler, batch_points)
+    return 'stopped'
+
+
+def run_stream(keithley, ring, stop_event, config, report=None):
+    """
+    Streaming du buffer instrument (au plus vite ou cadencé par TRIG:TIM)
+    Args:
+        config (dict): 'chunk_points', 'max_points', 'timer_interval', 'max_duration'
+    Returns:
+        str: 'complete' (points / durée atteints) ou 'stopped'
+    """
+    t0 = time.perf_counter()
+    max_duration = config.get('max_duration') or float('inf')
+
+    def should_stop():
+        return time.perf_counter() - t0 > max_duration
+
+    for chunk in keithley.buffer_stream(config.get('chunk_points', 1024),
+                                        max_points=config.get('max_points'),
+                                        should_stop=should_stop,
+                                        timer_interval=config.get('timer_interval'),
+                                        stop_event=stop_event):
+        ring.extend(chunk['times'] - t0, chunk['values'])
+        if report is not None:
+            report(None, None)
+    return 'stopped' if stop_event.is_set() else 'complete'
+
+
+def _acquisition_main(resource, timeout, ring_name, config, stop_event, messages):
+    """Point d'entrée du processus d'acquisition"""
+    from keithley2000 import Keithley2000
+
+    ring = SharedSampleRingBuffer(name=ring_name)
+    keithley = Keithley2000(timeout=timeout)
+    last = {'time': 0.0, 'scheduler': None, 'batch_points': None}
+
+    def report(scheduler, batch_points, force=False):
+        # Compteurs envoyés au plus toutes les REPORT_INTERVAL secondes
+        if scheduler is not None:
+            last['scheduler'] = scheduler
+        if batch_points is not None:
+            last['batch_points'] = batch_points
+        now = time.perf_counter()
+        if not force and now - last['time'] < AcquisitionProcess.REPORT_INTERVAL:
+            return
+        last['time'] = now
+        stats = {'samples': ring.write_index, 'batch_points': last['batch_points']}
+        if last['scheduler'] is not None:
+            stats['scheduler'] = last['scheduler'].get_stats()
+        if config.get('mode') == 'stream':
+            stats['stream'] = dict(keithley.stream_stats)
+        messages.put(('stats', stats))
+
+    try:
+        keithley.connect(resource)
+        configure_keithley(keithley, config)
+        loop = run_stream if config.get('mode') == 'stream' else run_paced
+        reason = loop(keithley, ring, stop_event, config, report)
+        report(None, None, force=True)
+        messages.put(('done', reason))
+    except Exception as e:
+        messages.put(('error', f"Erreur processus d'acquisition: {e}"))
+    finally:
+        if keithley.connected:
+            try:
+                restore_keithley(keithley, config)
+            except Exception:
+                pass
+            keithley.disconnect()
+        ring.close()
+
+
+class AcquisitionProcess:
+    """Processus d'acquisition écrivant dans un buffer partagé"""
+
+    # Période d'envoi des compteurs vers l'interface (s)
+    REPORT_INTERVAL = 0.5
+
+    # Attente de la fin du processus après la demande d'arrêt (s)
+    JOIN_TIMEOUT = 5.0
+
+    def __init__(self, resource, config, capacity=SampleRingBuffer.DEFAULT_CAPACITY,
+                 history=None, timeout=5000):
+        """
+        Prépare le buffer partagé (le processus est lancé par start())
+        Args:
+            resource (str): Adresse VISA, ouverte par le processus lui-même
+            config (dict): Réglages de mesure ('meas_type', 'range', 'nplc',
+                           'filter', 'filter_count', 'display_off',
+                           'autozero_off') et d'acquisition ('mode' = 'paced'
+                           ou 'stream', voir run_paced / run_stream)
+            capacity (int): Taille du buffer partagé (points)
+            history (tuple): (temps, valeurs) recopiés avant le départ
+            timeout (int): Timeout VISA du processus en millisecondes
+        Note: Le processus ouvre sa propre session sur l'instrument, hors
+              des verrous de l'appelant: celui-ci ne doit pas utiliser sa
+              session jusqu'à la fin du processus (l'interface la réserve et
+              refuse ses commandes). Avec le simulateur, le processus a son
+              propre instrument simulé
+        """
+        self.resource = resource
+        self.config = dict(config)
+        self.timeout = timeout
+
+        # Contexte spawn: même comportement sous Windows et Linux
+        self.context = multiprocessing.get_context('spawn')
+        self.stop_event = self.context.Event()
+        self.messages = self.context.Queue()
+        self.process = None
+
+        # Historique recopié tant que ce processus est seul écrivain,
+        # puis lecture seule pour l'interface
+        self.ring = SharedSampleRingBuffer(capacity)
+        if history is not None:
+            self.ring.extend(*history)
+        self.ring.set_readonly()
+
+    def start(self):
+        """Lance le processus d'acquisition"""
+        self.process = self.context.Process(
+            target=_acquisition_main, name='keithley-acquisition', daemon=True,
+            args=(self.resource, self.timeout, self.ring.name, self.config,
+                  self.stop_event, self.messages))
+        self.process.start()
+
+    def request_stop(self):
+        """Demande l'arrêt (non bloquant): le processus abandonne l'attente en cours"""
+        self.stop_event.set()
+
+    def join(self, timeout=None):
+        """
+        Attend la fin du processus
+        Returns:
+            bool: True si le processus est terminé
+        """
+        if self.process is None:
+            return True
+        self.process.join(timeout)
+        return not self.process.is_alive()
+
+    def stop(self, timeout=JOIN_TIMEOUT):
+        """
+        Arrête le processus (terminé de force s'il ne répond pas)
+        Returns:
+            bool: True si l'arrêt a été propre
+        """
+        self.request_stop()
+        if self.join(timeout):
+            return True
+        self.process.terminate()
+        self.process.join()
+        return False
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def poll_messages(self):
+        """
+        Messages reçus du processus (non bloquant)
+        Returns:
+            list: Tuples (type, contenu)
+        """
+        received = []
+        while True:
+            try:
+                received.append(self.messages.get_nowait())
+            except queue.Empty:
+                return received
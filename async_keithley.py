@@ -0,0 +1,201 @@
+"""
+Pilote asyncio du Keithley 2000
+Les appels VISA bloquants de Keithley2000 sont exécutés sur un thread dédié
+à l'instrument (exécuteur à un seul worker: les transactions restent dans
+l'ordre); une boucle asyncio peut ainsi piloter plusieurs multimètres et
+l'interface sans un thread par activité
+
+Utilisation:
+    async with AsyncKeithley2000('GPIB0::16::INSTR') as dmm:
+        print(await dmm.query('*IDN?'))
+        values = await dmm.measure_batch(100)
+        async for chunk in dmm.stream(chunk_points=512, max_points=10000):
+            ...
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+
+from keithley2000 import Keithley2000
+from visa_pool import PRIORITY_HIGH, PRIORITY_LOW, io_priority
+
+
+def _run_with_priority(level, func, *args, **kwargs):
+    """Exécute func avec la priorité d'accès level (thread de l'instrument)"""
+    with io_priority(level):
+        return func(*args, **kwargs)
+
+
+class AsyncKeithley2000:
+    """Interface asyncio d'un Keithley2000 (un exécuteur par instrument)"""
+
+    def __init__(self, gpib_address=None, timeout=5000, keithley=None):
+        """
+        Args:
+            gpib_address (str): Adresse VISA, connectée par connect() ou
+                                à l'entrée du bloc "async with"
+            timeout (int): Timeout VISA en ms
+            keithley (Keithley2000): Instance existante à piloter (optionnel)
+        """
+        self.keithley = keithley if keithley is not None else Keithley2000(timeout=timeout)
+        self.gpib_address = gpib_address
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='keithley-io')
+        self.cancelled_calls = 0
+
+    async def __aenter__(self):
+        if self.gpib_address and not self.keithley.connected:
+            await self.connect(self.gpib_address)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _call(self, func, *args, abort_on_cancel=False, priority=PRIORITY_LOW,
+                    **kwargs):
+        """
+        Exécute un appel bloquant sur le thread de l'instrument
+        Args:
+            func (callable): Méthode bloquante
+            abort_on_cancel (bool): Envoie ABOR si la tâche est annulée
+                                    (mesure en cours sur l'instrument)
+            priority (int): Priorité d'accès à la session (PRIORITY_HIGH
+                            pour les mesures)
+        Returns:
+            Résultat de func
+        Note: Un appel VISA déjà commencé ne peut pas être interrompu: en cas
+              d'annulation, son résultat est ignoré et ABOR est mis en file
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, functools.partial(
+            _run_with_priority, priority, func, *args, **kwargs))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            self.cancelled_calls += 1
+            if abort_on_cancel:
+                self.executor.submit(self._abort_quietly)
+            raise
+
+    def _abort_quietly(self):
+        """ABOR sans erreur (instrument peut-être déconnecté entre-temps)"""
+        try:
+            if self.keithley.connected:
+                self.keithley.write('ABOR')
+        except Exception:
+            pass
+
+    # ===== CONNEXION =====
+
+    async def connect(self, gpib_address):
+        """Établit la connexion (voir Keithley2000.connect)"""
+        self.gpib_address = gpib_address
+        return await self._call(self.keithley.connect, gpib_address)
+
+    async def disconnect(self):
+        """Ferme la connexion"""
+        await self._call(self.keithley.disconnect)
+
+    async def close(self):
+        """Déconnecte puis arrête le thread de l'instrument"""
+        if self.keithley.connected:
+            await self.disconnect()
+        self.executor.shutdown(wait=False)
+
+    # ===== COMMANDES =====
+
+    async def write(self, command):
+        """Envoie une commande SCPI"""
+        await self._call(self.keithley.write, command)
+
+    async def query(self, command):
+        """Envoie une commande et retourne la réponse"""
+        return await self._call(self.keithley.query, command)
+
+    async def get_id(self):
+        return await self._call(self.keithley.get_id)
+
+    async def configure_measurement(self, meas_type, range_val='AUTO', resolution=None):
+        await self._call(self.keithley.configure_measurement, meas_type, range_val, resolution)
+
+    async def set_nplc(self, nplc, meas_type=None):
+        await self._call(self.keithley.set_nplc, nplc, meas_type)
+
+    async def call(self, method, *args, **kwargs):
+        """
+        Appelle n'importe quelle méthode de Keithley2000 sur le thread de l'instrument
+        Args:
+            method (str): Nom de la méthode (ex: 'set_filter')
+        Returns:
+            Résultat de la méthode
+        """
+        return await self._call(getattr(self.keithley, method), *args, **kwargs)
+
+    # ===== MESURES =====
+
+    async def measure_single(self):
+        """Mesure unique (READ?)"""
+        return await self._call(self.keithley.measure_single, abort_on_cancel=True,
+                                priority=PRIORITY_HIGH)
+
+    async def measure_batch(self, count):
+        """
+        Lot de mesures en une transaction (voir Keithley2000.measure_batch)
+        Returns:
+            numpy.ndarray: Valeurs mesurées
+        """
+        return await self._call(self.keithley.measure_batch, count, abort_on_cancel=True,
+                                priority=PRIORITY_HIGH)
+
+    async def measure_batch_timed(self, count):
+        """
+        Returns:
+            tuple: (valeurs, instants perf_counter)
+        """
+        return await self._call(self.keithley.measure_batch_timed, count, abort_on_cancel=True,
+                                priority=PRIORITY_HIGH)
+
+    async def stream(self, chunk_points=1024, max_points=None, timer_interval=None,
+                     poll_interval=0.01):
+        """
+        Flux continu de blocs buffer (voir Keithley2000.buffer_stream)
+        Args:
+            chunk_points (int): Taille d'un bloc (max 1024)
+            max_points (int): Nombre total de points (None = infini)
+            timer_interval (float): Période du timer instrument (None = au plus vite)
+            poll_interval (float): Période de scrutation du buffer (s)
+        Yields:
+            dict: Bloc {'index', 'values', 'times', 't_start', 't_end',
+                  'dead_time', 'lost_samples'}
+        Note: Sortir de la boucle "async for" ou annuler la tâche arrête
+              l'acquisition (ABOR) sans attendre la fin du bloc en cours
+        """
+        stop = threading.Event()
+        chunks = self.keithley.buffer_stream(chunk_points, max_points=max_points,
+                                             should_stop=stop.is_set,
+                                             poll_interval=poll_interval,
+                                             timer_interval=timer_interval)
+        try:
+            while True:
+                chunk = await self._call(next, chunks, None, priority=PRIORITY_HIGH)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            # Pas d'attente ici (annulation possible): l'attente SRQ/scrutation
+            # voit stop, puis le thread de l'instrument ferme le flux
+            stop.set()
+            self.executor.submit(self._close_stream, chunks)
+
+    def _close_stream(self, chunks):
+        """Ferme le générateur buffer_stream et arrête l'acquisition"""
+        try:
+            chunks.close()
+        except Exception:
+            pass
+        self._abort_quietly()
+
+    @property
+    def stream_stats(self):
+        """Compteurs cumulés du dernier flux (voir Keithley2000.buffer_stream)"""
+        return getattr(self.keithley, 'stream_stats', None)
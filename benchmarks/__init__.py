@@ -0,0 +1,4 @@
+"""
+Mesures de performance sur l'instrument simulé (SIM0::16::INSTR)
+Lancement depuis la racine du projet: python -m benchmarks.<module>
+"""
@@ -0,0 +1,93 @@
+"""
+Lecture du buffer: octets transférés et temps de décodage par format
+(binaire SREAL / DREAL contre texte ASCII), instrument simulé
+
+Utilisation: python -m benchmarks.buffer_read
+"""
+import time
+
+import numpy as np
+from pyvisa import util
+
+from keithley2000 import Keithley2000
+from visa_pool import get_pool
+
+# Tailles de buffer mesurées (points)
+SIZES = (100, 1024)
+
+# Répétitions par mesure (le minimum est retenu)
+REPEATS = 5
+
+# Format -> (valeur FORM:DATA, type numpy du bloc binaire ou None pour l'ASCII)
+FORMATS = {'SREAL': ('SRE', 'f'), 'DREAL': ('DRE', 'd'), 'ASC': ('ASC', None)}
+
+
+def _raw_response(keithley, form_data):
+    """Réponse brute de TRAC:DATA? dans un format donné"""
+    meter = keithley.meter
+    meter.write(f'FORM:DATA {form_data};:FORM:BORD SWAP;:TRAC:DATA?')
+    raw = meter.read_raw()
+    meter.write('FORM:DATA ASC')
+    keithley.invalidate_state()
+    return raw
+
+
+def _decode(raw, datatype):
+    """Décodage tel que fait par Keithley2000.buffer_read"""
+    if datatype is not None:
+        return util.from_ieee_block(raw, datatype, False, np.array)
+    text = raw.decode('latin-1')
+    return np.array([v for v in text.split(',') if v.strip()], dtype=float)
+
+
+def _best(func, repeats=REPEATS):
+    best = float('inf')
+    for _ in range(repeats):
+        t_start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t_start)
+    return best
+
+
+def run(resource='SIM0::16::INSTR', sizes=SIZES):
+    """
+    Args:
+        resource (str): Adresse de l'instrument (simulateur par défaut)
+        sizes (tuple): Tailles de buffer (points)
+    Returns:
+        list: dict par (taille, format): 'points', 'format', 'bytes',
+              'decode' (s), 'read' (s, buffer_read complet)
+    """
+    keithley = Keithley2000(resource)
+    keithley.configure_measurement('DCV')
+    keithley.set_nplc(0.01)
+    results = []
+    try:
+        for points in sizes:
+            keithley.buffer_configure(points)
+            keithley.buffer_start(points)
+            keithley.buffer_wait_complete(timeout=30.0)
+            for name, (form_data, datatype) in FORMATS.items():
+                raw = _raw_response(keithley, form_data)
+                results.append({
+                    'points': points,
+                    'format': name,
+                    'bytes': len(raw),
+                    'decode': _best(lambda: _decode(raw, datatype)),
+                    'read': _best(lambda: keithley.buffer_read(name))
+                })
+    finally:
+        keithley.disconnect()
+        get_pool().close_all()
+    return results
+
+
+def main():
+    print(f"{'Points':>6} {'Format':>6} {'Octets':>8} {'Décodage':>10} {'Lecture':>9}")
+    for r in run():
+        print(f"{r['points']:>6} {r['format']:>6} {r['bytes']:>8} "
+              f"{r['decode']*1e6:>8.0f}µs {r['read']*1000:>7.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
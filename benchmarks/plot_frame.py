@@ -0,0 +1,96 @@
+"""
+Temps d'une image du graphique temps réel selon le nombre de points:
+redessin complet de toute la courbe, décimation min/max + redessin
+complet, décimation + blit (BlitRenderer), backend Agg hors écran
+
+Utilisation: python -m benchmarks.plot_frame
+Note: Le blit Agg ne recopie pas l'image vers l'écran (FigureCanvasTkAgg
+      le fait en plus, coût proportionnel à la surface de l'axe)
+"""
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from gui.plot_renderer import BlitRenderer, decimate_minmax
+
+# Nombres de points de l'historique mesurés
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+
+# Images mesurées par méthode (la médiane est retenue)
+FRAMES = 15
+
+
+def _setup(x, y):
+    figure = Figure(figsize=(8, 4), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    line, = ax.plot([], [], 'b-', linewidth=1)
+    ax.set_xlim(x[0], x[-1])
+    ax.set_ylim(np.min(y), np.max(y))
+    return canvas, ax, line
+
+
+def _median_frame(frame, frames=FRAMES):
+    durations = []
+    for _ in range(frames):
+        t_start = time.perf_counter()
+        frame()
+        durations.append(time.perf_counter() - t_start)
+    return float(np.median(durations))
+
+
+def run(sizes=SIZES):
+    """
+    Args:
+        sizes (tuple): Nombres de points de la courbe
+    Returns:
+        list: dict par taille: 'points', 'full', 'decimated', 'blit',
+              'decimate' (durées en s par image)
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for n in sizes:
+        x = np.arange(n) * 1e-3
+        y = np.cumsum(rng.normal(size=n))
+
+        # Redessin complet de tous les points
+        canvas, ax, line = _setup(x, y)
+        line.set_data(x, y)
+        full = _median_frame(canvas.draw)
+
+        # Décimation à la largeur de l'axe puis redessin complet
+        canvas, ax, line = _setup(x, y)
+        width = max(1, int(ax.bbox.width))
+
+        def decimated_frame():
+            line.set_data(*decimate_minmax(x, y, width))
+            canvas.draw()
+        decimated = _median_frame(decimated_frame)
+
+        # Décimation + blit de la courbe seule (limites inchangées)
+        canvas, ax, line = _setup(x, y)
+        renderer = BlitRenderer(canvas, ax, [line])
+        canvas.draw()
+
+        def blit_frame():
+            line.set_data(*decimate_minmax(x, y, width))
+            renderer.refresh()
+        blit = _median_frame(blit_frame)
+
+        decimate = _median_frame(lambda: decimate_minmax(x, y, width))
+        results.append({'points': n, 'full': full, 'decimated': decimated,
+                        'blit': blit, 'decimate': decimate})
+    return results
+
+
+def main():
+    print(f"{'Points':>8} {'Complet':>10} {'Décimé':>10} {'Déc.+blit':>10} {'Décimation':>11}")
+    for r in run():
+        print(f"{r['points']:>8} {r['full']*1000:>8.1f}ms {r['decimated']*1000:>8.1f}ms "
+              f"{r['blit']*1000:>8.2f}ms {r['decimate']*1000:>9.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Acquisition par thread contre acquisition par processus séparé
+(AcquisitionProcess) sous une charge de tracé continue (matplotlib Agg,
+historique complet redessiné): débit et gigue des instants de mesure,
+redessins effectués (instrument simulé)
+
+Utilisation: python -m benchmarks.process_isolation
+"""
+import threading
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from acquisition_process import (AcquisitionProcess, configure_keithley, restore_keithley,
+                                 run_paced)
+from keithley2000 import Keithley2000
+from ring_buffer import SampleRingBuffer
+from visa_pool import get_pool
+
+# Durée de chaque essai (s) et période de mesure (s)
+DURATION = 5.0
+INTERVAL = 0.005
+
+
+def _plot_load(ring, stop_event, figure):
+    """Charge de tracé: redessin complet de tout l'historique (pire cas interface)"""
+    ax = figure.add_subplot()
+    line, = ax.plot([], [])
+    draws = 0
+    while not stop_event.is_set():
+        times, values = ring.snapshot()
+        line.set_data(times, values)
+        ax.relim()
+        ax.autoscale_view()
+        figure.canvas.draw()
+        draws += 1
+    return draws
+
+
+def _timing_stats(times, interval):
+    """Débit et gigue des instants de mesure"""
+    if len(times) < 2:
+        return {'samples': len(times), 'rate': 0.0, 'jitter_std': 0.0, 'jitter_max': 0.0}
+    deviation = np.diff(times) - interval
+    return {
+        'samples': len(times),
+        'rate': float((len(times) - 1) / (times[-1] - times[0])),
+        'jitter_std': float(np.std(deviation)),
+        'jitter_max': float(np.max(np.abs(deviation)))
+    }
+
+
+def run(resource='SIM0::16::INSTR', duration=DURATION, interval=INTERVAL, config=None):
+    """
+    Args:
+        resource (str): Adresse de l'instrument (simulateur par défaut)
+        duration (float): Durée de chaque essai (s)
+        interval (float): Période de mesure (s)
+        config (dict): Réglages de mesure (défaut: DCV, NPLC 0.01, mode rapide)
+    Returns:
+        dict: {'thread', 'process'}: débit (mes/s), gigue des intervalles
+              (écart-type et maximum en s), redessins effectués
+    """
+    config = dict(config or {'meas_type': 'DCV', 'nplc': 0.01, 'fast': True})
+    config.update(mode='paced', interval=interval, max_duration=duration)
+    results = {}
+
+    # Thread: acquisition et tracé dans le même processus (même GIL)
+    keithley = Keithley2000(resource)
+    configure_keithley(keithley, config)
+    ring = SampleRingBuffer()
+    stop_event = threading.Event()
+    done = threading.Event()
+
+    def acquire():
+        try:
+            run_paced(keithley, ring, stop_event, config)
+        finally:
+            done.set()
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    thread = threading.Thread(target=acquire, daemon=True)
+    thread.start()
+    draws = _plot_load(ring, done, figure)
+    thread.join()
+    restore_keithley(keithley, config)
+    keithley.disconnect()
+    get_pool().close_all()
+    results['thread'] = dict(_timing_stats(ring.snapshot()[0], interval), draws=draws)
+
+    # Processus: le tracé lit le buffer partagé
+    acquisition = AcquisitionProcess(resource, config, timeout=keithley.timeout)
+    acquisition.start()
+    finished = threading.Event()
+
+    def watch():
+        acquisition.join()
+        finished.set()
+
+    threading.Thread(target=watch, daemon=True).start()
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    try:
+        draws = _plot_load(acquisition.ring, finished, figure)
+        for kind, content in acquisition.poll_messages():
+            if kind == 'error':
+                raise Exception(content)
+        results['process'] = dict(_timing_stats(acquisition.ring.snapshot()[0], interval),
+                                  draws=draws)
+    finally:
+        acquisition.ring.close()
+    return results
+
+
+def main():
+    print(f"{'Mode':>8} {'Mesures':>8} {'Débit':>9} {'Gigue std':>10} "
+          f"{'Gigue max':>10} {'Redessins':>10}")
+    for mode, r in run().items():
+        print(f"{mode:>8} {r['samples']:>8} {r['rate']:>7.1f}/s "
+              f"{r['jitter_std']*1000:>8.3f}ms {r['jitter_max']*1000:>8.3f}ms {r['draws']:>10}")
+
+
+if __name__ == '__main__':
+    main()
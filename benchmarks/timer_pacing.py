@@ -0,0 +1,131 @@
+"""
+Cadencement par le PC (PacedScheduler + READ?) contre cadencement par le
+timer de l'instrument (TRIG:SOUR TIM, buffer_stream): débit et gigue des
+instants de mesure, avec et sans charge CPU concurrente (instrument simulé)
+
+Les instants sont ceux des triggers du simulateur (trigger_times), pas les
+horodatages calculés par le pilote: les écarts aux jonctions entre blocs du
+mode timer sont mesurés, et rapportés à part (glissement de jonction)
+
+Utilisation: python -m benchmarks.timer_pacing
+"""
+import threading
+import time
+
+import numpy as np
+
+from keithley2000 import Keithley2000
+from pacing import PacedScheduler
+from visa_pool import get_pool
+
+# Périodes mesurées (s) et durée de chaque essai (s)
+INTERVALS = (0.01, 0.05)
+DURATION = 3.0
+
+# Taille du bloc de calcul de la charge concurrente (éléments)
+LOAD_SIZE = 200000
+
+
+def pc_paced(keithley, interval, duration):
+    """
+    Mesures cadencées par le PC (grille absolue)
+    Returns:
+        tuple: (instants des triggers, créneaux manqués, instants de début de bloc)
+    """
+    scheduler = PacedScheduler(interval)
+    times = []
+    while True:
+        slot = scheduler.wait_next()
+        if slot[1] - scheduler.start >= duration:
+            break
+        keithley.measure_single()
+        times.extend(keithley.meter.trigger_times())
+    return np.array(times), scheduler.get_stats()['missed'], []
+
+
+def timer_paced(keithley, interval, duration):
+    """
+    Mesures cadencées par le timer instrument, par blocs d'environ 1 s
+    Returns:
+        tuple: (instants des triggers, points perdus, index de début de bloc)
+    """
+    max_points = int(duration / interval)
+    chunk_points = int(min(1024, max(2, round(1.0 / interval))))
+    times = []
+    starts = []
+    for chunk in keithley.buffer_stream(chunk_points, max_points=max_points,
+                                        timer_interval=interval):
+        starts.append(len(times))
+        times.extend(keithley.meter.trigger_times()[:len(chunk['values'])])
+    keithley.set_trigger_source('IMM')
+    return np.array(times), keithley.stream_stats['lost_samples'], starts[1:]
+
+
+def _cpu_load(stop_event):
+    """Charge concurrente (calculs numpy et Python, comme le tracé)"""
+    data = np.random.default_rng(0).normal(size=LOAD_SIZE)
+    while not stop_event.is_set():
+        np.sort(data)
+        sum(float(v) for v in data[:20000])
+
+
+def _stats(times, interval, boundaries):
+    """Débit, gigue des intervalles et glissement aux jonctions de blocs (s)"""
+    deviation = np.diff(times) - interval
+    # Écart à la grille de la jonction (saut de périodes entières exclu)
+    slips = [deviation[i - 1] - max(0, round(deviation[i - 1] / interval)) * interval
+             for i in boundaries]
+    return {
+        'rate': (len(times) - 1) / (times[-1] - times[0]),
+        'jitter_std': float(np.std(deviation)),
+        'jitter_max': float(np.max(np.abs(deviation))),
+        'slip_max': float(np.max(np.abs(slips))) if slips else 0.0
+    }
+
+
+def run(resource='SIM0::16::INSTR', intervals=INTERVALS, duration=DURATION):
+    """
+    Args:
+        resource (str): Adresse de l'instrument (simulateur par défaut)
+        intervals (tuple): Périodes de mesure (s)
+        duration (float): Durée de chaque essai (s)
+    Returns:
+        list: dict par essai: 'mode' ('pc' / 'timer'), 'interval', 'load',
+              'rate' (mes/s), 'jitter_std', 'jitter_max', 'slip_max' (s),
+              'missed'
+    """
+    keithley = Keithley2000(resource)
+    keithley.configure_measurement('DCV')
+    keithley.set_nplc(0.01)
+    results = []
+    try:
+        for interval in intervals:
+            for load in (False, True):
+                for mode, method in (('pc', pc_paced), ('timer', timer_paced)):
+                    stop_event = threading.Event()
+                    if load:
+                        threading.Thread(target=_cpu_load, args=(stop_event,),
+                                         daemon=True).start()
+                    try:
+                        times, missed, boundaries = method(keithley, interval, duration)
+                    finally:
+                        stop_event.set()
+                    results.append(dict(_stats(times, interval, boundaries), mode=mode,
+                                        interval=interval, load=load, missed=missed))
+    finally:
+        keithley.disconnect()
+        get_pool().close_all()
+    return results
+
+
+def main():
+    print(f"{'Mode':>5} {'Période':>8} {'Charge':>6} {'Débit':>9} "
+          f"{'Gigue std':>10} {'Gigue max':>10} {'Jonction':>10} {'Manqués':>8}")
+    for r in run():
+        print(f"{r['mode']:>5} {r['interval']*1000:>6.0f}ms {'oui' if r['load'] else 'non':>6} "
+              f"{r['rate']:>7.1f}/s {r['jitter_std']*1000:>8.3f}ms "
+              f"{r['jitter_max']*1000:>8.3f}ms {r['slip_max']*1000:>8.3f}ms {r['missed']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Export CSV vectorisé des mesures
+Les lignes sont formatées par blocs numpy (une seule opération de
+formatage par bloc au lieu d'une f-string par ligne); le résultat est
+identique octet pour octet à f"{t:.6f},{v:.10g},{unit}\n"
+"""
+import numpy as np
+
+# Nombre de lignes formatées et écrites par bloc
+CHUNK_SIZE = 100000
+
+# En-tête des colonnes
+COLUMNS_HEADER = "Time(s),Value,Unit\n"
+
+
+def format_rows(times, values, unit=''):
+    """
+    Formate un bloc de lignes CSV
+    Args:
+        times (array): Temps en secondes
+        values (array): Valeurs mesurées
+        unit (str): Unité ajoutée en 3e colonne
+    Returns:
+        str: Lignes "temps,valeur,unité" terminées par \\n
+    """
+    count = len(times)
+    if count == 0:
+        return ''
+    # Temps et valeurs entrelacés: t0, v0, t1, v1, ...
+    interleaved = np.empty(2 * count)
+    interleaved[0::2] = times
+    interleaved[1::2] = values
+    row_format = '%.6f,%.10g,' + unit.replace('%', '%%') + '\n'
+    return (row_format * count) % tuple(interleaved.tolist())
+
+
+def write_csv(filename, header, times, values, unit='', chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Écrit un fichier CSV (métadonnées + colonnes) par blocs
+    Args:
+        filename (str): Chemin du fichier
+        header (str): Lignes de métadonnées ("# ...\\n")
+        times (array): Temps en secondes
+        values (array): Valeurs mesurées
+        unit (str): Unité des valeurs
+        chunk_size (int): Nombre de lignes par bloc
+        progress (callable): Appelé avec (lignes écrites, total) après chaque bloc
+    Note: utf-8-sig ajoute un BOM pour compatibilité Excel
+    """
+    times = np.asarray(times, dtype=float)
+    values = np.asarray(values, dtype=float)
+    total = len(times)
+
+    with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+        f.write(header)
+        f.write(COLUMNS_HEADER)
+
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            f.write(format_rows(times[start:stop], values[start:stop], unit))
+            if progress:
+                progress(stop, total)
@@ -0,0 +1,97 @@
+"""
+Cache de détection des instruments (fichier JSON dans le dossier utilisateur)
+Mémorise pour chaque adresse VISA l'identification (*IDN?) et le timeout de
+la dernière connexion réussie: au démarrage, ces adresses sont vérifiées
+en une requête chacune au lieu de rescanner tout le bus
+"""
+from datetime import datetime
+import json
+import os
+
+# Emplacement par défaut du cache
+DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.keithley2000_cache.json')
+
+
+class DiscoveryCache:
+    """Adresses VISA connues: adresse -> IDN, timeout, dernière connexion"""
+
+    def __init__(self, path=DEFAULT_PATH):
+        """
+        Args:
+            path (str): Fichier JSON du cache
+        """
+        self.path = path
+        self.resources = {}
+        self.last_resource = None
+        self.load()
+
+    def load(self):
+        """Charge le cache (un fichier absent ou illisible donne un cache vide)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.resources = dict(data.get('resources', {}))
+            self.last_resource = data.get('last_resource')
+        except (OSError, ValueError, AttributeError):
+            self.resources = {}
+            self.last_resource = None
+
+    def save(self):
+        """Écrit le cache (fichier temporaire puis remplacement atomique)"""
+        data = {'resources': self.resources, 'last_resource': self.last_resource}
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Cache facultatif: une erreur d'écriture ne bloque pas la connexion
+            pass
+
+    def remember(self, resource, idn, timeout):
+        """
+        Enregistre une connexion réussie
+        Args:
+            resource (str): Adresse VISA
+            idn (str): Réponse à *IDN?
+            timeout (int): Timeout utilisé en ms
+        """
+        self.resources[resource] = {
+            'idn': idn,
+            'timeout': timeout,
+            'last_seen': datetime.now().isoformat()
+        }
+        self.last_resource = resource
+        self.save()
+
+    def forget(self, resource):
+        """
+        Retire une adresse du cache
+        Args:
+            resource (str): Adresse VISA
+        """
+        if self.resources.pop(resource, None) is not None:
+            if self.last_resource == resource:
+                self.last_resource = None
+            self.save()
+
+    def addresses(self):
+        """
+        Adresses connues, la dernière connectée en premier
+        Returns:
+            list: Adresses VISA triées par dernière connexion décroissante
+        """
+        ordered = sorted(self.resources,
+                         key=lambda r: self.resources[r].get('last_seen', ''),
+                         reverse=True)
+        ordered.sort(key=lambda r: r != self.last_resource)
+        return ordered
+
+    def get(self, resource):
+        """
+        Args:
+            resource (str): Adresse VISA
+        Returns:
+            dict: {'idn', 'timeout', 'last_seen'} ou None
+        """
+        return self.resources.get(resource)
@@ -9,9 +9,10 @@ import os
 class AdvancedTab:
     """Onglet de contrôle avancé"""
     
-    def __init__(self, parent, keithley, update_status_callback):
+    def __init__(self, parent, keithley, update_status_callback, executor):
         self.keithley = keithley
         self.update_status = update_status_callback
+        self.executor = executor  # Commandes VISA hors du thread Tk
         
         self.frame = ttk.Frame(parent)
         self.create_widgets()
@@ -227,19 +228,20 @@ class AdvancedTab:
         command = self.scpi_entry.get().strip()
         if not command:
             return
-        
-        try:
-            self.keithley.write(command)
+
+        def done(_):
             self.add_response(f">>> {command}")
             self.add_response("✓ Commande envoyée\n")
             
             # Ajout à l'historique
             self.add_to_history(command)
             self.scpi_entry.delete(0, 'end')
-            
-        except Exception as e:
+
+        def failed(e):
             self.add_response(f"✗ Erreur: {e}\n")
             messagebox.showerror("Erreur", f"Erreur d'envoi:\n{e}")
+
+        self.executor.submit(self.keithley.write_raw, command, on_done=done, on_error=failed)
     
     def query_scpi_command(self):
         """Envoie une commande SCPI et lit la réponse (query)"""
@@ -250,19 +252,20 @@ class AdvancedTab:
         command = self.scpi_entry.get().strip()
         if not command:
             return
-        
-        try:
-            response = self.keithley.query(command)
+
+        def done(response):
             self.add_response(f">>> {command}")
             self.add_response(f"<<< {response}\n")
             
             # Ajout à l'historique
             self.add_to_history(command)
             self.scpi_entry.delete(0, 'end')
-            
-        except Exception as e:
+
+        def failed(e):
             self.add_response(f"✗ Erreur: {e}\n")
             messagebox.showerror("Erreur", f"Erreur de query:\n{e}")
+
+        self.executor.submit(self.keithley.query_raw, command, on_done=done, on_error=failed)
     
     def quick_command(self, command):
         """Exécute une commande rapide"""
@@ -580,6 +583,8 @@ READ?
         return doc_path
     
     # === Fonctions des contrôles avancés ===
+    # Les commandes partent sur le thread VISA (executor); les messages
+    # s'affichent à leur retour sur le thread Tk
     
     def apply_trigger(self):
         """Applique la configuration du trigger"""
@@ -587,13 +592,15 @@ READ?
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
         
-        try:
-            source = self.trigger_var.get()
-            self.keithley.set_trigger_source(source)
+        source = self.trigger_var.get()
+
+        def done(_):
             self.update_status(f"Trigger: {source}", "green")
             messagebox.showinfo("Succès", f"Trigger configuré: {source}")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur de configuration:\n{e}")
+
+        self.executor.submit(self.keithley.set_trigger_source, source, on_done=done,
+                             on_error=lambda e: messagebox.showerror(
+                                 "Erreur", f"Erreur de configuration:\n{e}"))
     
     def toggle_display(self):
         """Active/désactive l'affichage"""
@@ -601,32 +608,39 @@ READ?
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
         
-        try:
-            state = self.display_var.get()
-            self.keithley.set_display(state)
+        state = self.display_var.get()
+
+        def done(_):
             status = "activé" if state else "désactivé"
             self.update_status(f"Affichage {status}", "green")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur:\n{e}")
+
+        self.executor.submit(self.keithley.set_display, state, on_done=done,
+                             on_error=lambda e: messagebox.showerror("Erreur", f"Erreur:\n{e}"))
     
     def acquire_null(self):
         """Acquiert la valeur NULL actuelle"""
         if not self.keithley.connected:
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
-        
-        try:
-            # Lecture de la valeur actuelle
-            value = self.keithley.measure_single()
-            
-            # Configuration du NULL
-            self.keithley.write(f'CALC:NULL:OFFS {value}')
-            self.keithley.write('CALC:NULL:STAT ON')
-            
+
+        def acquire():
+            # Entre deux blocs d'une acquisition en cours (jamais au milieu)
+            with self.keithley.capture():
+                # Lecture de la valeur actuelle
+                value = self.keithley.measure_single()
+
+                # Configuration du NULL
+                self.keithley.write(f'CALC:NULL:OFFS {value}')
+                self.keithley.write('CALC:NULL:STAT ON')
+            return value
+
+        def done(value):
             messagebox.showinfo("Succès", f"NULL acquis: {value:.6g}\nLes mesures suivantes seront relatives à cette valeur")
             self.null_var.set(True)
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur d'acquisition NULL:\n{e}")
+
+        self.executor.submit(acquire, on_done=done,
+                             on_error=lambda e: messagebox.showerror(
+                                 "Erreur", f"Erreur d'acquisition NULL:\n{e}"))
     
     def configure_buffer(self):
         """Configure le buffer d'acquisition"""
@@ -634,13 +648,17 @@ READ?
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
         
-        try:
-            size = self.buffer_size_var.get()
+        size = self.buffer_size_var.get()
+
+        def configure():
             self.keithley.write('TRAC:CLE')
-            self.keithley.write(f'TRAC:POIN {size}')
-            messagebox.showinfo("Succès", f"Buffer configuré: {size} points")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur de configuration:\n{e}")
+            self.keithley.write_raw(f'TRAC:POIN {size}')
+
+        self.executor.submit(configure,
+                             on_done=lambda _: messagebox.showinfo(
+                                 "Succès", f"Buffer configuré: {size} points"),
+                             on_error=lambda e: messagebox.showerror(
+                                 "Erreur", f"Erreur de configuration:\n{e}"))
     
     def reset_instrument(self):
         """Reset l'instrument"""
@@ -651,12 +669,13 @@ READ?
         response = messagebox.askyesno("Confirmation", 
                                        "Réinitialiser l'instrument aux paramètres par défaut ?")
         if response:
-            try:
-                self.keithley.reset()
+            def done(_):
                 messagebox.showinfo("Succès", "Instrument réinitialisé")
                 self.update_status("Instrument réinitialisé", "green")
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Erreur de reset:\n{e}")
+
+            self.executor.submit(self.keithley.reset, on_done=done,
+                                 on_error=lambda e: messagebox.showerror(
+                                     "Erreur", f"Erreur de reset:\n{e}"))
     
     def beep_instrument(self):
         """Émet un bip"""
@@ -664,10 +683,8 @@ READ?
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
         
-        try:
-            self.keithley.beep()
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur:\n{e}")
+        self.executor.submit(self.keithley.beep,
+                             on_error=lambda e: messagebox.showerror("Erreur", f"Erreur:\n{e}"))
     
     def clear_errors(self):
         """Efface les erreurs"""
@@ -675,19 +692,17 @@ READ?
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
         
-        try:
-            self.keithley.clear_errors()
-            messagebox.showinfo("Succès", "Erreurs effacées")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur:\n{e}")
+        self.executor.submit(self.keithley.clear_errors,
+                             on_done=lambda _: messagebox.showinfo("Succès", "Erreurs effacées"),
+                             on_error=lambda e: messagebox.showerror("Erreur", f"Erreur:\n{e}"))
     
     def check_errors(self):
         """Vérifie les erreurs"""
         if not self.keithley.connected:
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
-        
-        try:
+
+        def read_errors():
             errors = []
             # Lire toutes les erreurs
             for _ in range(20):  # Max 20 erreurs
@@ -695,11 +710,15 @@ READ?
                 if "No error" in error or error.startswith("0,"):
                     break
                 errors.append(error)
-            
+            return errors
+
+        def done(errors):
             if errors:
                 error_msg = "\n".join(errors)
                 messagebox.showwarning("Erreurs détectées", f"Erreurs:\n{error_msg}")
             else:
                 messagebox.showinfo("Succès", "Aucune erreur détectée")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur de vérification:\n{e}")
\ No newline at end of file
+
+        self.executor.submit(read_errors, on_done=done,
+                             on_error=lambda e: messagebox.showerror(
+                                 "Erreur", f"Erreur de vérification:\n{e}"))
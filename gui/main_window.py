@@ -11,7 +11,9 @@ import os
 from .settings_tab import SettingsTab
 from .quick_measure_tab import QuickMeasureTab
 from .advanced_tab import AdvancedTab
+from .ui_dispatcher import CommandExecutor, UIDispatcher
 from keithley2000 import Keithley2000
+from visa_pool import get_pool
 
 class MainWindow:
     """Fenêtre principale de l'application"""
@@ -19,6 +21,12 @@ class MainWindow:
     def __init__(self, root):
         self.root = root
         self.keithley = Keithley2000()
+
+        # Commandes VISA de l'interface hors du thread Tk, résultats ramenés
+        # par un cycle after unique
+        self.dispatcher = UIDispatcher(root)
+        self.dispatcher.start()
+        self.executor = CommandExecutor(self.dispatcher)
         
         # Style
         self.setup_style()
@@ -31,15 +39,18 @@ class MainWindow:
         self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
         
         # Onglet 1: Settings
-        self.settings_tab = SettingsTab(self.notebook, self.keithley, self.update_status)
+        self.settings_tab = SettingsTab(self.notebook, self.keithley, self.update_status,
+                                        self.executor)
         self.notebook.add(self.settings_tab.frame, text='⚙️ Réglages')
         
         # Onglet 2: Quick Measure
-        self.quick_measure_tab = QuickMeasureTab(self.notebook, self.keithley, self.update_status)
+        self.quick_measure_tab = QuickMeasureTab(self.notebook, self.keithley, self.update_status,
+                                                 self.executor)
         self.notebook.add(self.quick_measure_tab.frame, text='📊 Mesures Rapides')
         
         # Onglet 3: Advanced Control
-        self.advanced_tab = AdvancedTab(self.notebook, self.keithley, self.update_status)
+        self.advanced_tab = AdvancedTab(self.notebook, self.keithley, self.update_status,
+                                        self.executor)
         self.notebook.add(self.advanced_tab.frame, text='🔧 Réglages Avancés')
         
         # Mise à jour initiale du statut
@@ -123,11 +134,15 @@ class MainWindow:
             # Arrêter la mesure
             self.quick_measure_tab.stop_measurement()
         
-        # Déconnecter l'instrument
+        # Déconnecter l'instrument après les commandes en file (restauration
+        # des réglages de fin de mesure)
         if self.keithley.connected:
-            try:
-                self.keithley.disconnect()
-            except:
-                pass
+            self.executor.submit(self.keithley.disconnect)
+        self.executor.shutdown(wait=True)
+        self.dispatcher.stop()
+        self.quick_measure_tab.shutdown()
+
+        # Fermer les sessions VISA gardées ouvertes pour la reconnexion
+        get_pool().close_all()
         
         return True
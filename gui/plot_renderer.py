@@ -0,0 +1,96 @@
+"""
+Rendu rapide du graphique temps réel: décimation min/max + blitting
+Le coût d'une image dépend de la largeur de l'axe en pixels et non du
+nombre de points; seule la courbe (et le curseur) est redessinée tant que
+les limites des axes ne changent pas
+"""
+import numpy as np
+
+
+def decimate_minmax(x, y, n_bins):
+    """
+    Réduit une courbe à 2 points (min et max) par intervalle
+    Args:
+        x (array): Abscisses (croissantes)
+        y (array): Ordonnées
+        n_bins (int): Nombre d'intervalles (largeur de l'axe en pixels)
+    Returns:
+        tuple: (x, y) décimés; les extrema de chaque intervalle sont
+               conservés dans l'ordre chronologique
+    """
+    n = len(x)
+    n_bins = max(1, int(n_bins))
+    if n <= 2 * n_bins:
+        return x, y
+
+    per_bin = n // n_bins
+    used = per_bin * n_bins
+    blocks = y[:used].reshape(n_bins, per_bin)
+    i_min = blocks.argmin(axis=1)
+    i_max = blocks.argmax(axis=1)
+
+    base = np.arange(n_bins) * per_bin
+    idx = np.empty(2 * n_bins, dtype=np.intp)
+    idx[0::2] = base + np.minimum(i_min, i_max)
+    idx[1::2] = base + np.maximum(i_min, i_max)
+
+    # Reste (< per_bin points): un dernier intervalle
+    if used < n:
+        tail = y[used:]
+        t_min = used + int(tail.argmin())
+        t_max = used + int(tail.argmax())
+        idx = np.concatenate([idx, [min(t_min, t_max), max(t_min, t_max)]])
+
+    return x[idx], y[idx]
+
+
+class BlitRenderer:
+    """Redessine uniquement les artistes animés d'un axe matplotlib"""
+
+    def __init__(self, canvas, ax, artists):
+        """
+        Args:
+            canvas: Canvas matplotlib (FigureCanvasTkAgg)
+            ax: Axe contenant les artistes
+            artists (list): Artistes redessinés à chaque image (courbe, curseur)
+        """
+        self.canvas = canvas
+        self.ax = ax
+        self.artists = list(artists)
+        self.background = None
+
+        for artist in self.artists:
+            artist.set_animated(True)
+
+        # Chaque redessin complet (zoom, resize, limites) renouvelle le fond
+        self.cid = canvas.mpl_connect('draw_event', self.on_draw)
+
+    def on_draw(self, event):
+        """Capture le fond (axes, grille, textes) puis dessine les artistes"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def pixel_width(self):
+        """
+        Returns:
+            int: Largeur de l'axe en pixels
+        """
+        return max(1, int(self.ax.bbox.width))
+
+    def refresh(self, full=False):
+        """
+        Met à jour l'affichage
+        Args:
+            full (bool): True si les limites ont changé (redessin complet)
+        """
+        if full or self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
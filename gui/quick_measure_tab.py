@@ -6,7 +6,6 @@ from tkinter import ttk, messagebox, filedialog
 import threading
 import time
 from datetime import datetime
-from collections import deque
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
@@ -15,22 +14,71 @@ import matplotlib.image as mpimg
 import numpy as np
 import os
 
+from .plot_renderer import BlitRenderer, decimate_minmax
+
+from acquisition_process import AcquisitionProcess
+from csv_export import write_csv
+from pacing import PacedScheduler
+from ring_buffer import SampleRingBuffer, SharedSampleRingBuffer
+from running_stats import SeriesStats
+from visa_pool import PRIORITY_HIGH, io_priority
+
 class QuickMeasureTab:
     """Onglet de mesure rapide avec graphique"""
+
+    # Mode timer: période minimale et durée visée d'un bloc buffer (s)
+    TIMER_INTERVAL_MIN = 0.01
+    TIMER_CHUNK_DURATION = 1.0
+
+    # Mode lots: fraction de l'intervalle occupée par un lot de lectures
+    BATCH_FILL = 0.8
+
+    # Nombre de points des statistiques glissantes
+    STATS_WINDOW = 1000
+
+    # Autoscale: marge d'avance en X (fraction de la plage affichée)
+    AUTOSCALE_HEADROOM = 0.2
+
+    # Mode processus: période de suivi du buffer partagé (s)
+    PROCESS_POLL = 0.1
     
-    def __init__(self, parent, keithley, update_status_callback):
+    def __init__(self, parent, keithley, update_status_callback, executor):
         self.keithley = keithley
         self.update_status = update_status_callback
+        self.executor = executor  # Commandes VISA hors du thread Tk
+        self.dispatcher = executor.dispatcher  # Messages des threads vers le thread Tk
         
         self.frame = ttk.Frame(parent)
         
         # Variables de mesure
         self.measuring = False
         self.paused = False
-        self.data_time = deque(maxlen=10000)
-        self.data_values = deque(maxlen=10000)
+        self.samples = SampleRingBuffer()
+        self.stats = SeriesStats(window=self.STATS_WINDOW)
         self.start_time = None
         self.measure_thread = None
+        self.scheduler = None
+        self.batch_points = None
+        self.export_thread = None
+        self.stop_error = None  # Erreur ayant arrêté l'acquisition
+
+        # Arrêt / pause des threads d'acquisition (attentes interruptibles)
+        self.stop_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.stop_requested = None  # Instant de la demande d'arrêt
+        self.stop_latency = None    # Demande d'arrêt -> fin du thread (s)
+
+        # Effacement demandé pendant la mesure: statistiques remises à zéro
+        # par le thread qui les alimente (jamais écrites depuis le thread Tk)
+        self.clear_requested = threading.Event()
+
+        # Mode processus: processus d'acquisition et ses derniers compteurs
+        self.acq_process = None
+        self.process_stats = None
+
+        # Streaming buffer: compteurs et temps morts entre blocs
+        self.stream_stats = None
+        self.stream_gaps = []
         
         # Configuration actuelle
         self.current_config = {}
@@ -249,6 +297,12 @@ class QuickMeasureTab:
                                          textvariable=self.buffer_points_var, width=8)
         buffer_points_spin.pack(side='left', padx=5)
 
+        # Streaming continu (créé mais pas affiché initialement)
+        self.stream_mode_var = tk.BooleanVar(value=False)
+        self.stream_cb = ttk.Checkbutton(speed_frame, text="   Streaming continu (> 1024 points)",
+                                         variable=self.stream_mode_var,
+                                         command=self.toggle_stream_mode)
+
         self.buffer_separator = ttk.Separator(speed_frame, orient='horizontal')
         self.buffer_separator.pack(fill='x', pady=5)
 
@@ -260,6 +314,14 @@ class QuickMeasureTab:
                                    font=('Arial', 8), foreground='gray')
         self.fast_help.pack(anchor='w')
 
+        self.batch_mode_var = tk.BooleanVar(value=False)
+        self.batch_cb = ttk.Checkbutton(speed_frame, text="Mesure par lots (READ? multi-lectures)",
+                                        variable=self.batch_mode_var)
+        self.batch_cb.pack(anchor='w', pady=2)
+        self.batch_help = ttk.Label(speed_frame, text="   N lectures par transaction, N ajusté à l'intervalle",
+                                    font=('Arial', 8), foreground='gray')
+        self.batch_help.pack(anchor='w')
+
         self.display_off_var = tk.BooleanVar(value=False)
         display_cb = ttk.Checkbutton(speed_frame, text="Désactiver affichage instrument",
                                      variable=self.display_off_var)
@@ -300,6 +362,15 @@ class QuickMeasureTab:
                                        font=('Arial', 8), foreground='gray')
         self.interval_help.pack(anchor='w', padx=5)
 
+        # Cadencement par le timer de l'instrument (masqué en mode buffer)
+        self.timer_mode_var = tk.BooleanVar(value=False)
+        self.timer_cb = ttk.Checkbutton(self.acq_frame, text="Cadencement instrument (TRIG:TIM)",
+                                        variable=self.timer_mode_var)
+        self.timer_cb.pack(anchor='w', pady=2)
+        self.timer_help = ttk.Label(self.acq_frame, text="   Intervalle >= 0.01s, le Keithley se cadence seul",
+                                    font=('Arial', 8), foreground='gray')
+        self.timer_help.pack(anchor='w')
+
         # Message mode buffer (affiché uniquement en mode buffer)
         self.buffer_info_label = ttk.Label(self.acq_frame,
                                            text="Mode Buffer: acquisition au plus vite (pas d'intervalle)",
@@ -308,6 +379,7 @@ class QuickMeasureTab:
         # Durée maximale
         duration_frame = ttk.Frame(self.acq_frame)
         duration_frame.pack(fill='x', pady=2)
+        self.duration_frame = duration_frame
 
         self.duration_mode_var = tk.StringVar(value='infinite')
 
@@ -328,6 +400,26 @@ class QuickMeasureTab:
         dur_spin.pack(side='left', padx=5)
         ttk.Label(dur_sub_frame, text="secondes").pack(side='left')
 
+        # Taille de l'historique (buffer circulaire)
+        history_frame = ttk.Frame(self.acq_frame)
+        history_frame.pack(fill='x', pady=2)
+
+        ttk.Label(history_frame, text="Historique (points):").pack(side='left')
+        self.history_var = tk.IntVar(value=SampleRingBuffer.DEFAULT_CAPACITY)
+        history_spin = ttk.Spinbox(history_frame, from_=1000, to=10000000, increment=10000,
+                                   textvariable=self.history_var, width=10)
+        history_spin.pack(side='left', padx=5)
+
+        # Acquisition isolée dans un processus (buffer en mémoire partagée)
+        self.process_mode_var = tk.BooleanVar(value=False)
+        process_cb = ttk.Checkbutton(self.acq_frame, text="Processus d'acquisition séparé",
+                                     variable=self.process_mode_var)
+        process_cb.pack(anchor='w', pady=2)
+        process_help = ttk.Label(self.acq_frame,
+                                 text="   Graphique sans effet sur la cadence (pas de pause)",
+                                 font=('Arial', 8), foreground='gray')
+        process_help.pack(anchor='w')
+
         # Statistiques
         stats_frame = ttk.LabelFrame(parent, text="Statistiques", padding=10)
         stats_frame.pack(fill='x', pady=5)
@@ -430,6 +522,13 @@ class QuickMeasureTab:
                                                    fontsize=9, visible=False)
 
         self.canvas = FigureCanvasTkAgg(self.fig, parent)
+
+        # Rendu par blitting de la courbe et du curseur
+        self.renderer = BlitRenderer(self.canvas, self.ax,
+                                     [self.line, self.hline, self.vline,
+                                      self.cursor_point, self.cursor_annotation])
+        self.auto_limits = None
+
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
 
@@ -489,24 +588,43 @@ class QuickMeasureTab:
         if self.buffer_mode_var.get():
             # Mode buffer activé - afficher nb points après le label d'aide
             self.buffer_points_frame.pack(after=self.buffer_help, fill='x', pady=2)
+            self.stream_cb.pack(after=self.buffer_points_frame, anchor='w', pady=2)
             self.interval_frame.pack_forget()
             self.interval_help.pack_forget()
+            self.timer_cb.pack_forget()
+            self.timer_help.pack_forget()
             self.buffer_info_label.pack(anchor='w', padx=5, pady=2)
             # Désactiver mode Fast (inutile en buffer)
             self.fast_mode_var.set(False)
             self.fast_cb.config(state='disabled')
+            self.batch_mode_var.set(False)
+            self.batch_cb.config(state='disabled')
             # Désactiver durée infinie (buffer = nombre de points fixe)
-            self.duration_mode_var.set('limited')
-            self.inf_rb.config(state='disabled')
+            self.toggle_stream_mode()
         else:
             # Mode buffer désactivé
             self.buffer_points_frame.pack_forget()
+            self.stream_cb.pack_forget()
             self.buffer_info_label.pack_forget()
-            self.interval_frame.pack(fill='x', pady=2)
-            self.interval_help.pack(anchor='w', padx=5)
+            self.interval_frame.pack(fill='x', pady=2, before=self.duration_frame)
+            self.interval_help.pack(anchor='w', padx=5, before=self.duration_frame)
+            self.timer_cb.pack(anchor='w', pady=2, before=self.duration_frame)
+            self.timer_help.pack(anchor='w', before=self.duration_frame)
             self.fast_cb.config(state='normal')
+            self.batch_cb.config(state='normal')
             self.inf_rb.config(state='normal')
 
+    def toggle_stream_mode(self):
+        """Autorise la durée infinie uniquement en streaming continu"""
+        if not self.buffer_mode_var.get():
+            return
+        if self.stream_mode_var.get():
+            self.inf_rb.config(state='normal')
+        else:
+            # Buffer simple = nombre de points fixe
+            self.duration_mode_var.set('limited')
+            self.inf_rb.config(state='disabled')
+
     def start_measurement(self):
         """Démarre l'acquisition"""
         if not self.keithley.connected:
@@ -516,69 +634,160 @@ class QuickMeasureTab:
         # Sauvegarde de la configuration
         self.save_current_config()
 
-        # Configuration de l'instrument
-        try:
-            meas_type = self.meas_type_var.get()
-            range_display = self.range_var.get()
-            range_val = self.convert_range_to_value(range_display)
-            nplc = self.nplc_var.get()
-
-            self.keithley.configure_measurement(meas_type, range_val)
-            self.keithley.set_nplc(nplc, meas_type)
-
-            # Filtre
-            if self.filter_var.get():
-                self.keithley.set_filter(True, self.filter_count_var.get())
-            else:
-                self.keithley.set_filter(False)
-
-            # Affichage instrument
-            if self.display_off_var.get():
-                self.keithley.set_display(False)
-
-            # Mode buffer: désactiver autozero pour plus de vitesse
-            if self.buffer_mode_var.get():
-                self.keithley.set_autozero(False)
+        # Réglages lus sur le thread Tk, envoyés par le thread VISA
+        meas_type = self.meas_type_var.get()
+        range_val = self.convert_range_to_value(self.range_var.get())
+        nplc = self.nplc_var.get()
+        filter_on = self.filter_var.get()
+        filter_count = self.filter_count_var.get()
+        display_off = self.display_off_var.get()
+        buffer_mode = self.buffer_mode_var.get()
+
+        # Mode processus: l'instrument est configuré par le processus d'acquisition
+        if self.process_mode_var.get():
+            self.begin_acquisition({
+                'meas_type': meas_type, 'range': range_val, 'nplc': nplc,
+                'filter': filter_on, 'filter_count': filter_count,
+                'display_off': display_off, 'autozero_off': buffer_mode
+            })
+            return
 
-        except Exception as e:
+        def configure():
+            # Réglages modifiés envoyés en une ligne, synchronisée par *OPC?
+            with self.keithley.batch():
+                self.keithley.configure_measurement(meas_type, range_val)
+                self.keithley.set_nplc(nplc, meas_type)
+
+                # Filtre
+                if filter_on:
+                    self.keithley.set_filter(True, filter_count)
+                else:
+                    self.keithley.set_filter(False)
+
+                # Affichage instrument
+                if display_off:
+                    self.keithley.set_display(False)
+
+                # Mode buffer: désactiver autozero pour plus de vitesse
+                if buffer_mode:
+                    self.keithley.set_autozero(False)
+
+        def failed(e):
+            self.start_btn.config(state='normal')
+            self.update_status("Erreur de configuration", "red")
             messagebox.showerror("Erreur", f"Erreur de configuration:\n{e}")
-            return
 
+        # Démarrage au retour de la configuration
+        self.start_btn.config(state='disabled')
+        self.update_status("Configuration de l'instrument...", "orange")
+        self.executor.submit(configure, on_done=lambda _: self.begin_acquisition(),
+                             on_error=failed)
+
+    def begin_acquisition(self, settings=None):
+        """
+        Lance l'acquisition une fois l'instrument configuré (thread Tk)
+        Args:
+            settings (dict): Réglages de mesure à appliquer par un processus
+                             d'acquisition séparé (None = thread d'acquisition)
+        """
         # Clear des données si nouvelles mesures
-        if len(self.data_time) > 0 and messagebox.askyesno("Nouveau démarrage",
+        if len(self.samples) > 0 and messagebox.askyesno("Nouveau démarrage",
                                                            "Effacer les données précédentes ?"):
             self.clear_data()
 
+        stream_mode = self.buffer_mode_var.get() and self.stream_mode_var.get()
+        timer_mode = not self.buffer_mode_var.get() and self.timer_mode_var.get()
+
+        # Historique: buffer local, ou buffer partagé écrit par le processus
+        # (données conservées dans les deux cas)
+        capacity = max(1000, self.history_var.get())
+        shared = isinstance(self.samples, SharedSampleRingBuffer)
+        self.acq_process = None
+        if settings is not None:
+            config = dict(settings, **self.process_acquisition_config(stream_mode, timer_mode))
+            try:
+                self.acq_process = AcquisitionProcess(self.keithley.session.resource_name, config,
+                                                      capacity, history=self.samples.snapshot(),
+                                                      timeout=self.keithley.timeout)
+            except Exception as e:
+                self.start_btn.config(state='normal')
+                self.update_status("Erreur mémoire partagée", "red")
+                messagebox.showerror("Erreur", f"Processus d'acquisition impossible:\n{e}")
+                return
+            self.replace_samples(self.acq_process.ring)
+        elif shared or capacity != self.samples.capacity:
+            samples = SampleRingBuffer(capacity)
+            samples.extend(*self.samples.snapshot())
+            self.replace_samples(samples)
+
+        # Compteurs propres à chaque acquisition
+        self.apply_clear_request()  # Effacement resté en attente (aucun thread actif)
+        self.scheduler = None
+        self.process_stats = None
+        self.stream_stats = None
+        self.stop_error = None
+        self.stop_requested = None
+        self.stop_latency = None
+        self.stop_event.clear()
+        self.resume_event.set()
+
         # Démarrage
         self.measuring = True
         self.paused = False
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
 
         # Mise à jour de l'interface
         self.start_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
 
-        if self.buffer_mode_var.get():
+        if self.acq_process is not None:
+            # Processus séparé: ce thread suit le buffer partagé. L'instrument
+            # est au processus jusqu'à l'arrêt: commandes de l'interface refusées
+            self.pause_btn.config(state='disabled')
+            self.update_status("Mesure en cours (processus séparé)...", "green")
+            loop = self.process_follow_loop
+            self.executor.suspend("Acquisition en processus séparé: instrument "
+                                  "indisponible jusqu'à l'arrêt de la mesure")
+        elif timer_mode:
+            # Mode Timer: l'instrument se cadence, le PC vide le buffer
+            self.pause_btn.config(state='disabled')
+            self.update_status("Mesure cadencée par l'instrument...", "green")
+            loop = self.timer_measurement_loop
+        elif stream_mode:
+            # Mode Buffer en streaming continu
+            self.pause_btn.config(state='disabled')
+            self.update_status("Streaming buffer en cours...", "green")
+            loop = self.buffer_stream_loop
+        elif self.buffer_mode_var.get():
             # Mode Buffer
             self.pause_btn.config(state='disabled')  # Pas de pause en mode buffer
             self.update_status("Acquisition buffer en cours...", "green")
-            self.measure_thread = threading.Thread(target=self.buffer_measurement_loop, daemon=True)
+            loop = self.buffer_measurement_loop
         else:
             # Mode Normal
             self.pause_btn.config(state='normal')
             self.update_status("Mesure en cours...", "green")
-            self.measure_thread = threading.Thread(target=self.measurement_loop, daemon=True)
+            loop = self.measurement_loop
 
+        # Transactions de l'acquisition prioritaires sur celles de l'interface
+        self.measure_thread = threading.Thread(target=self.acquisition_thread, args=(loop,),
+                                               daemon=True)
         self.measure_thread.start()
 
-        # Démarrage de l'animation (seulement en mode normal)
-        if not self.buffer_mode_var.get():
+        # Démarrage de l'animation (mode normal et streaming)
+        if not self.buffer_mode_var.get() or stream_mode:
             self.animate_graph()
     
     def pause_measurement(self):
         """Met en pause l'acquisition"""
         self.paused = not self.paused
         
+        # Le thread attend resume_event (réveillé aussitôt par Resume ou Stop)
+        if self.paused:
+            self.resume_event.clear()
+        else:
+            self.resume_event.set()
+
         if self.paused:
             self.pause_btn.config(text="▶ Resume")
             self.update_status("Mesure en pause", "orange")
@@ -588,33 +797,152 @@ class QuickMeasureTab:
     
     def stop_measurement(self):
         """Arrête l'acquisition"""
+        if not self.measuring and self.stop_btn.cget('state') == 'disabled':
+            return
+        # Réveil immédiat du thread (attente de créneau, pause, buffer)
+        self.stop_requested = time.perf_counter()
+        self.stop_event.set()
+        self.resume_event.set()
+        process = self.acq_process
+        if process is not None:
+            process.request_stop()
         self.measuring = False
         self.paused = False
+        self.stop_btn.config(state='disabled')
+        self.pause_btn.config(state='disabled')
+
+        thread = self.measure_thread
+        display_off = self.display_off_var.get()
+        buffer_mode = self.buffer_mode_var.get()
+        timer_mode = self.timer_mode_var.get()
+
+        def restore():
+            # Fin du thread: au plus la transaction en cours (thread VISA,
+            # jamais le thread Tk); le timeout VISA borne le pire cas
+            if thread and thread.is_alive():
+                thread.join(timeout=self.keithley.timeout / 1000 + 1.0)
+
+            # Processus séparé: il a restauré l'instrument lui-même
+            if process is not None:
+                process.stop(timeout=1.0)
+                if self.keithley.connected:
+                    self.keithley.invalidate_state()
+                return
 
-        # Attendre la fin du thread
-        if self.measure_thread and self.measure_thread.is_alive():
-            self.measure_thread.join(timeout=2.0)
-
-        # Restaurer les paramètres de l'instrument
-        if self.keithley.connected:
-            try:
-                if self.display_off_var.get():
-                    self.keithley.set_display(True)
-                if self.buffer_mode_var.get():
-                    self.keithley.set_autozero(True)  # Restaurer autozero
-            except:
-                pass
+            # Acquisition buffer éventuellement encore en cours sur l'instrument
+            if self.keithley.connected and (buffer_mode or timer_mode):
+                try:
+                    self.keithley.abort(clear=True)
+                except Exception:
+                    pass
 
+            # Restaurer les paramètres de l'instrument
+            if self.keithley.connected:
+                try:
+                    if display_off:
+                        self.keithley.set_display(True)
+                    if buffer_mode:
+                        self.keithley.set_autozero(True)  # Restaurer autozero
+                    elif timer_mode:
+                        self.keithley.set_trigger_source('IMM')  # Restaurer trigger
+                except:
+                    pass
+
+        self.update_status("Arrêt en cours...", "orange")
+        # Commandes de l'interface de nouveau acceptées: en file derrière
+        # restore, donc après la fin du processus
+        self.executor.resume()
+        self.executor.submit(restore, on_done=lambda _: self.measurement_stopped(),
+                             on_error=lambda e: self.measurement_stopped())
+
+    def measurement_stopped(self):
+        """Fin de l'arrêt: interface et affichage final (thread Tk)"""
         # Mise à jour de l'interface
         self.start_btn.config(state='normal')
         self.pause_btn.config(state='disabled', text="⏸ Pause")
         self.stop_btn.config(state='disabled')
-        self.update_status("Mesure arrêtée", "orange")
+        if self.stop_error:
+            self.update_status(self.stop_error, "red")
+        elif self.stop_latency is not None:
+            self.update_status(f"Mesure arrêtée (arrêt en {self.stop_latency*1000:.0f} ms)",
+                               "orange")
+        else:
+            self.update_status("Mesure arrêtée", "orange")
 
         # Mise à jour finale du graphique et des stats
         self.update_graph()
         self.update_stats()
+
+    def shutdown(self):
+        """Fermeture de l'application: libère le buffer partagé du mode processus"""
+        if self.acq_process is not None:
+            self.acq_process.stop(timeout=1.0)
+        if isinstance(self.samples, SharedSampleRingBuffer):
+            self.samples.close()
     
+    # === Messages des threads vers le thread Tk (file fusionnée) ===
+
+    def post_status(self, message, color='black'):
+        """Statut depuis un thread: seul le dernier en file est affiché"""
+        self.dispatcher.post_latest('status', self.update_status, message, color)
+
+    def post_data(self):
+        """Nouvelles données: un seul rafraîchissement graphique + stats par cycle"""
+        self.dispatcher.post_latest('graph', self.update_graph)
+        self.dispatcher.post_latest('stats', self.update_stats)
+
+    def post_stop(self):
+        """Demande d'arrêt depuis un thread (une seule en file)"""
+        self.dispatcher.post_latest('stop', self.stop_measurement)
+
+    def post_error(self, message):
+        """Erreur d'acquisition: arrêt, l'erreur reste affichée à la fin de l'arrêt"""
+        self.stop_error = message
+        self.post_status(message, "red")
+        self.post_stop()
+
+    def acquisition_thread(self, loop):
+        """Exécute une boucle d'acquisition avec la priorité d'accès haute"""
+        try:
+            with io_priority(PRIORITY_HIGH):
+                loop()
+        finally:
+            # Latence d'arrêt: demande (bouton Stop) -> fin du thread
+            if self.stop_requested is not None:
+                self.stop_latency = time.perf_counter() - self.stop_requested
+
+    def process_acquisition_config(self, stream_mode, timer_mode):
+        """
+        Paramètres d'acquisition du processus séparé (mêmes modes que les
+        boucles des threads)
+        Returns:
+            dict: Configuration d'acquisition (voir acquisition_process)
+        """
+        limited = self.duration_mode_var.get() == 'limited'
+        max_duration = self.duration_var.get() if limited else None
+
+        if timer_mode:
+            interval = max(self.interval_var.get(), self.TIMER_INTERVAL_MIN)
+            chunk_points = int(min(1024, max(2, round(self.TIMER_CHUNK_DURATION / interval))))
+            return {'mode': 'stream', 'chunk_points': chunk_points, 'timer_interval': interval,
+                    'max_points': int(max_duration / interval) + 1 if limited else None}
+        if stream_mode:
+            return {'mode': 'stream', 'chunk_points': self.buffer_points_var.get(),
+                    'max_duration': max_duration}
+        if self.buffer_mode_var.get():
+            n_points = self.buffer_points_var.get()
+            return {'mode': 'stream', 'chunk_points': n_points, 'max_points': n_points}
+        return {'mode': 'paced', 'interval': self.interval_var.get(),
+                'fast': self.fast_mode_var.get(), 'batch': self.batch_mode_var.get(),
+                'batch_fill': self.BATCH_FILL, 'max_duration': max_duration}
+
+    def replace_samples(self, samples):
+        """Remplace l'historique (le buffer partagé précédent est libéré)"""
+        previous = self.samples
+        self.samples = samples
+        if isinstance(previous, SharedSampleRingBuffer):
+            previous.close()
+
     def measurement_loop(self):
         """Boucle d'acquisition (thread séparé)"""
         interval = self.interval_var.get()
@@ -622,35 +950,86 @@ class QuickMeasureTab:
         max_duration = self.duration_var.get() if duration_mode == 'limited' else float('inf')
         
         fast_mode = self.fast_mode_var.get()
+        batch_mode = self.batch_mode_var.get()
+        self.batch_points = None
+
+        # Grille absolue: pas de dérive, créneaux manqués comptés et sautés
+        self.scheduler = PacedScheduler(interval, start=self.start_time)
         
-        while self.measuring:
-            if not self.paused:
-                try:
-                    # Temps écoulé
-                    elapsed = time.time() - self.start_time
-                    
-                    # Vérifier durée maximale
-                    if elapsed > max_duration:
-                        self.frame.after(0, self.stop_measurement)
-                        break
-                    
-                    # Mesure
-                    if fast_mode:
-                        value = self.keithley.measure_fast()
-                    else:
-                        value = self.keithley.measure_single()
-                    
-                    # Ajout des données
-                    self.data_time.append(elapsed)
-                    self.data_values.append(value)
-                    
-                except Exception as e:
-                    self.frame.after(0, lambda: self.update_status(f"Erreur: {e}", "red"))
-                    self.frame.after(0, self.stop_measurement)
+        while not self.stop_event.is_set():
+            # Pause: attente sans scrutation, réveil par Resume ou Stop
+            if not self.resume_event.is_set():
+                self.resume_event.wait()
+                self.scheduler.resume()
+                continue
+
+            # Attente du créneau interrompue dès la demande d'arrêt
+            slot = self.scheduler.wait_next(self.stop_event)
+            if slot is None:
+                break
+
+            try:
+                # Temps écoulé (horloge monotone)
+                elapsed = time.perf_counter() - self.start_time
+                
+                # Vérifier durée maximale
+                if slot[1] - self.scheduler.start >= max_duration:
+                    self.post_stop()
                     break
-            
-            # Attente avant prochaine mesure
-            time.sleep(interval)
+                
+                # Mesure par lots: autant de lectures que l'intervalle en contient
+                if batch_mode:
+                    self.batch_points = self.keithley.batch_size(interval * self.BATCH_FILL)
+                    batch = self.keithley.measure_batch_timed(self.batch_points,
+                                                              stop_event=self.stop_event)
+                    if batch is None:
+                        break  # Lot abandonné (ABOR) sur demande d'arrêt
+                    values, times = batch
+                    self.store_samples(times - self.start_time, values)
+                    continue
+
+                # Mesure
+                if fast_mode:
+                    value = self.keithley.measure_fast()
+                else:
+                    value = self.keithley.measure_single()
+                
+                # Ajout des données
+                self.store_sample(elapsed, value)
+                
+            except Exception as e:
+                self.post_error(f"Erreur: {e}")
+                break
+
+    def timer_measurement_loop(self):
+        """Boucle d'acquisition cadencée par le timer de l'instrument (thread séparé)"""
+        try:
+            interval = max(self.interval_var.get(), self.TIMER_INTERVAL_MIN)
+            duration_mode = self.duration_mode_var.get()
+            max_duration = self.duration_var.get() if duration_mode == 'limited' else float('inf')
+            max_points = int(max_duration / interval) + 1 if duration_mode == 'limited' else None
+
+            # Blocs d'environ TIMER_CHUNK_DURATION secondes pour garder le graphique vivant
+            chunk_points = int(min(1024, max(2, round(self.TIMER_CHUNK_DURATION / interval))))
+
+            for chunk in self.keithley.buffer_stream(chunk_points, max_points=max_points,
+                                                     timer_interval=interval,
+                                                     stop_event=self.stop_event):
+                t_start = chunk['t_start'] - self.start_time
+
+                # Grille du timer instrument à partir de chaque trigger
+                self.store_samples(chunk['times'] - self.start_time, chunk['values'])
+
+                if chunk['dead_time'] > 0:
+                    self.stream_gaps.append((t_start, chunk['dead_time']))
+                self.stream_stats = dict(self.keithley.stream_stats)
+
+            if not self.stop_event.is_set():
+                # Nombre de points atteint
+                self.post_stop()
+
+        except Exception as e:
+            self.post_error(f"Erreur timer: {e}")
 
     def buffer_measurement_loop(self):
         """Boucle d'acquisition en mode buffer (thread séparé)"""
@@ -658,57 +1037,139 @@ class QuickMeasureTab:
             n_points = self.buffer_points_var.get()
 
             # Configurer et démarrer le buffer
-            self.frame.after(0, lambda: self.update_status(
-                f"Configuration buffer ({n_points} points)...", "orange"))
+            self.post_status(f"Configuration buffer ({n_points} points)...", "orange")
 
-            self.keithley.buffer_configure(n_points)
-            self.keithley.buffer_start(n_points)
+            # Session réservée de l'armement à la lecture: les commandes de
+            # l'interface attendent la fin de l'acquisition
+            with self.keithley.capture():
+                self.keithley.buffer_configure(n_points)
+                self.keithley.buffer_start(n_points)
 
-            self.frame.after(0, lambda: self.update_status(
-                f"Acquisition buffer en cours (0/{n_points})...", "green"))
+                self.post_status(f"Acquisition buffer en cours ({n_points} points)...", "green")
 
-            # Attendre la fin de l'acquisition avec mise à jour du statut
-            while self.measuring:
-                current = self.keithley.buffer_get_count()
-                self.frame.after(0, lambda c=current: self.update_status(
-                    f"Acquisition buffer en cours ({c}/{n_points})...", "green"))
+                # Attendre la fin de l'acquisition (SRQ, scrutation en repli)
+                complete = self.keithley.buffer_wait_complete(stop_event=self.stop_event)
 
-                if self.keithley.buffer_is_complete():
-                    break
+                if not complete or self.stop_event.is_set():
+                    # Arrêt demandé par l'utilisateur (ABOR + device clear par l'arrêt)
+                    return
 
-                time.sleep(0.1)  # Polling toutes les 100ms
+                # Lire les données du buffer
+                self.post_status("Lecture du buffer...", "orange")
 
-            if not self.measuring:
-                # Arrêt demandé par l'utilisateur
-                return
+                values, times = self.keithley.buffer_read_timed()
 
-            # Lire les données du buffer
-            self.frame.after(0, lambda: self.update_status("Lecture du buffer...", "orange"))
+            # Instants mesurés entre le trigger et le remplissage du buffer
+            trigger_offset = self.keithley.buffer_trigger_time - self.start_time
+            self.store_samples(trigger_offset + times, values)
+            total_duration = times[-1] if len(times) > 0 else 0.0
 
-            values = self.keithley.buffer_read()
-            end_time = time.time()
-            total_duration = end_time - self.start_time
+            # Mise à jour finale
+            self.post_data()
+            wait_stats = self.keithley.last_wait_stats
+            self.post_status(f"Buffer terminé: {len(values)} points en {total_duration:.2f}s "
+                             f"(détection {wait_stats.get('method', '?')}: "
+                             f"{wait_stats.get('latency', 0)*1000:.1f} ms)", "green")
+            self.post_stop()
 
-            # Calculer les timestamps (répartis uniformément)
-            if len(values) > 1:
-                time_step = total_duration / (len(values) - 1)
-                for i, val in enumerate(values):
-                    self.data_time.append(i * time_step)
-                    self.data_values.append(val)
-            elif len(values) == 1:
-                self.data_time.append(0)
-                self.data_values.append(values[0])
+        except Exception as e:
+            self.post_error(f"Erreur buffer: {e}")
 
-            # Mise à jour finale
-            self.frame.after(0, self.update_graph)
-            self.frame.after(0, self.update_stats)
-            self.frame.after(0, lambda: self.update_status(
-                f"Buffer terminé: {len(values)} points en {total_duration:.2f}s", "green"))
-            self.frame.after(0, self.stop_measurement)
+    def buffer_stream_loop(self):
+        """Boucle d'acquisition buffer en streaming continu (thread séparé)"""
+        try:
+            chunk_points = self.buffer_points_var.get()
+            duration_mode = self.duration_mode_var.get()
+            max_duration = self.duration_var.get() if duration_mode == 'limited' else float('inf')
+
+            def should_stop():
+                return time.perf_counter() - self.start_time > max_duration
+
+            for chunk in self.keithley.buffer_stream(chunk_points, should_stop=should_stop,
+                                                     stop_event=self.stop_event):
+                values = chunk['values']
+                t_start = chunk['t_start'] - self.start_time
+
+                # Instants mesurés (trigger -> buffer plein) de chaque lecture
+                self.store_samples(chunk['times'] - self.start_time, values)
+
+                if chunk['dead_time'] > 0:
+                    self.stream_gaps.append((t_start, chunk['dead_time']))
+                self.stream_stats = dict(self.keithley.stream_stats)
+
+                s = self.stream_stats
+                self.post_status(f"Streaming buffer: {s['samples']} points, {s['chunks']} blocs",
+                                 "green")
+
+            if not self.stop_event.is_set():
+                # Durée maximale atteinte
+                self.post_stop()
 
         except Exception as e:
-            self.frame.after(0, lambda: self.update_status(f"Erreur buffer: {e}", "red"))
-            self.frame.after(0, self.stop_measurement)
+            self.post_error(f"Erreur streaming: {e}")
+
+    def process_follow_loop(self):
+        """
+        Suivi du processus d'acquisition (thread séparé): statistiques sur
+        les nouveaux points du buffer partagé, messages du processus
+        Note: Ce thread ne lit que le buffer partagé, il ne touche pas au bus;
+              il réserve la session de l'interface (capture) pendant toute
+              la vie du processus: aucune commande déjà en file ne s'intercale
+              dans les échanges du processus avec l'instrument
+        """
+        process = self.acq_process
+        with self.keithley.capture():
+            if self.stop_event.is_set():
+                return
+            try:
+                process.start()
+            except Exception as e:
+                self.post_error(f"Processus d'acquisition impossible: {e}")
+                return
+            samples = process.ring
+            index = samples.write_index
+            while True:
+                finished = process.join(self.PROCESS_POLL)
+
+                times, values, index, _ = samples.since(index)
+                self.apply_clear_request()
+                if len(times) > 0:
+                    self.stats.push_many(times, values)
+
+                for kind, content in process.poll_messages():
+                    if kind == 'stats':
+                        self.process_stats = content
+                        self.batch_points = content.get('batch_points')
+                        if 'stream' in content:
+                            self.stream_stats = content['stream']
+                    elif kind == 'error':
+                        self.post_error(content)
+                    elif kind == 'done' and content == 'complete':
+                        self.post_stop()
+
+                if finished:
+                    if not self.stop_event.is_set() and process.process.exitcode:
+                        self.post_error(f"Processus d'acquisition terminé (code "
+                                        f"{process.process.exitcode})")
+                    return
+
+    def store_sample(self, t, value):
+        """Enregistre une mesure (historique + statistiques incrémentales)"""
+        self.samples.append(t, value)
+        self.apply_clear_request()
+        self.stats.push(t, value)
+
+    def store_samples(self, times, values):
+        """Enregistre un bloc de mesures (historique + statistiques incrémentales)"""
+        self.samples.extend(times, values)
+        self.apply_clear_request()
+        self.stats.push_many(times, values)
+
+    def apply_clear_request(self):
+        """Remise à zéro des statistiques demandée par clear_data (thread producteur)"""
+        if self.clear_requested.is_set():
+            self.clear_requested.clear()
+            self.stats.reset()
 
     def animate_graph(self):
         """Animation du graphique (appelé périodiquement)"""
@@ -719,43 +1180,45 @@ class QuickMeasureTab:
     
     def update_graph(self):
         """Met à jour le graphique"""
-        if len(self.data_time) == 0:
+        if len(self.samples) == 0:
             return
 
-        # Conversion en arrays numpy
-        x_data = np.array(self.data_time)
-        y_data = np.array(self.data_values)
+        # Vues numpy sans copie sur le buffer circulaire
+        x_data, y_data = self.samples.latest()
 
-        # Mise à jour de la ligne
-        self.line.set_data(x_data, y_data)
+        # Limites avant mise à jour: redessin complet seulement si elles changent
+        limits_before = (self.ax.get_xlim(), self.ax.get_ylim())
+        width = self.renderer.pixel_width()
 
         # Mode d'affichage
         mode = self.display_mode_var.get()
 
         if mode == 'Autoscale':
             # Afficher toutes les données
-            self.ax.set_autoscale_on(True)
-            self.ax.relim()
-            self.ax.autoscale_view(True, True, True)
+            x_plot, y_plot = decimate_minmax(x_data, y_data, width)
+            self._autoscale_limits(x_plot, y_plot)
 
         elif mode == 'Manuel (zoom libre)' or mode == 'Manuel (limites fixes)':
             # Ne rien faire, l'utilisateur contrôle le zoom
-            pass
+            x_plot, y_plot = self._decimate_visible(x_data, y_data, width)
 
         elif mode == 'Fixe X, Auto Y':
             # X fixe (défini par l'utilisateur), Y autoscale
             # Trouver les Y min/max pour les points visibles en X
+            x_plot, y_plot = self._decimate_visible(x_data, y_data, width)
             x_min, x_max = self.ax.get_xlim()
-            mask = (x_data >= x_min) & (x_data <= x_max)
-            if np.any(mask):
-                visible_y = y_data[mask]
+            first = np.searchsorted(x_data, x_min, 'left')
+            last = np.searchsorted(x_data, x_max, 'right')
+            if last > first:
+                visible_y = y_data[first:last]
                 y_min, y_max = np.min(visible_y), np.max(visible_y)
                 margin = (y_max - y_min) * 0.1 if y_max != y_min else abs(y_min) * 0.1 or 0.1
                 self.ax.set_ylim(y_min - margin, y_max + margin)
 
         elif mode == 'Auto X, Fixe Y':
             # X autoscale, Y fixe (défini par l'utilisateur)
-            self.ax.set_xlim(np.min(x_data), np.max(x_data))
+            x_plot, y_plot = decimate_minmax(x_data, y_data, width)
+            self.ax.set_xlim(np.min(x_plot), np.max(x_plot))
 
         elif 'derniers points' in mode:
             # Mode défilement: extraire le nombre de points
@@ -768,46 +1231,112 @@ class QuickMeasureTab:
             else:
                 n_points = 100
 
+            x_plot, y_plot = decimate_minmax(x_data[-n_points:], y_data[-n_points:], width)
             if len(x_data) > n_points:
                 x_min = x_data[-n_points]
                 x_max = x_data[-1]
                 # Trouver les Y min/max pour les points visibles
-                visible_y = y_data[-n_points:]
-                y_min, y_max = np.min(visible_y), np.max(visible_y)
+                y_min, y_max = np.min(y_plot), np.max(y_plot)
                 margin = (y_max - y_min) * 0.1 if y_max != y_min else abs(y_min) * 0.1 or 0.1
                 self.ax.set_xlim(x_min, x_max)
                 self.ax.set_ylim(y_min - margin, y_max + margin)
             else:
                 # Pas assez de points: afficher tout
+                self.line.set_data(x_plot, y_plot)
                 self.ax.relim()
                 self.ax.autoscale_view()
+        else:
+            x_plot, y_plot = decimate_minmax(x_data, y_data, width)
+
+        # Mise à jour de la ligne (au plus 2 points par pixel)
+        self.line.set_data(x_plot, y_plot)
 
-        # Rafraîchissement
-        self.canvas.draw_idle()
+        # Rafraîchissement: blit de la courbe seule si les axes n'ont pas bougé
+        limits_changed = (self.ax.get_xlim(), self.ax.get_ylim()) != limits_before
+        self.renderer.refresh(full=limits_changed)
+
+    def _decimate_visible(self, x_data, y_data, width):
+        """Décime uniquement la plage X visible (plus un point de chaque côté)"""
+        x_min, x_max = self.ax.get_xlim()
+        first = max(0, np.searchsorted(x_data, x_min, 'left') - 1)
+        last = min(len(x_data), np.searchsorted(x_data, x_max, 'right') + 1)
+        return decimate_minmax(x_data[first:last], y_data[first:last], width)
+
+    def _autoscale_limits(self, x_plot, y_plot):
+        """
+        Autoscale avec marge d'avance en X: les limites (et donc le redessin
+        complet des axes) ne changent que lorsque les données sortent du cadre
+        """
+        x_min, x_max = np.min(x_plot), np.max(x_plot)
+        y_min, y_max = np.min(y_plot), np.max(y_plot)
+        limits = self.auto_limits
+
+        if (limits is None or x_min < limits[0] or x_max > limits[1]
+                or y_min < limits[2] or y_max > limits[3]):
+            x_span = (x_max - x_min) or 1.0
+            margin = (y_max - y_min) * 0.1 if y_max != y_min else abs(y_min) * 0.1 or 0.1
+            limits = (x_min, x_max + x_span * self.AUTOSCALE_HEADROOM,
+                      y_min - margin, y_max + margin)
+            self.auto_limits = limits
+
+        if self.ax.get_xlim() != limits[:2] or self.ax.get_ylim() != limits[2:]:
+            self.ax.set_xlim(limits[0], limits[1])
+            self.ax.set_ylim(limits[2], limits[3])
     
     def update_stats(self):
         """Met à jour les statistiques"""
         self.stats_text.config(state='normal')
         self.stats_text.delete('1.0', 'end')
 
-        if len(self.data_values) > 0:
-            values = np.array(self.data_values)
-            times = np.array(self.data_time)
-
-            stats = f"""Points:  {len(values)}
-Min:     {np.min(values):.6g}
-Max:     {np.max(values):.6g}
-Moyenne: {np.mean(values):.6g}
-Std Dev: {np.std(values):.6g}
-Dernier: {values[-1]:.6g}"""
+        if self.stats.values.count > 0:
+            # Statistiques incrémentales (O(1), indépendantes de l'historique)
+            v = self.stats.values
+            stats = f"""Points:  {v.count}
+Min:     {v.min:.6g}
+Max:     {v.max:.6g}
+Moyenne: {v.mean:.6g}
+Std Dev: {v.std:.6g}
+Std {self.STATS_WINDOW}: {self.stats.recent.std:.6g}
+Dernier: {self.stats.last_value:.6g}"""
 
             # Calcul du temps moyen entre mesures
-            if len(times) > 1:
-                intervals = np.diff(times)
-                avg_interval = np.mean(intervals)
+            if self.stats.intervals.count > 0:
+                avg_interval = self.stats.intervals.mean
                 rate = 1.0 / avg_interval if avg_interval > 0 else 0
                 stats += f"\n--- Vitesse ---\nIntervalle: {avg_interval*1000:.1f} ms\nCadence:  {rate:.1f} mes/s"
 
+            # Ponctualité du cadencement logiciel (thread ou processus séparé)
+            p = None
+            if self.scheduler and not self.buffer_mode_var.get():
+                p = self.scheduler.get_stats()
+            elif self.process_stats:
+                p = self.process_stats.get('scheduler')
+            if p:
+                stats += (f"\n--- Cadencement ---\nRetard:  {p['lateness_mean']*1000:.2f} ms moy"
+                          f"\n         {p['lateness_max']*1000:.2f} ms max"
+                          f"\nManqués: {p['missed']}")
+                if self.batch_points:
+                    stats += f"\nLot:     {self.batch_points} pts"
+
+            # Couverture du streaming / mode timer (temps morts entre blocs)
+            if self.stream_stats:
+                s = self.stream_stats
+                stats += (f"\n--- Streaming ---\nBlocs:   {s['chunks']}"
+                          f"\nT. mort: {s['dead_time']*1000:.1f} ms"
+                          f"\nPerdus:  {s['lost_samples']} pts")
+
+            # Attente de la session: acquisition retardée par l'interface / console
+            # File des messages threads -> interface
+            d = self.dispatcher.get_stats()
+            stats += (f"\n--- Interface ---\nFile:    {d['queued']} ({d['max_depth']} max)"
+                      f"\nVidage:  {d['drain_max']*1000:.1f} ms max"
+                      f"\nFusions: {d['coalesced']}")
+
+            io = self.keithley.get_io_stats()
+            if io and io['low']['contended']:
+                stats += (f"\n--- Accès E/S ---\nAcq.:    {io['high']['wait_max']*1000:.1f} ms max"
+                          f"\nConsole: {io['low']['wait_max']*1000:.1f} ms max")
+
             self.stats_text.insert('1.0', stats)
         else:
             self.stats_text.insert('1.0', "Aucune donnée")
@@ -821,22 +1350,34 @@ Dernier: {values[-1]:.6g}"""
                     "Effacer les données pendant la mesure en cours ?"):
                 return
 
-        self.data_time.clear()
-        self.data_values.clear()
+        # Historique: seul l'index plancher du lecteur change (le producteur
+        # garde son index d'écriture)
+        self.samples.clear()
+        thread = self.measure_thread
+        if thread is not None and thread.is_alive():
+            self.clear_requested.set()
+        else:
+            self.stats.reset()
+        self.stream_stats = None
+        self.stream_gaps = []
         self.line.set_data([], [])
+        self.auto_limits = None
         self.ax.relim()
         self.ax.autoscale_view()
         self.canvas.draw()
         self.update_stats()
 
-        # Réinitialiser le temps de départ si mesure en cours
-        if self.measuring:
-            self.start_time = time.time()
+        # Réinitialiser le temps de départ si mesure en cours; en mode
+        # processus, les instants sont datés par le processus d'acquisition
+        # sur sa propre origine (inchangée par l'effacement)
+        if self.measuring and self.acq_process is None:
+            self.start_time = time.perf_counter()
     
     def reset_zoom(self):
         """Réinitialise le zoom du graphique"""
-        if len(self.data_time) > 0:
+        if len(self.samples) > 0:
             # Réactiver l'autoscale
+            self.auto_limits = None
             self.ax.set_autoscale_on(True)
             self.ax.relim()
             self.ax.autoscale_view(True, True, True)
@@ -899,26 +1440,27 @@ Dernier: {values[-1]:.6g}"""
             self.vline.set_visible(False)
             self.cursor_point.set_visible(False)
             self.cursor_annotation.set_visible(False)
-            self.canvas.draw_idle()
+            self.renderer.refresh()
 
     def on_mouse_move(self, event):
         """Gère le mouvement de la souris pour le curseur"""
         # Vérifier que la souris est dans les axes et qu'il y a des données
-        if event.inaxes != self.ax or len(self.data_time) == 0:
+        if event.inaxes != self.ax or len(self.samples) == 0:
             self.hline.set_visible(False)
             self.vline.set_visible(False)
             self.cursor_point.set_visible(False)
             self.cursor_annotation.set_visible(False)
-            self.canvas.draw_idle()
+            self.renderer.refresh()
             return
 
         # Trouver le point le plus proche sur la courbe
         x_mouse = event.xdata
-        x_data = np.array(self.data_time)
-        y_data = np.array(self.data_values)
+        x_data, y_data = self.samples.latest()
 
-        # Trouver l'index du point le plus proche en X
-        idx = np.abs(x_data - x_mouse).argmin()
+        # Trouver l'index du point le plus proche en X (recherche dichotomique)
+        idx = int(np.searchsorted(x_data, x_mouse))
+        if idx >= len(x_data) or (idx > 0 and x_mouse - x_data[idx - 1] < x_data[idx] - x_mouse):
+            idx -= 1
         x_snap = x_data[idx]
         y_snap = y_data[idx]
 
@@ -937,7 +1479,7 @@ Dernier: {values[-1]:.6g}"""
         self.cursor_point.set_visible(True)
         self.cursor_annotation.set_visible(True)
 
-        self.canvas.draw_idle()
+        self.renderer.refresh()
 
     def save_current_config(self):
         """Sauvegarde la configuration actuelle"""
@@ -948,18 +1490,27 @@ Dernier: {values[-1]:.6g}"""
             'nplc': self.nplc_var.get(),
             'buffer_mode': self.buffer_mode_var.get(),
             'buffer_points': self.buffer_points_var.get() if self.buffer_mode_var.get() else 0,
+            'stream_mode': self.buffer_mode_var.get() and self.stream_mode_var.get(),
             'fast_mode': self.fast_mode_var.get(),
             'display_off': self.display_off_var.get(),
             'filter': self.filter_var.get(),
             'filter_count': self.filter_count_var.get() if self.filter_var.get() else 0,
             'interval': self.interval_var.get() if not self.buffer_mode_var.get() else 'N/A (buffer)',
+            'timer_mode': not self.buffer_mode_var.get() and self.timer_mode_var.get(),
             'duration_mode': self.duration_mode_var.get(),
-            'max_duration': self.duration_var.get()
+            'max_duration': self.duration_var.get(),
+            'history_points': self.history_var.get(),
+            # Métadonnées d'export figées au démarrage (pas de requête à l'export)
+            'unit': self.keithley.UNITS.get(self.keithley.MEASURE_TYPES[self.meas_type_var.get()], ''),
+            'gpib_address': self.keithley.meter.resource_name if self.keithley.connected else 'N/A'
         }
+        # Mode lots: clé présente seulement s'il est utilisé (en-tête d'export inchangé sinon)
+        if not self.buffer_mode_var.get() and self.batch_mode_var.get():
+            self.current_config['batch_mode'] = True
     
     def export_data(self):
         """Exporte les données en CSV avec métadonnées"""
-        if len(self.data_time) == 0:
+        if len(self.samples) == 0:
             messagebox.showwarning("Attention", "Aucune donnée à exporter")
             return
         
@@ -973,45 +1524,41 @@ Dernier: {values[-1]:.6g}"""
         if not filename:
             return
         
-        try:
-            with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
-                # En-tête avec métadonnées
-                # Note: utf-8-sig ajoute un BOM pour compatibilité Excel
-                f.write("# Keithley 2000 Measurement Data\n")
-                f.write(f"# Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Measurement Type: {self.current_config.get('measurement_type', 'N/A')}\n")
-                f.write(f"# Range: {self.current_config.get('range', 'N/A')}\n")
-                f.write(f"# NPLC: {self.current_config.get('nplc', 'N/A')}\n")
-                f.write(f"# Buffer Mode: {self.current_config.get('buffer_mode', 'N/A')}\n")
-                f.write(f"# Buffer Points: {self.current_config.get('buffer_points', 'N/A')}\n")
-                f.write(f"# Fast Mode: {self.current_config.get('fast_mode', 'N/A')}\n")
-                f.write(f"# Display Off: {self.current_config.get('display_off', 'N/A')}\n")
-                f.write(f"# Filter: {self.current_config.get('filter', 'N/A')}\n")
-                f.write(f"# Filter Count: {self.current_config.get('filter_count', 'N/A')}\n")
-                f.write(f"# Sample Interval: {self.current_config.get('interval', 'N/A')} s\n")
-                f.write(f"# GPIB Address: {self.keithley.meter.resource_name if self.keithley.connected else 'N/A'}\n")
-                
-                # Statistiques
-                values = np.array(self.data_values)
-                f.write(f"# Statistics - Min: {np.min(values):.6g}, Max: {np.max(values):.6g}, Mean: {np.mean(values):.6g}, Std: {np.std(values):.6g}\n")
-                f.write("#\n")
-                
-                # En-tête des colonnes
-                unit = self.keithley.get_unit() if self.keithley.connected else ''
-                f.write(f"Time(s),Value,Unit\n")
-                
-                # Données
-                for t, v in zip(self.data_time, self.data_values):
-                    f.write(f"{t:.6f},{v:.10g},{unit}\n")
-            
-            messagebox.showinfo("Succès", f"Données exportées:\n{filename}")
+        # En-tête avec métadonnées
+        header = "# Keithley 2000 Measurement Data\n"
+        header += f"# Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        header += f"# Measurement Type: {self.current_config.get('measurement_type', 'N/A')}\n"
+        header += f"# Range: {self.current_config.get('range', 'N/A')}\n"
+        header += f"# NPLC: {self.current_config.get('nplc', 'N/A')}\n"
+        header += f"# Buffer Mode: {self.current_config.get('buffer_mode', 'N/A')}\n"
+        header += f"# Buffer Points: {self.current_config.get('buffer_points', 'N/A')}\n"
+        if self.stream_stats and (self.current_config.get('stream_mode')
+                                  or self.current_config.get('timer_mode')):
+            header += (f"# Stream Chunks: {self.stream_stats['chunks']}, "
+                       f"Dead Time: {self.stream_stats['dead_time']:.6f} s, "
+                       f"Lost Samples: {self.stream_stats['lost_samples']}\n")
+            for gap_start, gap in self.stream_gaps:
+                header += f"# Gap: {gap_start:.6f} s (+{gap:.6f} s)\n"
+        header += f"# Fast Mode: {self.current_config.get('fast_mode', 'N/A')}\n"
+        if 'batch_mode' in self.current_config:
+            header += f"# Batch Mode: {self.current_config['batch_mode']}\n"
+        header += f"# Display Off: {self.current_config.get('display_off', 'N/A')}\n"
+        header += f"# Filter: {self.current_config.get('filter', 'N/A')}\n"
+        header += f"# Filter Count: {self.current_config.get('filter_count', 'N/A')}\n"
+        header += f"# Sample Interval: {self.current_config.get('interval', 'N/A')} s\n"
+        header += f"# GPIB Address: {self.current_config.get('gpib_address', 'N/A')}\n"
 
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur d'export:\n{e}")
+        # Statistiques
+        times, values = self.samples.snapshot()
+        header += f"# Statistics - Min: {np.min(values):.6g}, Max: {np.max(values):.6g}, Mean: {np.mean(values):.6g}, Std: {np.std(values):.6g}\n"
+        header += "#\n"
+
+        self.start_export(filename, header, times, values,
+                          f"Données exportées:\n{filename}")
 
     def export_visible_data(self):
         """Exporte uniquement les données visibles dans la vue actuelle du graphique"""
-        if len(self.data_time) == 0:
+        if len(self.samples) == 0:
             messagebox.showwarning("Attention", "Aucune donnée à exporter")
             return
 
@@ -1020,8 +1567,7 @@ Dernier: {values[-1]:.6g}"""
         y_min, y_max = self.ax.get_ylim()
 
         # Filtrer les données dans la plage X visible
-        x_data = np.array(self.data_time)
-        y_data = np.array(self.data_values)
+        x_data, y_data = self.samples.snapshot()
 
         mask = (x_data >= x_min) & (x_data <= x_max)
         visible_x = x_data[mask]
@@ -1041,32 +1587,54 @@ Dernier: {values[-1]:.6g}"""
         if not filename:
             return
 
-        try:
-            with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
-                # En-tête avec métadonnées
-                f.write("# Keithley 2000 Measurement Data (VISIBLE RANGE ONLY)\n")
-                f.write(f"# Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Visible X Range: {x_min:.6f} to {x_max:.6f} s\n")
-                f.write(f"# Visible Y Range: {y_min:.6g} to {y_max:.6g}\n")
-                f.write(f"# Points in range: {len(visible_x)} / {len(self.data_time)} total\n")
-                f.write(f"# Measurement Type: {self.current_config.get('measurement_type', 'N/A')}\n")
-                f.write(f"# Range: {self.current_config.get('range', 'N/A')}\n")
-                f.write(f"# NPLC: {self.current_config.get('nplc', 'N/A')}\n")
-                f.write(f"# GPIB Address: {self.keithley.meter.resource_name if self.keithley.connected else 'N/A'}\n")
-
-                # Statistiques des données visibles
-                f.write(f"# Statistics (visible) - Min: {np.min(visible_y):.6g}, Max: {np.max(visible_y):.6g}, Mean: {np.mean(visible_y):.6g}, Std: {np.std(visible_y):.6g}\n")
-                f.write("#\n")
-
-                # En-tête des colonnes
-                unit = self.keithley.get_unit() if self.keithley.connected else ''
-                f.write(f"Time(s),Value,Unit\n")
-
-                # Données visibles uniquement
-                for t, v in zip(visible_x, visible_y):
-                    f.write(f"{t:.6f},{v:.10g},{unit}\n")
-
-            messagebox.showinfo("Succès", f"Données visibles exportées ({len(visible_x)} points):\n{filename}")
+        # En-tête avec métadonnées
+        header = "# Keithley 2000 Measurement Data (VISIBLE RANGE ONLY)\n"
+        header += f"# Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        header += f"# Visible X Range: {x_min:.6f} to {x_max:.6f} s\n"
+        header += f"# Visible Y Range: {y_min:.6g} to {y_max:.6g}\n"
+        header += f"# Points in range: {len(visible_x)} / {len(self.samples)} total\n"
+        header += f"# Measurement Type: {self.current_config.get('measurement_type', 'N/A')}\n"
+        header += f"# Range: {self.current_config.get('range', 'N/A')}\n"
+        header += f"# NPLC: {self.current_config.get('nplc', 'N/A')}\n"
+        header += f"# GPIB Address: {self.current_config.get('gpib_address', 'N/A')}\n"
+
+        # Statistiques des données visibles
+        header += f"# Statistics (visible) - Min: {np.min(visible_y):.6g}, Max: {np.max(visible_y):.6g}, Mean: {np.mean(visible_y):.6g}, Std: {np.std(visible_y):.6g}\n"
+        header += "#\n"
+
+        self.start_export(filename, header, visible_x, visible_y,
+                          f"Données visibles exportées ({len(visible_x)} points):\n{filename}")
+
+    def start_export(self, filename, header, times, values, success_message):
+        """
+        Lance l'écriture du CSV dans un thread avec progression dans la barre de statut
+        Args:
+            filename (str): Chemin du fichier
+            header (str): Lignes de métadonnées
+            times (array): Temps (copie indépendante de l'acquisition)
+            values (array): Valeurs
+            success_message (str): Message affiché en fin d'export
+        """
+        if self.export_thread and self.export_thread.is_alive():
+            messagebox.showwarning("Attention", "Un export est déjà en cours")
+            return
 
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur d'export:\n{e}")
+        unit = self.current_config.get('unit', '')
+        self.export_btn.config(state='disabled')
+
+        def progress(done, total):
+            self.post_status(f"Export CSV: {done}/{total} lignes ({100 * done // total}%)",
+                             "orange")
+
+        def export_thread():
+            try:
+                write_csv(filename, header, times, values, unit, progress=progress)
+                self.post_status("Export CSV terminé", "green")
+                self.dispatcher.post(messagebox.showinfo, "Succès", success_message)
+            except Exception as e:
+                self.dispatcher.post(messagebox.showerror, "Erreur", f"Erreur d'export:\n{e}")
+            finally:
+                self.dispatcher.post(self.export_btn.config, {'state': 'normal'})
+
+        self.export_thread = threading.Thread(target=export_thread, daemon=True)
+        self.export_thread.start()
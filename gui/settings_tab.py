@@ -5,19 +5,30 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 
+from discovery_cache import DiscoveryCache
+
 class SettingsTab:
     """Onglet de configuration de la connexion"""
+
+    # Durée maximale du scan de chaque interface VISA (s)
+    SCAN_DEADLINE = 10.0
+
+    # Timeout de vérification des adresses du cache au démarrage (ms)
+    QUICK_PROBE_TIMEOUT = 300
     
-    def __init__(self, parent, keithley, update_status_callback):
+    def __init__(self, parent, keithley, update_status_callback, executor):
         self.keithley = keithley
         self.update_status = update_status_callback
+        self.executor = executor  # Commandes VISA hors du thread Tk
+        self.dispatcher = executor.dispatcher  # Messages des threads vers le thread Tk
         
         self.frame = ttk.Frame(parent)
+        self.cache = DiscoveryCache()
         self.create_widgets()
         
-        # Scan automatique au démarrage
+        # Démarrage: instruments connus d'abord, scan complet en repli
         self.root = parent
-        self.frame.after(500, self.scan_resources)
+        self.frame.after(0, self.quick_connect)
     
     def create_widgets(self):
         """Crée les widgets de l'onglet"""
@@ -107,25 +118,81 @@ class SettingsTab:
         help_label = ttk.Label(help_frame, text=help_text, justify='left')
         help_label.pack(anchor='w')
     
+    def quick_connect(self):
+        """Vérifie les adresses du cache et reconnecte la dernière utilisée"""
+        addresses = self.cache.addresses()
+        if not addresses:
+            self.scan_resources()
+            return
+
+        self.update_status("Vérification des instruments connus...", "orange")
+        self.scan_btn.config(state='disabled')
+
+        def probe_thread():
+            try:
+                answers = self.keithley.probe_resources(addresses, timeout=self.QUICK_PROBE_TIMEOUT)
+            except Exception:
+                answers = {}
+            # Valide seulement si le même instrument répond à la même adresse
+            valid = [r for r in addresses if answers.get(r) == self.cache.get(r)['idn']]
+            self.dispatcher.post(self.quick_connect_done, valid)
+
+        threading.Thread(target=probe_thread, daemon=True).start()
+
+    def quick_connect_done(self, valid):
+        """Affiche les instruments connus vérifiés et connecte le premier"""
+        self.scan_btn.config(state='normal')
+        names = [self.keithley.display_name(r, self.cache.get(r)['idn'])
+                 or self.keithley.display_name(r, self.cache.get(r)['idn'], filter_keithley=False)
+                 for r in valid]
+        if not names:
+            # Cache périmé: scan complet du bus
+            self.add_info("Instruments connus absents, scan complet...")
+            self.scan_resources()
+            return
+
+        self.resource_combo['values'] = names
+        self.resource_combo.set(names[0])
+        self.timeout_var.set(self.cache.get(valid[0]).get('timeout', self.timeout_var.get()))
+        self.add_info(f"✓ {len(names)} instrument(s) connu(s) vérifié(s) (Scan pour rechercher les autres)")
+        self.connect_instrument(auto=True)
+
     def scan_resources(self):
         """Scan des ressources VISA disponibles"""
         self.update_status("Scan des ressources VISA...", "orange")
         self.scan_btn.config(state='disabled')
+        self.resource_combo['values'] = []
         
         def scan_thread():
             try:
-                resources = self.keithley.list_resources()
+                # Chaque instrument apparaît dans la liste dès qu'il répond
+                def on_found(resource):
+                    self.dispatcher.post(self.add_found_resource, resource)
+
+                resources = self.keithley.list_resources(on_found=on_found,
+                                                         deadline=self.SCAN_DEADLINE)
                 
                 # Mise à jour de l'interface dans le thread principal
-                self.frame.after(0, lambda: self.update_resource_list(resources))
+                self.dispatcher.post(self.update_resource_list, resources)
                 
             except Exception as e:
-                self.frame.after(0, lambda: self.show_scan_error(str(e)))
+                self.dispatcher.post(self.show_scan_error, str(e))
             finally:
-                self.frame.after(0, lambda: self.scan_btn.config(state='normal'))
+                self.dispatcher.post(self.scan_btn.config, {'state': 'normal'})
         
         threading.Thread(target=scan_thread, daemon=True).start()
     
+    def add_found_resource(self, resource):
+        """Ajoute un instrument détecté pendant le scan"""
+        values = list(self.resource_combo['values'])
+        if resource in values:
+            return
+        values.append(resource)
+        self.resource_combo['values'] = values
+        if len(values) == 1:
+            self.resource_combo.set(resource)
+        self.update_status(f"Scan en cours: {len(values)} Keithley 2000 trouvé(s)...", "orange")
+
     def update_resource_list(self, resources):
         """Met à jour la liste des ressources"""
         if resources:
@@ -153,8 +220,13 @@ class SettingsTab:
         self.add_info(f"✗ Erreur: {error_msg}")
         messagebox.showerror("Erreur", f"Impossible de scanner les ressources:\n{error_msg}")
     
-    def connect_instrument(self):
-        """Établit la connexion avec l'instrument"""
+    def connect_instrument(self, auto=False):
+        """
+        Établit la connexion avec l'instrument
+        Args:
+            auto (bool): Reconnexion automatique au démarrage (sans boîte de dialogue,
+                         scan complet en cas d'échec)
+        """
         resource_display = self.resource_var.get()
 
         if not resource_display:
@@ -167,26 +239,27 @@ class SettingsTab:
         self.update_status("Connexion en cours...", "orange")
         self.connect_btn.config(state='disabled')
         
-        def connect_thread():
-            try:
-                # Configuration du timeout
-                self.keithley.timeout = self.timeout_var.get()
-                
-                # Connexion
-                self.keithley.connect(resource)
-                
-                # Lecture de l'identification
-                idn = self.keithley.get_id()
-                
-                # Mise à jour de l'interface
-                self.frame.after(0, lambda: self.connection_success(idn))
-                
-            except Exception as e:
-                self.frame.after(0, lambda: self.connection_failed(str(e)))
-        
-        threading.Thread(target=connect_thread, daemon=True).start()
+        # Configuration du timeout (lu sur le thread Tk)
+        timeout = self.timeout_var.get()
+
+        def connect():
+            self.keithley.timeout = timeout
+            
+            # Connexion
+            self.keithley.connect(resource)
+            
+            # Lecture de l'identification
+            idn = self.keithley.get_id()
+            
+            # Mémoriser l'adresse pour le prochain démarrage
+            self.cache.remember(resource, idn, self.keithley.timeout)
+            return idn
+
+        self.executor.submit(connect,
+                             on_done=lambda idn: self.connection_success(idn, auto),
+                             on_error=lambda e: self.connection_failed(str(e), auto))
     
-    def connection_success(self, idn):
+    def connection_success(self, idn, auto=False):
         """Gestion de la connexion réussie"""
         self.update_status(f"Connecté: {self.resource_var.get()}", "green")
         self.add_info(f"\n✓ Connexion établie!")
@@ -198,19 +271,25 @@ class SettingsTab:
         self.test_btn.config(state='normal')
         self.resource_combo.config(state='disabled')
         
-        messagebox.showinfo("Succès", f"Connexion établie avec:\n{idn}")
+        if not auto:
+            messagebox.showinfo("Succès", f"Connexion établie avec:\n{idn}")
     
-    def connection_failed(self, error_msg):
+    def connection_failed(self, error_msg, auto=False):
         """Gestion de l'échec de connexion"""
         self.update_status("Échec de connexion", "red")
         self.add_info(f"\n✗ Échec de connexion: {error_msg}")
         self.connect_btn.config(state='normal')
+        if auto:
+            # Reconnexion automatique impossible: scan complet
+            self.scan_resources()
+            return
         messagebox.showerror("Erreur", f"Impossible de se connecter:\n{error_msg}")
     
     def disconnect_instrument(self):
         """Déconnecte l'instrument"""
-        try:
-            self.keithley.disconnect()
+        self.disconnect_btn.config(state='disabled')
+
+        def done(_):
             self.update_status("Déconnecté", "red")
             self.add_info("\n✓ Instrument déconnecté")
             
@@ -219,30 +298,36 @@ class SettingsTab:
             self.disconnect_btn.config(state='disabled')
             self.test_btn.config(state='disabled')
             self.resource_combo.config(state='readonly')
-            
-        except Exception as e:
+
+        def failed(e):
+            self.disconnect_btn.config(state='normal')
             messagebox.showerror("Erreur", f"Erreur lors de la déconnexion:\n{e}")
+
+        self.executor.submit(self.keithley.disconnect, on_done=done, on_error=failed)
     
     def test_connection(self):
         """Test la connexion avec l'instrument"""
         if not self.keithley.connected:
             messagebox.showwarning("Attention", "Aucun instrument connecté")
             return
-        
-        try:
+
+        def test():
             # Test simple
-            idn = self.keithley.get_id()
-            error = self.keithley.get_error()
-            
+            return self.keithley.get_id(), self.keithley.get_error()
+
+        def done(result):
+            idn, error = result
             self.add_info(f"\n✓ Test de connexion réussi")
             self.add_info(f"IDN: {idn}")
             self.add_info(f"Erreurs: {error}")
             
             messagebox.showinfo("Test", f"Connexion OK!\n\n{idn}\n\nErreurs: {error}")
-            
-        except Exception as e:
+
+        def failed(e):
             self.add_info(f"\n✗ Échec du test: {e}")
             messagebox.showerror("Erreur", f"Test échoué:\n{e}")
+
+        self.executor.submit(test, on_done=done, on_error=failed)
     
     def add_info(self, text):
         """Ajoute du texte dans la zone d'information"""
@@ -0,0 +1,291 @@
+"""
+Dispatcher Tk et exécuteur des commandes VISA de l'interface
+Les appels VISA déclenchés par l'interface (configuration, console SCPI,
+tests...) s'exécutent sur un thread dédié (CommandExecutor); leurs
+résultats reviennent sur le thread Tk par une file vidée par un seul cycle
+"after" (UIDispatcher). La boucle d'événements n'attend jamais le bus
+
+Les threads de mesure passent par la même file: post_latest() fusionne les
+messages répétitifs (statut, rafraîchissements du graphique) en un seul
+appel par cycle, avec les derniers arguments reçus
+
+Le retard de ce cycle mesure les blocages du thread Tk: tout blocage
+au-delà du budget (STALL_BUDGET) est compté, et signalé par une exception
+en mode strict (banc de test)
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+import queue
+import sys
+import threading
+import time
+
+from visa_pool import PRIORITY_LOW, io_priority
+
+
+class UIStallError(Exception):
+    """Blocage du thread Tk au-delà du budget (mode strict)"""
+
+
+class UIDispatcher:
+    """File d'appels vers le thread Tk, vidée par un cycle after unique"""
+
+    # Période du cycle de vidage (ms)
+    POLL_INTERVAL = 20
+
+    # Durée maximale de vidage par cycle (s): le reste attend le cycle suivant
+    DRAIN_BUDGET = 0.02
+
+    # Blocage maximal toléré du thread Tk (s)
+    STALL_BUDGET = 0.1
+
+    def __init__(self, widget, poll_interval=POLL_INTERVAL, stall_budget=STALL_BUDGET,
+                 strict=False, clock=time.perf_counter):
+        """
+        Args:
+            widget: Widget Tk portant le cycle after (fenêtre principale)
+            poll_interval (int): Période du cycle de vidage en ms
+            stall_budget (float): Blocage maximal toléré du thread Tk en s
+            strict (bool): Lève UIStallError à chaque dépassement du budget
+            clock (callable): Horloge monotone
+        """
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.stall_budget = stall_budget
+        self.strict = strict
+        self.clock = clock
+
+        self.queue = queue.SimpleQueue()  # (clé de fusion ou None, fonction, arguments)
+        self.latest = {}                  # Clé -> (fonction, arguments) les plus récents
+        self.latest_lock = threading.Lock()
+        self._job = None
+        self._expected = None   # Instant attendu du prochain cycle
+        self._cycles = 0        # Cycles exécutés (détecte les boucles imbriquées)
+        self.stats = {
+            'posted': 0, 'executed': 0, 'errors': 0, 'coalesced': 0,
+            'cycles': 0, 'max_batch': 0, 'max_depth': 0,
+            'drain_last': 0.0, 'drain_max': 0.0, 'drain_total': 0.0,
+            'stalls': 0, 'stall_max': 0.0, 'last_stall': None,
+            'callback_max': 0.0, 'slowest_callback': None
+        }
+
+    def post(self, func, *args):
+        """
+        Demande l'exécution de func(*args) sur le thread Tk (appelable de
+        n'importe quel thread)
+        """
+        self.stats['posted'] += 1
+        self.queue.put((None, func, args))
+
+    def post_latest(self, key, func, *args):
+        """
+        Comme post(), mais les appels de même clé encore en file sont
+        fusionnés: un seul appel, avec les derniers arguments
+        Args:
+            key (str): Clé de fusion (ex: 'status', 'graph')
+        Note: L'appel garde la place du premier message en file
+        """
+        with self.latest_lock:
+            self.stats['posted'] += 1
+            pending = key in self.latest
+            self.latest[key] = (func, args)
+            if pending:
+                self.stats['coalesced'] += 1
+                return
+        self.queue.put((key, None, None))
+
+    def start(self):
+        """Lance le cycle de vidage (thread Tk)"""
+        if self._job is None:
+            self._expected = self.clock() + self.poll_interval / 1000
+            self._job = self.widget.after(self.poll_interval, self._pump)
+
+    def stop(self):
+        """Arrête le cycle (les appels en file ne sont plus exécutés)"""
+        if self._job is not None:
+            try:
+                self.widget.after_cancel(self._job)
+            except Exception:
+                pass
+            self._job = None
+
+    def _pump(self):
+        """Cycle after: mesure le retard de la boucle Tk puis vide la file"""
+        now = self.clock()
+        lag = now - self._expected
+
+        # Cycle suivant programmé d'abord: une boîte de dialogue modale
+        # ouverte par un appel fait tourner une boucle imbriquée qui reprend
+        # le cycle, sans en créer un second
+        self._expected = now + self.poll_interval / 1000
+        self._job = self.widget.after(self.poll_interval, self._pump)
+        self._cycles += 1
+        self.stats['cycles'] += 1
+
+        depth = self.queue.qsize()
+        self.stats['max_depth'] = max(self.stats['max_depth'], depth)
+
+        count = 0
+        deadline = now + self.DRAIN_BUDGET
+        try:
+            self._check_stall(lag)
+            while self.clock() < deadline:
+                try:
+                    key, func, args = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if key is not None:
+                    with self.latest_lock:
+                        func, args = self.latest.pop(key)
+                count += 1
+                self._run(func, args)
+        finally:
+            drain = self.clock() - now
+            self.stats['max_batch'] = max(self.stats['max_batch'], count)
+            self.stats['drain_last'] = drain
+            self.stats['drain_max'] = max(self.stats['drain_max'], drain)
+            self.stats['drain_total'] += drain
+
+    def _run(self, func, args):
+        """Exécute un appel et mesure sa durée sur le thread Tk"""
+        cycles = self._cycles
+        t_start = self.clock()
+        try:
+            func(*args)
+            self.stats['executed'] += 1
+        except Exception:
+            self.stats['errors'] += 1
+            self.widget.report_callback_exception(*sys.exc_info())
+        duration = self.clock() - t_start
+
+        # Durée non significative si une boucle imbriquée (dialogue) a tourné
+        if self._cycles == cycles and duration > self.stats['callback_max']:
+            self.stats['callback_max'] = duration
+            self.stats['slowest_callback'] = getattr(func, '__qualname__', repr(func))
+
+    def _check_stall(self, lag):
+        """Compte un blocage du thread Tk (retard du cycle) au-delà du budget"""
+        if lag > self.stats['stall_max']:
+            self.stats['stall_max'] = lag
+        if lag > self.stall_budget:
+            self.stats['stalls'] += 1
+            self.stats['last_stall'] = lag
+            if self.strict:
+                raise UIStallError(f"Thread Tk bloqué {lag*1000:.0f} ms "
+                                   f"(budget {self.stall_budget*1000:.0f} ms)")
+
+    def assert_within_budget(self):
+        """
+        Vérifie qu'aucun blocage n'a dépassé le budget (banc de test)
+        Raises:
+            UIStallError: Blocage maximal supérieur au budget
+        """
+        if self.stats['stall_max'] > self.stall_budget:
+            raise UIStallError(f"Blocage maximal {self.stats['stall_max']*1000:.0f} ms "
+                               f"(budget {self.stall_budget*1000:.0f} ms)")
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Appels postés / fusionnés / exécutés / en erreur, profondeur
+                  de file (courante, maximale), durée de vidage par cycle
+                  (dernière, maximale, moyenne en s), blocages (nombre,
+                  maximum, dernier en s), appel le plus long
+        """
+        stats = dict(self.stats)
+        stats['queued'] = self.queue.qsize()
+        stats['drain_mean'] = stats['drain_total'] / stats['cycles'] if stats['cycles'] else 0.0
+        return stats
+
+
+class CommandExecutor:
+    """Thread des commandes VISA de l'interface (priorité basse, dans l'ordre)"""
+
+    def __init__(self, dispatcher):
+        """
+        Args:
+            dispatcher (UIDispatcher): Retour des résultats sur le thread Tk
+        """
+        self.dispatcher = dispatcher
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='visa-ui')
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.suspended = None  # Motif du refus des commandes (None = acceptées)
+        self.stats = {'submitted': 0, 'failed': 0, 'rejected': 0, 'max_duration': 0.0,
+                      'slowest': None}
+
+    def submit(self, func, *args, on_done=None, on_error=None, **kwargs):
+        """
+        Exécute func(*args, **kwargs) sur le thread des commandes
+        Args:
+            func (callable): Appel bloquant (VISA)
+            on_done (callable): on_done(résultat), appelé sur le thread Tk
+            on_error (callable): on_error(exception), appelé sur le thread Tk
+                                 (erreur seulement comptée si absent)
+        Returns:
+            concurrent.futures.Future: Résultat de func
+        Note: Commande refusée (func non appelée) pendant suspend(): erreur
+              remise à on_error
+        """
+        reason = self.suspended
+        if reason is not None:
+            with self.lock:
+                self.stats['rejected'] += 1
+            future = Future()
+            future.set_exception(Exception(reason))
+            self._complete(future, on_done, on_error)
+            return future
+
+        with self.lock:
+            self.pending += 1
+            self.stats['submitted'] += 1
+        future = self.executor.submit(self._run, func, args, kwargs)
+        future.add_done_callback(lambda f: self._complete(f, on_done, on_error))
+        return future
+
+    def _run(self, func, args, kwargs):
+        t_start = time.perf_counter()
+        try:
+            with io_priority(PRIORITY_LOW):
+                return func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - t_start
+            with self.lock:
+                self.pending -= 1
+                if duration > self.stats['max_duration']:
+                    self.stats['max_duration'] = duration
+                    self.stats['slowest'] = getattr(func, '__qualname__', repr(func))
+
+    def _complete(self, future, on_done, on_error):
+        """Transmet le résultat (ou l'erreur) au thread Tk"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            with self.lock:
+                self.stats['failed'] += 1
+            if on_error is not None:
+                self.dispatcher.post(on_error, error)
+        elif on_done is not None:
+            self.dispatcher.post(on_done, future.result())
+
+    def suspend(self, reason):
+        """
+        Refuse les nouvelles commandes, ex: instrument piloté par un processus
+        d'acquisition séparé (les commandes déjà en file s'exécutent)
+        Args:
+            reason (str): Message de l'erreur des commandes refusées
+        """
+        self.suspended = reason
+
+    def resume(self):
+        """Accepte de nouveau les commandes"""
+        self.suspended = None
+
+    @property
+    def busy(self):
+        """True si des commandes sont en cours ou en attente"""
+        return self.pending > 0
+
+    def shutdown(self, wait=True):
+        """Arrête le thread (après les commandes en file si wait)"""
+        self.executor.shutdown(wait=wait)
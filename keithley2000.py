@@ -2,10 +2,44 @@
 Classe de contrôle du Keithley 2000
 Gère toutes les communications VISA et commandes SCPI
 """
-import pyvisa
+from pyvisa import constants
 from pyvisa.errors import VisaIOError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+import itertools
+import math
+import numpy as np
+import os
+import threading
 import time
 
+from keithley_simulator import SIMULATOR_PREFIX, SIMULATED_RESOURCES, SimulatedKeithley2000
+from visa_pool import get_pool, resource_manager
+
+
+class _InterfaceDeadline:
+    """Échéance du scan d'une interface, démarrée à sa première vérification"""
+
+    def __init__(self, duration):
+        """
+        Args:
+            duration (float): Durée maximale du scan de l'interface en s
+        """
+        self.duration = duration
+        self.end = None
+        self.lock = threading.Lock()
+
+    def remaining(self):
+        """
+        Returns:
+            float: Temps restant en s (le décompte part du premier appel)
+        """
+        with self.lock:
+            if self.end is None:
+                self.end = time.perf_counter() + self.duration
+        return self.end - time.perf_counter()
+
+
 class Keithley2000:
     """Classe pour contrôler le multimètre Keithley 2000 via VISA"""
     
@@ -29,17 +63,108 @@ class Keithley2000:
 
     # Types de mesure supportant le réglage de range
     RANGE_SUPPORTED = {'DCV', 'ACV', 'DCI', 'ACI', 'RES_2W', 'RES_4W'}
+
+    # Unités par fonction SCPI (réponse de FUNC?)
+    UNITS = {
+        'VOLT:DC': 'V',
+        'VOLT:AC': 'V',
+        'CURR:DC': 'A',
+        'CURR:AC': 'A',
+        'RES': 'Ω',
+        'FRES': 'Ω',
+        'FREQ': 'Hz',
+        'PER': 's',
+        'TEMP': '°C',
+        'DIOD': 'V',
+        'CONT': 'Ω'
+    }
+
+    # Période minimale du timer de trigger (TRIG:TIM) en secondes
+    TIMER_MIN = 0.001
+
+    # Nombre maximal de lectures par READ? (SAMP:COUN)
+    BATCH_MAX = 1024
+
+    # Taille du premier lot, avant estimation du temps de lecture
+    BATCH_CALIBRATION = 10
+
+    # Fraction de la durée estimée d'un lot attendue avant FETC? (le reste
+    # est attendu par FETC?: l'estimation ne dérive pas vers le haut)
+    BATCH_WAIT_FILL = 0.9
+
+    # Tranche d'attente SRQ (s) quand l'attente doit rester interruptible:
+    # attente locale au pilote VISA, sans transaction sur le bus
+    SRQ_STOP_SLICE = 0.01
+
+    # Longueur maximale d'une ligne de commandes groupées (caractères)
+    BATCH_LINE_MAX = 200
+
+    # Réglages conservés par CONF: (le reste revient aux valeurs par défaut)
+    CONF_PRESERVED = ('DISP:', 'SYST:', 'FORM:', 'TRAC:', 'STAT:', '*')
+
+    # Marge (s) entre la préparation d'un bloc et le tick de la grille timer
+    # visé par son INIT (imprécision du réveil du thread)
+    GRID_ARM_MARGIN = 0.001
+
+    # Réglages dont dépend buffer_rearm() (cache de configuration)
+    BUFFER_ARM_HEADERS = ('TRAC:POIN', 'TRAC:FEED', 'SAMP:COUN', 'TRIG:COUN',
+                          'TRIG:SOUR', 'TRIG:TIM')
+
+    # Nombre de ressources interrogées simultanément par list_resources()
+    DISCOVERY_WORKERS = 8
+
+    # Variable d'environnement ajoutant les instruments simulés à la détection
+    SIMULATOR_ENV = 'KEITHLEY2000_SIM'
+
+    # Formats de transfert binaire (FORM:DATA) -> type struct / numpy
+    BINARY_FORMATS = {
+        'SREAL': 'f',   # IEEE-754 simple précision (4 octets)
+        'DREAL': 'd'    # IEEE-754 double précision (8 octets)
+    }
     
-    def __init__(self, gpib_address=None, timeout=5000):
+    def __init__(self, gpib_address=None, timeout=5000, verify=False):
         """
         Initialise la connexion au Keithley 2000
         Args:
             gpib_address (str): Adresse GPIB (ex: 'GPIB0::16::INSTR')
             timeout (int): Timeout en millisecondes
+            verify (bool): Relit chaque réglage sur l'instrument au lieu de
+                           se fier au cache de configuration
         """
         self.meter = None
         self.connected = False
         self.timeout = timeout
+
+        # Session du pool partagé et verrou des transactions (partagé entre
+        # instances ouvertes sur la même adresse)
+        self.session = None
+        self.lock = threading.RLock()
+
+        # Cache de configuration: en-tête SCPI -> dernière valeur envoyée
+        # (celui de la session une fois connecté)
+        self.state = {}
+        self.verify = verify
+        self.state_stats = {'sent': 0, 'skipped': 0, 'verified': 0}
+
+        # Groupement de commandes (None = envoi immédiat)
+        self._batch = None
+        self.last_batch_stats = {}
+
+        # Attente de fin de buffer par SRQ (None = pas encore testé)
+        self.srq_supported = None
+        self.last_wait_stats = {}
+
+        # Instants (perf_counter) du dernier trigger buffer et du buffer plein
+        self.buffer_trigger_time = None
+        self.buffer_full_time = None
+        self.buffer_timer_interval = None
+
+        # Durée mesurée de l'écriture de INIT (calage sur la grille du timer)
+        self.init_write_time = 0.0
+
+        # Durée mesurée d'une lecture en mode lots, instant du dernier INIT de lot
+        self.batch_reading_time = None
+        self.batch_trigger_time = None
         
         if gpib_address:
             self.connect(gpib_address)
@@ -48,28 +173,36 @@ class Keithley2000:
         """
         Établit la connexion avec l'instrument
         Args:
-            gpib_address (str): Adresse GPIB
+            gpib_address (str): Adresse GPIB ('SIM0::16::INSTR' = simulateur)
         Returns:
             bool: True si connexion réussie
+        Note: La session vient du pool partagé (visa_pool): une adresse déjà
+              ouverte, ou fermée récemment, est réutilisée sans réouverture
         """
+        if self.session is not None:
+            self.disconnect()
         try:
-            rm = pyvisa.ResourceManager()
-            self.meter = rm.open_resource(gpib_address)
-            self.meter.timeout = self.timeout
+            self.session = get_pool().acquire(gpib_address, timeout=self.timeout)
+            self.meter = self.session.resource
+            self.lock = self.session.lock
+            self.state = self.session.state
             self.connected = True
+            self.invalidate_state()
             return True
-        except VisaIOError as e:
+        except (VisaIOError, OSError, ValueError) as e:
             self.connected = False
             raise Exception(f"Erreur de connexion GPIB: {e}")
     
     def disconnect(self):
-        """Ferme la connexion"""
+        """Ferme la connexion (la session reste ouverte dans le pool)"""
         if self.meter:
             try:
                 self.write('SYST:LOC')  # Retour en mode local
-                self.meter.close()
             except:
                 pass
+        if self.session is not None:
+            get_pool().release(self.session)
+            self.session = None
         self.connected = False
     
     def write(self, command):
@@ -77,11 +210,16 @@ class Keithley2000:
         Envoie une commande SCPI
         Args:
             command (str): Commande SCPI
+        Note: Dans un bloc batch(), la commande est mise en attente
         """
         if not self.connected:
             raise Exception("Instrument non connecté")
+        if self._batch is not None:
+            self._batch.append(command)
+            return
         try:
-            self.meter.write(command)
+            with self._transaction():
+                self.meter.write(command)
         except VisaIOError as e:
             raise Exception(f"Erreur d'écriture: {e}")
     
@@ -92,13 +230,149 @@ class Keithley2000:
             command (str): Commande SCPI
         Returns:
             str: Réponse de l'instrument
+        Note: Dans un bloc batch(), les commandes en attente sont envoyées
+              sur la même ligne, devant la requête
         """
         if not self.connected:
             raise Exception("Instrument non connecté")
         try:
-            return self.meter.query(command).strip()
+            with self._transaction():
+                return self.meter.query(self._take_pending(command)).strip()
         except VisaIOError as e:
+            self._batch_failed()
             raise Exception(f"Erreur de lecture: {e}")
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Accès exclusif à la session pour une transaction, avec le timeout de
+        cette instance (la session peut être partagée avec un autre timeout)
+        """
+        with self.lock:
+            session = self.session
+            if session is not None and session.timeout != self.timeout:
+                self.meter.timeout = self.timeout
+                session.timeout = self.timeout
+            yield
+
+    @contextmanager
+    def capture(self):
+        """
+        Réserve la session pour toute une acquisition (armement -> lecture)
+        Les appels des autres threads (console, commandes de l'interface)
+        attendent la fin de la capture au lieu de reconfigurer l'instrument
+        entre INIT et FETC? (ex: SAMP:COUN 1 d'une mesure unique pendant un lot)
+        Note: Réentrant: les transactions du thread propriétaire passent.
+              Les attentes interruptibles (stop_event) se font dans la
+              capture: l'arrêt (ABOR) précède la remise de la session
+        Usage:
+            with keithley.capture():
+                keithley.buffer_start(n)
+                keithley.buffer_wait_complete(stop_event=stop)
+                values = keithley.buffer_read()
+        """
+        with self._transaction():
+            yield
+
+    @contextmanager
+    def batch(self, sync='*OPC?'):
+        """
+        Groupe les commandes envoyées dans le bloc en un minimum d'écritures
+        Args:
+            sync (str): Requête de synchronisation ajoutée en fin de ligne
+                        ('*OPC?' attend la fin de toutes les commandes),
+                        None pour une écriture sans attente (ex: INIT)
+        Note: Les commandes sont jointes par ';:' (';' devant les commandes
+              communes '*'); une requête dans le bloc part avec les
+              commandes qui la précèdent. Les blocs imbriqués rejoignent
+              le bloc englobant
+        Usage:
+            with keithley.batch():
+                keithley.configure_measurement('DCV')
+                keithley.set_nplc(0.1)
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        self._batch_count = 0
+        self._batch_writes = 0
+        t_start = time.perf_counter()
+        try:
+            yield
+            if self._batch:
+                if sync:
+                    response = self.query(sync)
+                else:
+                    lines = self._pending_lines()
+                    for line in lines:
+                        self._write_line(line)
+                    response = None
+                self.last_batch_stats = {
+                    'commands': self._batch_count,
+                    'writes': self._batch_writes,
+                    'sync': sync,
+                    'response': response,
+                    'latency': time.perf_counter() - t_start
+                }
+        except Exception:
+            # Commandes en attente perdues: les réglages mis en cache sont faux
+            if self._batch:
+                self.invalidate_state()
+            raise
+        finally:
+            self._batch = None
+
+    def _pending_lines(self):
+        """Vide la file du bloc courant en lignes de commandes jointes"""
+        commands, self._batch = self._batch, []
+        self._batch_count += len(commands)
+        lines = []
+        for command in commands:
+            command = command.strip()
+            if lines and len(lines[-1]) + len(command) + 2 <= self.BATCH_LINE_MAX:
+                separator = ';' if command.startswith((':', '*')) else ';:'
+                lines[-1] += separator + command
+            else:
+                lines.append(command)
+        return lines
+
+    def _take_pending(self, command):
+        """
+        Préfixe une requête avec les commandes en attente du bloc courant
+        Args:
+            command (str): Requête SCPI
+        Returns:
+            str: Ligne complète (les lignes trop longues sont écrites avant)
+        """
+        if not self._batch:
+            return command
+        lines = self._pending_lines()
+        last = lines.pop()
+        for line in lines:
+            self._write_line(line)
+        if len(last) + len(command) + 2 > self.BATCH_LINE_MAX:
+            self._write_line(last)
+            return command
+        self._batch_writes += 1
+        separator = ';' if command.startswith((':', '*')) else ';:'
+        return last + separator + command
+
+    def _write_line(self, line):
+        """Écrit une ligne de commandes groupées sur le bus"""
+        self._batch_writes += 1
+        try:
+            with self._transaction():
+                self.meter.write(line)
+        except VisaIOError as e:
+            self._batch_failed()
+            raise Exception(f"Erreur d'écriture: {e}")
+
+    def _batch_failed(self):
+        """Échec d'un envoi groupé: les réglages mis en cache sont incertains"""
+        if self._batch is not None:
+            self.invalidate_state()
     
     def read(self):
         """
@@ -109,10 +383,129 @@ class Keithley2000:
         if not self.connected:
             raise Exception("Instrument non connecté")
         try:
-            return self.meter.read().strip()
+            with self._transaction():
+                return self.meter.read().strip()
         except VisaIOError as e:
             raise Exception(f"Erreur de lecture: {e}")
     
+    def write_raw(self, command):
+        """
+        Envoie une commande SCPI libre (console, scripts)
+        Args:
+            command (str): Commande SCPI
+        Note: L'état de l'instrument devient inconnu: le cache est vidé
+        """
+        self.invalidate_state()
+        self.write(command)
+
+    def query_raw(self, command):
+        """
+        Envoie une requête SCPI libre et lit la réponse
+        Args:
+            command (str): Commande SCPI
+        Returns:
+            str: Réponse de l'instrument
+        Note: Le cache est conservé pour une requête simple ("...?"),
+              vidé si la ligne contient aussi des commandes
+        """
+        if ';' in command or not command.strip().endswith('?'):
+            self.invalidate_state()
+        return self.query(command)
+
+    def get_io_stats(self):
+        """
+        Attentes d'accès à la session par priorité (voir visa_pool.PriorityLock)
+        Returns:
+            dict: {'high', 'low', 'queued'} ou None si non connecté
+        """
+        if self.session is None:
+            return None
+        return self.lock.get_stats()
+
+    def invalidate_state(self):
+        """Oublie la configuration connue (reset, reconnexion, SCPI libre)"""
+        self.state.clear()
+
+    def _set(self, header, value):
+        """
+        Envoie un réglage seulement s'il diffère de l'état connu
+        Args:
+            header (str): En-tête SCPI (ex: 'VOLT:DC:NPLC')
+            value: Valeur du réglage
+        Returns:
+            bool: True si la commande a été envoyée
+        """
+        value = str(value)
+        if self.verify:
+            # Mode vérification: l'instrument fait foi, pas le cache
+            self.state_stats['verified'] += 1
+            if self._state_matches(self.query(f'{header}?'), value):
+                self.state[header] = value
+                self.state_stats['skipped'] += 1
+                return False
+        elif self.state.get(header) == value:
+            self.state_stats['skipped'] += 1
+            return False
+
+        try:
+            self.write(f'{header} {value}')
+        except Exception:
+            self.state.pop(header, None)  # Réglage peut-être appliqué: inconnu
+            raise
+        self.state[header] = value
+        self.state_stats['sent'] += 1
+        return True
+
+    @staticmethod
+    def _state_matches(response, value):
+        """
+        Compare une réponse de l'instrument à une valeur de réglage
+        Args:
+            response (str): Réponse à "<en-tête>?" (ex: '1.000000E-01', 'IMM')
+            value (str): Valeur envoyée (ex: '0.1', 'IMM', 'ON')
+        Returns:
+            bool: True si équivalentes
+        """
+        aliases = {'ON': '1', 'OFF': '0'}
+        response = response.strip().strip('"').upper()
+        value = value.strip().strip('"').upper()
+        response = aliases.get(response, response)
+        value = aliases.get(value, value)
+        try:
+            return math.isclose(float(response), float(value), rel_tol=1e-6)
+        except ValueError:
+            # Formes courte/longue SCPI (SENS1/SENSE1, IMM/IMMEDIATE)
+            return response.startswith(value) or value.startswith(response)
+
+    def verify_state(self):
+        """
+        Relit sur l'instrument tous les réglages du cache
+        Returns:
+            list: En-têtes dont la valeur réelle diffère (retirés du cache)
+        """
+        mismatches = []
+        for header, value in list(self.state.items()):
+            try:
+                if not self._state_matches(self.query(f'{header}?'), value):
+                    mismatches.append(header)
+            except Exception:
+                mismatches.append(header)
+        for header in mismatches:
+            self.state.pop(header, None)
+        return mismatches
+
+    def get_function(self):
+        """
+        Fonction de mesure courante (cache, sinon FUNC?)
+        Returns:
+            str: Fonction SCPI (ex: 'VOLT:DC')
+        """
+        func = self.state.get('FUNC')
+        if func is None or self.verify:
+            func = self.query('FUNC?').strip('"')
+            self.state['FUNC'] = func
+        return func
+
     def get_id(self):
         """
         Récupère l'identification de l'instrument
@@ -123,8 +516,9 @@ class Keithley2000:
     
     def reset(self):
         """Reset de l'instrument"""
-        self.write('*RST')
-        time.sleep(0.5)
+        with self.batch():
+            self.write('*RST')  # *OPC? rend la main une fois le reset terminé
+        self.invalidate_state()
     
     def configure_measurement(self, meas_type, range_val='AUTO', resolution=None):
         """
@@ -139,20 +533,28 @@ class Keithley2000:
 
         func = self.MEASURE_TYPES[meas_type]
 
-        # Configuration de base
-        self.write(f'CONF:{func}')
+        with self.batch():
+            # Configuration de base, inutile si la fonction est déjà active
+            # (CONF remet trigger, plage, NPLC et filtre par défaut)
+            if self.get_function() != func:
+                self.write(f'CONF:{func}')
+                for key in [k for k in self.state if not k.startswith(self.CONF_PRESERVED)]:
+                    del self.state[key]
+                self.state.update({'FUNC': func, 'TRIG:SOUR': 'IMM',
+                                   'TRIG:COUN': '1', 'SAMP:COUN': '1'})
+                self.batch_reading_time = None
 
-        # Configuration de la plage (seulement pour les types qui le supportent)
-        if meas_type in self.RANGE_SUPPORTED:
-            if range_val == 'AUTO':
-                self.write(f'{func}:RANG:AUTO ON')
-            else:
-                self.write(f'{func}:RANG:AUTO OFF')
-                self.write(f'{func}:RANG {range_val}')
+            # Configuration de la plage (seulement pour les types qui le supportent)
+            if meas_type in self.RANGE_SUPPORTED:
+                if range_val == 'AUTO':
+                    self._set(f'{func}:RANG:AUTO', 'ON')
+                else:
+                    self._set(f'{func}:RANG:AUTO', 'OFF')
+                    self._set(f'{func}:RANG', range_val)
 
-        # Configuration de la résolution (seulement si NPLC supporté)
-        if resolution and meas_type in self.NPLC_SUPPORTED:
-            self.write(f'{func}:NPLC {resolution}')
+            # Configuration de la résolution (seulement si NPLC supporté)
+            if resolution and meas_type in self.NPLC_SUPPORTED:
+                self._set(f'{func}:NPLC', resolution)
     
     def set_nplc(self, nplc, meas_type=None):
         """
@@ -169,11 +571,12 @@ class Keithley2000:
         if meas_type:
             func = self.MEASURE_TYPES.get(meas_type)
         else:
-            # Récupérer la fonction courante
-            func = self.query('FUNC?').strip('"')
+            # Fonction courante (cache, sinon FUNC?)
+            func = self.get_function()
 
         if func:
-            self.write(f'{func}:NPLC {nplc}')
+            if self._set(f'{func}:NPLC', nplc):
+                self.batch_reading_time = None
     
     def set_filter(self, state, count=10, filter_type='MOV'):
         """
@@ -184,11 +587,11 @@ class Keithley2000:
             filter_type (str): 'MOV' (moving average) ou 'REP' (repeat)
         """
         if state:
-            self.write(f'AVER:TCON {filter_type}')
-            self.write(f'AVER:COUN {count}')
-            self.write('AVER:STAT ON')
+            self._set('AVER:TCON', filter_type)
+            self._set('AVER:COUN', count)
+            self._set('AVER:STAT', 'ON')
         else:
-            self.write('AVER:STAT OFF')
+            self._set('AVER:STAT', 'OFF')
     
     def set_trigger_source(self, source='IMM'):
         """
@@ -196,7 +599,17 @@ class Keithley2000:
         Args:
             source (str): 'IMM', 'BUS', 'EXT', 'TIM'
         """
-        self.write(f'TRIG:SOUR {source}')
+        self._set('TRIG:SOUR', source)
+
+    def set_trigger_timer(self, interval):
+        """
+        Configure la période du timer de trigger (source 'TIM')
+        Args:
+            interval (float): Période en secondes (min 1 ms)
+        """
+        if interval < self.TIMER_MIN:
+            raise ValueError(f"Période timer trop courte: {interval} s (min {self.TIMER_MIN} s)")
+        self._set('TRIG:TIM', interval)
     
     def measure_single(self):
         """
@@ -204,7 +617,9 @@ class Keithley2000:
         Returns:
             float: Valeur mesurée
         """
-        response = self.query('READ?')
+        with self.capture():
+            self._arm_readings(1)
+            response = self.query('READ?')
         return float(response)
     
     def measure_fast(self):
@@ -215,10 +630,173 @@ class Keithley2000:
         Note: Plus rapide que measure_single() car évite la reconfiguration
               L'instrument doit être pré-configuré (trigger source = IMM)
         """
-        # Méthode 1: Combiner INIT et FETCH (évite l'erreur -420)
-        response = self.query('INIT;:FETC?')
+        with self.capture():
+            self._arm_readings(1)
+            # Méthode 1: Combiner INIT et FETCH (évite l'erreur -420)
+            response = self.query('INIT;:FETC?')
         return float(response)
     
+    def set_sample_count(self, count):
+        """
+        Configure le nombre de lectures par trigger (SAMP:COUN)
+        Args:
+            count (int): 1 à 1024
+        Note: La commande n'est envoyée que si la valeur change
+        """
+        count = int(count)
+        if not 1 <= count <= self.BATCH_MAX:
+            raise ValueError(f"Nombre de lectures invalide: {count} (1 à {self.BATCH_MAX})")
+        self._set('SAMP:COUN', count)
+
+    def _arm_readings(self, count):
+        """Prépare READ?/FETC? pour count lectures (un trigger immédiat)"""
+        self._set('TRIG:SOUR', 'IMM')
+        self._set('TRIG:COUN', 1)
+        self.set_sample_count(count)
+
+    def measure_batch(self, count):
+        """
+        Effectue count mesures en une seule transaction GPIB (SAMP:COUN + READ?)
+        Args:
+            count (int): Nombre de lectures (1 à 1024)
+        Returns:
+            numpy.ndarray: Valeurs mesurées
+        Note: Les lectures sont faites au plus vite par l'instrument; le coût
+              du bus (adressage, retournement) est payé une fois par lot
+        """
+        return self.measure_batch_timed(count)[0]
+
+    def measure_batch_timed(self, count, stop_event=None):
+        """
+        Mesure un lot et horodate chaque lecture
+        Args:
+            count (int): Nombre de lectures (1 à 1024)
+            stop_event (threading.Event): Rend le lot interruptible: INIT,
+                                          attente de l'événement, puis FETC?
+                                          (dans une même capture)
+        Returns:
+            tuple: (valeurs, instants perf_counter) en numpy.ndarray, ou
+                   None si stop_event a été levé (lot abandonné par ABOR)
+        Note: Les lectures sont réparties uniformément entre l'envoi de READ?
+              (ou INIT) et la réception de la réponse
+        """
+        with self.capture():
+            if stop_event is None:
+                self._arm_readings(count)
+                t_start = time.perf_counter()
+                response = self.query('READ?')
+            else:
+                self.initiate_batch(count)
+                t_start = self.batch_trigger_time
+                expected = count * (self.batch_reading_time or 0.0) * self.BATCH_WAIT_FILL
+                # Attente interruptible, session réservée jusqu'au FETC?
+                stopped = stop_event.wait(expected) if expected > 0 else stop_event.is_set()
+                if stopped:
+                    self.write('ABOR')
+                    return None
+                response = self.query('FETC?')
+            t_end = time.perf_counter()
+
+        values = np.array([v for v in response.split(',') if v.strip()], dtype=float)
+        n = len(values)
+        if n == 0:
+            return values, values.copy()
+        self.batch_reading_time = (t_end - t_start) / n
+        times = t_start + np.arange(1, n + 1) * self.batch_reading_time
+        return values, times
+
+    def initiate_batch(self, count):
+        """
+        Arme count lectures sans attendre le résultat (INIT en une écriture)
+        Args:
+            count (int): Nombre de lectures (1 à 1024)
+        Note: Les lectures se font pendant que le bus sert d'autres
+              instruments; récupération par fetch_batch()
+        """
+        with self.batch(sync=None):
+            self._arm_readings(count)
+            self.write('INIT')
+        self.batch_trigger_time = time.perf_counter()
+
+    def fetch_batch(self):
+        """
+        Récupère les lectures armées par initiate_batch() (attend leur fin)
+        Returns:
+            tuple: (valeurs numpy.ndarray, instant perf_counter de la réponse)
+        """
+        response = self.query('FETC?')
+        t_end = time.perf_counter()
+        values = np.array([v for v in response.split(',') if v.strip()], dtype=float)
+        return values, t_end
+
+    def batch_size(self, duration):
+        """
+        Nombre de lectures d'un lot durant environ duration secondes
+        Args:
+            duration (float): Durée visée d'un lot en secondes
+        Returns:
+            int: Taille de lot (1 à 1024), d'après la durée mesurée du lot précédent
+        """
+        if not self.batch_reading_time:
+            return self.BATCH_CALIBRATION
+        return int(min(self.BATCH_MAX, max(1, duration / self.batch_reading_time)))
+
+    def arm_bus_trigger(self, count=1):
+        """
+        Arme count lectures sur un trigger bus (*TRG ou GET) sans les déclencher
+        Args:
+            count (int): Nombre de lectures après le trigger (1 à 1024)
+        Note: L'instrument attend dans la couche trigger; les lectures
+              démarrent au GET (bus_trigger() ou GET groupé) et se
+              récupèrent par fetch_batch()
+        """
+        with self.batch(sync=None):
+            self._set('TRIG:SOUR', 'BUS')
+            self._set('TRIG:COUN', 1)
+            self.set_sample_count(count)
+            self.write('INIT')
+
+    def bus_trigger(self):
+        """
+        Envoie un trigger bus à cet instrument
+        Returns:
+            float: Instant perf_counter d'émission (milieu de l'appel)
+        Note: GET adressé si l'interface le permet, sinon *TRG
+        """
+        if not self.connected:
+            raise Exception("Instrument non connecté")
+        try:
+            with self._transaction():
+                t_start = time.perf_counter()
+                if hasattr(self.meter, 'assert_trigger'):
+                    self.meter.assert_trigger()
+                else:
+                    self.meter.write('*TRG')
+                t_end = time.perf_counter()
+        except VisaIOError as e:
+            raise Exception(f"Erreur de trigger: {e}")
+        self.batch_trigger_time = (t_start + t_end) / 2
+        return self.batch_trigger_time
+
+    def abort(self, clear=False):
+        """
+        Interrompt la mesure ou l'acquisition buffer en cours (ABOR)
+        Args:
+            clear (bool): Envoie d'abord un device clear (SDC): vide les
+                          tampons d'entrée/sortie et annule une requête en
+                          attente de réponse
+        Note: Les réglages de l'instrument ne sont pas modifiés
+        """
+        if not self.connected:
+            raise Exception("Instrument non connecté")
+        try:
+            with self._transaction():
+                if clear:
+                    self.meter.clear()
+                self.meter.write('ABOR')
+        except VisaIOError as e:
+            raise Exception(f"Erreur d'interruption: {e}")
+
     def initiate_measurement(self):
         """Déclenche une mesure"""
         self.write('INIT')
@@ -242,7 +820,7 @@ class Keithley2000:
     
     def clear_errors(self):
         """Efface les erreurs"""
-        self.write('*CLS')
+        self.write('*CLS')  # N'affecte pas la configuration (cache conservé)
     
     def set_display(self, state):
         """
@@ -250,7 +828,7 @@ class Keithley2000:
         Args:
             state (bool): True pour activer
         """
-        self.write(f'DISP:ENAB {1 if state else 0}')
+        self._set('DISP:ENAB', 1 if state else 0)
     
     def beep(self, frequency=1000, duration=0.1):
         """
@@ -267,14 +845,14 @@ class Keithley2000:
         Args:
             state (bool): True pour activer
         """
-        self.write(f'SYST:AZER:STAT {1 if state else 0}')
+        self._set('SYST:AZER:STAT', 1 if state else 0)
 
     # ===== MÉTHODES BUFFER =====
 
     def buffer_clear(self):
         """Vide le buffer de mesures"""
-        self.write('TRAC:CLE')
-        time.sleep(0.1)
+        with self.batch():
+            self.write('TRAC:CLE')
 
     def buffer_configure(self, points=1024):
         """
@@ -285,26 +863,362 @@ class Keithley2000:
         points = min(points, 1024)  # Limite hardware
         self._buffer_target = points  # Sauvegarder pour buffer_is_complete
 
-        # Séquence de configuration robuste
-        self.write('TRAC:FEED:CONT NEV')  # Arrêter le feed d'abord
-        time.sleep(0.05)
-        self.write('TRAC:CLE')            # Vider le buffer
-        time.sleep(0.05)
-        self.write(f'TRAC:POIN {points}') # Configurer la taille
-        self.write('TRAC:FEED SENS1')     # Source = mesures (SENS1 pas SENS)
-        self.write('TRAC:FEED:CONT NEXT') # Remplir une fois puis arrêter
+        # Séquence de configuration robuste, envoyée en une ligne: les
+        # commandes sont exécutées dans l'ordre, STAT:MEAS? sert de synchro
+        with self.batch(sync='STAT:MEAS?'):  # Effacer un "Buffer Full" resté mémorisé
+            self.write('TRAC:FEED:CONT NEV')  # Arrêter le feed d'abord
+            self.write('TRAC:CLE')            # Vider le buffer
+            self._set('TRAC:POIN', points)    # Configurer la taille
+            self._set('TRAC:FEED', 'SENS1')   # Source = mesures (SENS1 pas SENS)
+            self.write('TRAC:FEED:CONT NEXT') # Remplir une fois puis arrêter
 
-    def buffer_start(self, count=1024):
+    def buffer_start(self, count=1024, timer_interval=None, initiate=True):
         """
-        Lance l'acquisition buffer (mesures au plus vite)
+        Lance l'acquisition buffer
         Args:
             count (int): Nombre de mesures à effectuer
+            timer_interval (float): Si défini, l'instrument se cadence lui-même
+                                    (TRIG:SOUR TIM) avec cette période en s;
+                                    sinon mesures au plus vite (TRIG:SOUR IMM)
+            initiate (bool): False = armement sans INIT (envoyé ensuite par
+                             init_at(), calé sur une grille)
         """
         count = min(count, 1024)
-        self.write('STAT:MEAS:ENAB 512')  # Activer bit "Buffer Full" dans status
-        self.write(f'TRIG:COUN {count}')
-        self.write('TRIG:SOUR IMM')       # Trigger immédiat = au plus vite
+        # Une seule écriture, sans *OPC? (attendrait la fin de l'acquisition)
+        with self.batch(sync=None):
+            self.set_sample_count(1)          # Une lecture par trigger
+            self._set('STAT:MEAS:ENAB', 512)  # Activer bit "Buffer Full" dans status
+            self._set('*SRE', 1)              # Bit MSB (measurement summary) -> SRQ
+            self._set('TRIG:COUN', count)
+            if timer_interval:
+                self.set_trigger_timer(timer_interval)
+                self.set_trigger_source('TIM')
+            else:
+                self.set_trigger_source('IMM')  # Trigger immédiat = au plus vite
+            if initiate:
+                self.write('INIT')
+        self.buffer_timer_interval = timer_interval
+        if initiate:
+            self.buffer_trigger_time = time.perf_counter()
+
+    def buffer_rearm(self, initiate=True):
+        """
+        Réarme le buffer pour un nouveau bloc de même taille
+        Args:
+            initiate (bool): False = sans INIT (voir init_at)
+        Note: Plus rapide que buffer_configure() + buffer_start(): la taille,
+              la source et le nombre de triggers sont conservés
+        """
+        with self.batch(sync=None):
+            self.write('TRAC:CLE')
+            self.write('TRAC:FEED:CONT NEXT')
+            if initiate:
+                self.write('INIT')
+        if initiate:
+            self.buffer_trigger_time = time.perf_counter()
+
+    def init_at(self, at, stop_event=None):
+        """
+        Envoie INIT pour que le premier trigger tombe à l'instant at
+        En mode timer (TRIG:SOUR TIM), le premier trigger part dès INIT:
+        l'envoi est retardé jusqu'à at, moins la durée mesurée de l'écriture
+        Args:
+            at (float): Instant visé (horloge perf_counter)
+            stop_event (threading.Event): Abandonne l'attente s'il est levé
+        Returns:
+            float: Glissement en s (fin de l'écriture de INIT - at, positif
+                   si en retard), ou None si arrêt demandé (INIT non envoyé)
+        Note: buffer_trigger_time reçoit at: les lectures du bloc sont
+              horodatées sur la grille (voir buffer_timestamps)
+        """
+        remaining = at - self.init_write_time - time.perf_counter()
+        if remaining > 0:
+            if stop_event is not None:
+                if stop_event.wait(remaining):
+                    return None
+            else:
+                time.sleep(remaining)
+        elif stop_event is not None and stop_event.is_set():
+            return None
+        t_start = time.perf_counter()
         self.write('INIT')
+        t_end = time.perf_counter()
+        self.init_write_time = t_end - t_start
+        self.buffer_trigger_time = at
+        return t_end - at
+
+    def _buffer_arm_state(self):
+        """Réglages connus du trigger et du buffer (None si inconnus)"""
+        return tuple(self.state.get(header) for header in self.BUFFER_ARM_HEADERS)
+
+    def buffer_stream(self, chunk_points=1024, max_points=None, should_stop=None,
+                      poll_interval=0.01, timer_interval=None, stop_event=None):
+        """
+        Acquisition continue au-delà de la limite de 1024 points
+        Le buffer est rempli, vidé puis réarmé en boucle; chaque bloc est
+        renvoyé avec le temps mort qui le précède (réarmement + lecture)
+        Args:
+            chunk_points (int): Taille d'un bloc (max 1024)
+            max_points (int): Nombre total de points (None = infini)
+            should_stop (callable): Retourne True pour interrompre le flux
+            poll_interval (float): Période de scrutation du buffer (s)
+            timer_interval (float): Période du timer instrument (None = au
+                                    plus vite, voir buffer_start)
+            stop_event (threading.Event): Interrompt le flux dès qu'il est levé
+        Yields:
+            dict: Bloc {'index', 'values', 'times', 't_start', 't_end',
+                  'dead_time', 'lost_samples', 'slip'} (temps en secondes,
+                  horloge perf_counter)
+        Note: En mode timer, les blocs suivent une grille absolue partant du
+              premier trigger: l'INIT de chaque bloc est envoyé au prochain
+              tick encore atteignable (init_at), les ticks sautés sont des
+              points perdus et 'slip' est l'écart mesuré entre l'envoi de
+              INIT et le tick visé. Les compteurs cumulés sont disponibles
+              dans self.stream_stats (glissement maximal et cumulé en valeur
+              absolue: 'slip_max', 'slip_total')
+        """
+        chunk_points = min(chunk_points, 1024)
+        self.stream_stats = {
+            'chunks': 0,
+            'samples': 0,
+            'dead_time': 0.0,
+            'lost_samples': 0,
+            'slip_max': 0.0,
+            'slip_total': 0.0
+        }
+        armed_points = None
+        armed_state = None
+        previous_end = None
+        grid_start = None  # Instant du tick 0 de la grille timer
+        grid_index = 0     # Tick attendu pour le premier point du bloc suivant
+
+        while max_points is None or self.stream_stats['samples'] < max_points:
+            if should_stop and should_stop() or stop_event is not None and stop_event.is_set():
+                return
+
+            points = chunk_points
+            if max_points is not None:
+                points = min(chunk_points, max_points - self.stream_stats['samples'])
+
+            # Armement -> lecture dans une capture; la session est rendue
+            # entre deux blocs (commandes des autres threads)
+            with self.capture():
+                # Mode timer après le premier bloc: INIT calé sur la grille
+                on_grid = bool(timer_interval) and grid_start is not None
+
+                # Armement complet si la taille du bloc change ou si un autre
+                # thread a modifié le trigger ou le buffer depuis le bloc précédent
+                if points == armed_points and self._buffer_arm_state() == armed_state:
+                    self.buffer_rearm(initiate=not on_grid)
+                else:
+                    self.buffer_configure(points)
+                    self.buffer_start(points, timer_interval, initiate=not on_grid)
+                    armed_points = points
+                    armed_state = self._buffer_arm_state()
+
+                slip = 0.0
+                tick = grid_index
+                if on_grid:
+                    # Prochain tick encore atteignable (jamais avant le tick attendu)
+                    earliest = time.perf_counter() + self.init_write_time + self.GRID_ARM_MARGIN
+                    tick = max(grid_index, math.ceil((earliest - grid_start) / timer_interval))
+                    slip = self.init_at(grid_start + tick * timer_interval, stop_event)
+                    if slip is None:
+                        return
+                elif timer_interval:
+                    grid_start = self.buffer_trigger_time
+
+                if not self.buffer_wait_complete(should_stop=should_stop,
+                                                 poll_interval=poll_interval,
+                                                 stop_event=stop_event):
+                    self.write('ABOR')
+                    return
+                t_start = self.buffer_trigger_time
+                t_end = self.buffer_full_time
+
+                values = self.buffer_read()
+            if len(values) == 0:
+                continue
+
+            if timer_interval:
+                # Grille du timer: temps mort = ticks sautés entre deux blocs
+                lost_samples = tick - grid_index
+                dead_time = lost_samples * timer_interval
+                grid_index = tick + len(values)
+                t_end = t_start + len(values) * timer_interval
+            else:
+                # Temps mort entre la fin du bloc précédent et le début de celui-ci
+                sample_period = (t_end - t_start) / len(values)
+                dead_time = t_start - previous_end if previous_end is not None else 0.0
+                lost_samples = int(round(dead_time / sample_period)) if sample_period > 0 else 0
+                previous_end = t_end
+
+            self.stream_stats['chunks'] += 1
+            self.stream_stats['samples'] += len(values)
+            self.stream_stats['dead_time'] += dead_time
+            self.stream_stats['lost_samples'] += lost_samples
+            self.stream_stats['slip_max'] = max(self.stream_stats['slip_max'], abs(slip))
+            self.stream_stats['slip_total'] += abs(slip)
+
+            yield {
+                'index': self.stream_stats['chunks'] - 1,
+                'values': values,
+                'times': t_start + self.buffer_timestamps(len(values)),
+                't_start': t_start,
+                't_end': t_end,
+                'dead_time': dead_time,
+                'lost_samples': lost_samples,
+                'slip': slip
+            }
+
+    def buffer_timestamps(self, count):
+        """
+        Calcule l'instant de chaque lecture du dernier remplissage du buffer
+        Le Keithley 2000 ne stocke pas d'horodatage avec les lectures
+        (FORM:ELEM = READ, CHAN, UNIT): l'intervalle réel trigger -> buffer
+        plein est mesuré (INIT dans buffer_start, détection dans
+        buffer_wait_complete) puis réparti sur les lectures, cadencées par
+        l'instrument lui-même. En mode timer, la grille de l'instrument
+        (premier trigger à INIT puis un toutes les périodes) est utilisée,
+        depuis buffer_trigger_time (tick visé par init_at en streaming)
+        Args:
+            count (int): Nombre de lectures dans le buffer
+        Returns:
+            numpy.ndarray: Instant de chaque lecture en secondes depuis le trigger
+        """
+        if self.buffer_timer_interval:
+            return np.arange(count) * self.buffer_timer_interval
+
+        t_trigger = self.buffer_trigger_time
+        t_full = self.buffer_full_time
+        if count == 0 or t_trigger is None or t_full is None or t_full <= t_trigger:
+            return np.zeros(count)
+        period = (t_full - t_trigger) / count
+        return np.arange(1, count + 1) * period
+
+    def buffer_read_timed(self, data_format='SREAL'):
+        """
+        Lit le buffer avec les instants de chaque lecture
+        Args:
+            data_format (str): Format de transfert (voir buffer_read)
+        Returns:
+            tuple: (valeurs, instants) en numpy.ndarray; instants en secondes
+                   depuis le trigger (voir buffer_timestamps)
+        """
+        values = self.buffer_read(data_format)
+        return values, self.buffer_timestamps(len(values))
+
+    def buffer_wait_complete(self, timeout=None, should_stop=None, poll_interval=0.1,
+                             use_srq=True, stop_event=None):
+        """
+        Attend la fin de l'acquisition buffer
+        Utilise la demande de service (SRQ, bit "Buffer Full" activé par
+        buffer_start) si le backend VISA le permet, sinon scrute le buffer
+        Args:
+            timeout (float): Attente maximale en secondes (None = illimitée)
+            should_stop (callable): Retourne True pour abandonner l'attente
+            poll_interval (float): Période de scrutation en mode repli (s)
+            use_srq (bool): False pour forcer la scrutation
+            stop_event (threading.Event): Abandonne l'attente dès qu'il est
+                                          levé (réveille aussi la scrutation)
+        Returns:
+            bool: True si le buffer est plein, False si timeout ou arrêt
+        Note: self.last_wait_stats contient la méthode utilisée, la durée
+              d'attente et la latence de détection après buffer plein (s)
+        """
+        t_begin = time.perf_counter()
+        deadline = t_begin + timeout if timeout is not None else None
+        if stop_event is not None:
+            user_stop = should_stop
+
+            def should_stop():
+                return stop_event.is_set() or bool(user_stop and user_stop())
+
+        if use_srq and self.srq_supported is not False:
+            try:
+                slice_time = poll_interval
+                if stop_event is not None:
+                    slice_time = min(poll_interval, self.SRQ_STOP_SLICE)
+                result = self._wait_srq(t_begin, deadline, should_stop, slice_time)
+                self.srq_supported = True
+                return result
+            except NotImplementedError:
+                # Backend sans support des événements: repli sur la scrutation
+                self.srq_supported = False
+
+        return self._wait_poll(t_begin, deadline, should_stop, poll_interval, stop_event)
+
+    def _wait_srq(self, t_begin, deadline, should_stop, slice_time):
+        """Attente de fin de buffer sur événement SRQ (voir buffer_wait_complete)"""
+        event_type = constants.EventType.service_request
+        try:
+            self.meter.enable_event(event_type, constants.EventMechanism.queue)
+        except (VisaIOError, AttributeError, NotImplementedError) as e:
+            raise NotImplementedError(str(e))
+
+        try:
+            while True:
+                if should_stop and should_stop():
+                    return False
+                now = time.perf_counter()
+                if deadline is not None and now >= deadline:
+                    return False
+
+                wait = slice_time if deadline is None else min(slice_time, deadline - now)
+                try:
+                    self.meter.wait_on_event(event_type, max(1, int(wait * 1000)))
+                except VisaIOError as e:
+                    if e.error_code == constants.StatusCode.error_timeout:
+                        continue
+                    raise Exception(f"Erreur d'attente SRQ: {e}")
+                t_event = time.perf_counter()
+
+                # Poll série (acquitte le SRQ) puis lecture/effacement du registre
+                with self._transaction():
+                    stb = self.meter.read_stb()
+                if stb & 1 and int(self.query('STAT:MEAS?')) & 512:
+                    t_done = time.perf_counter()
+                    self.buffer_full_time = t_event
+                    self.last_wait_stats = {
+                        'method': 'srq',
+                        'wait': t_done - t_begin,
+                        'latency': t_done - t_event
+                    }
+                    return True
+        finally:
+            try:
+                self.meter.disable_event(event_type, constants.EventMechanism.queue)
+                self.meter.discard_events(event_type, constants.EventMechanism.queue)
+            except Exception:
+                pass
+
+    def _wait_poll(self, t_begin, deadline, should_stop, poll_interval, stop_event=None):
+        """Attente de fin de buffer par scrutation (voir buffer_wait_complete)"""
+        last_check = t_begin
+        while True:
+            if should_stop and should_stop():
+                return False
+            if self.buffer_is_complete():
+                t_done = time.perf_counter()
+                try:
+                    self.query('STAT:MEAS?')  # Efface l'événement "Buffer Full"
+                except Exception:
+                    pass
+                # Le buffer s'est rempli entre les deux dernières vérifications
+                self.buffer_full_time = (last_check + t_done) / 2
+                self.last_wait_stats = {
+                    'method': 'poll',
+                    'wait': t_done - t_begin,
+                    'latency': t_done - last_check
+                }
+                return True
+            last_check = time.perf_counter()
+            if deadline is not None and last_check >= deadline:
+                return False
+            if stop_event is not None:
+                stop_event.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
 
     def buffer_is_complete(self):
         """
@@ -338,22 +1252,77 @@ class Keithley2000:
         except:
             return 0
 
-    def buffer_read(self):
+    def buffer_read(self, data_format='SREAL'):
         """
         Lit toutes les données du buffer
+        Args:
+            data_format (str): 'SREAL' ou 'DREAL' pour un transfert binaire
+                               (bloc IEEE-488.2), 'ASC' pour le transfert texte
         Returns:
-            list: Liste des valeurs mesurées
+            numpy.ndarray: Valeurs mesurées
+        Note: En cas d'échec du transfert binaire, repli automatique sur l'ASCII
         """
-        # Arrêter l'acquisition si en cours
-        self.write('ABOR')
-        time.sleep(0.1)
+        # Arrêter l'acquisition si en cours: ABOR part sur la même ligne que
+        # la lecture (exécution séquentielle, aucune attente nécessaire)
+        with self.batch(sync=None):
+            self.write('ABOR')
+
+            if data_format in self.BINARY_FORMATS:
+                try:
+                    return self._buffer_read_binary(data_format)
+                except Exception:
+                    # Repli sur le transfert ASCII (format remis à ASC ci-dessous)
+                    # après un device clear: un bloc binaire reçu en partie
+                    # serait sinon lu comme la réponse texte
+                    self._clear_output()
+
+            return self._buffer_read_ascii()
 
+    def _buffer_read_binary(self, data_format):
+        """
+        Lit le buffer en binaire et décode directement dans un tableau numpy
+        Args:
+            data_format (str): 'SREAL' ou 'DREAL'
+        Returns:
+            numpy.ndarray: Valeurs mesurées
+        """
+        # FORM:BORD SWAP = little-endian, décodé sans permutation sur PC x86
+        self._set('FORM:ELEM', 'READ')
+        self._set('FORM:DATA', data_format)
+        self._set('FORM:BORD', 'SWAP')
+        try:
+            with self._transaction():
+                return self.meter.query_binary_values(
+                    self._take_pending('TRAC:DATA?'),
+                    datatype=self.BINARY_FORMATS[data_format],
+                    is_big_endian=False,
+                    container=np.array
+                )
+        except VisaIOError as e:
+            raise Exception(f"Erreur de lecture binaire: {e}")
+        finally:
+            # Toujours revenir en ASCII: READ?/FETC? sont lus en texte
+            self._set('FORM:DATA', 'ASC')
+
+    def _clear_output(self):
+        """Device clear (SDC): vide les réponses en attente, réglages conservés"""
+        try:
+            with self._transaction():
+                self.meter.clear()
+        except (VisaIOError, AttributeError):
+            pass
+
+    def _buffer_read_ascii(self):
+        """
+        Lit le buffer en ASCII (format historique "val1,val2,...")
+        Returns:
+            numpy.ndarray: Valeurs mesurées
+        """
+        self._set('FORM:DATA', 'ASC')
         response = self.query('TRAC:DATA?')
-        # Réponse format: "val1,val2,val3,..."
         if not response or response.strip() == '':
-            return []
-        values = [float(v) for v in response.split(',') if v.strip()]
-        return values
+            return np.array([])
+        return np.array([v for v in response.split(',') if v.strip()], dtype=float)
 
     def get_unit(self):
         """
@@ -361,81 +1330,203 @@ class Keithley2000:
         Returns:
             str: Unité
         """
-        func = self.query('FUNC?').strip('"')
-        units = {
-            'VOLT:DC': 'V',
-            'VOLT:AC': 'V',
-            'CURR:DC': 'A',
-            'CURR:AC': 'A',
-            'RES': 'Ω',
-            'FRES': 'Ω',
-            'FREQ': 'Hz',
-            'PER': 's',
-            'TEMP': '°C',
-            'DIOD': 'V',
-            'CONT': 'Ω'
-        }
-        return units.get(func, '')
+        return self.UNITS.get(self.get_function(), '')
     
     @staticmethod
-    def list_resources(verify=True, timeout=1000, filter_keithley=True):
+    def list_resources(verify=True, timeout=1000, filter_keithley=True, on_found=None,
+                       max_workers=DISCOVERY_WORKERS, deadline=None):
         """
         Liste les ressources VISA disponibles
         Args:
             verify (bool): Si True, vérifie que l'instrument répond (*IDN?)
             timeout (int): Timeout en ms pour la vérification
             filter_keithley (bool): Si True, ne garde que les Keithley série 2000
+            on_found (callable): Appelé avec chaque chaîne "adresse - modèle"
+                                 dès qu'un instrument répond (thread du scan)
+            max_workers (int): Nombre maximal de vérifications simultanées
+            deadline (float): Durée maximale du scan de chaque interface
+                              (GPIB0, USB0...) en secondes, décomptée à
+                              partir de sa première vérification, None = sans limite
         Returns:
             list: Liste des chaînes "adresse - modèle" pour les instruments compatibles
+        Note: Si la variable d'environnement KEITHLEY2000_SIM est définie,
+              les instruments simulés sont ajoutés à la liste. En cas
+              d'erreur, les instruments déjà trouvés sont conservés
         """
+        simulated = []
+        if os.environ.get(Keithley2000.SIMULATOR_ENV):
+            simulated = [f"{r} - MODEL 2000 (simulé)" if verify else r
+                         for r in SIMULATED_RESOURCES]
+        found = []
         try:
-            rm = pyvisa.ResourceManager()
+            rm = resource_manager()
             all_resources = list(rm.list_resources())
 
             if not verify:
-                return all_resources
+                return all_resources + simulated
 
-            # Trier pour avoir les adresses simples (sans secondary) en premier
+            # Une tâche par adresse physique: l'adresse primaire d'abord,
+            # les adresses secondaires seulement si elle ne répond pas
             # Ex: GPIB0::16::INSTR avant GPIB0::16::0::INSTR
-            def address_priority(addr):
-                # Compter le nombre de :: pour déterminer la complexité
-                return addr.count('::')
+            groups = {}
+            for resource in sorted(all_resources, key=lambda addr: addr.count('::')):
+                groups.setdefault(Keithley2000._physical_address(resource), []).append(resource)
 
-            sorted_resources = sorted(all_resources, key=address_priority)
+            # Échéance propre à chaque interface, et tâches alternées entre
+            # interfaces: une interface lente (adresses muettes) ne retarde
+            # pas le début du scan des autres
+            by_interface = {}
+            for key, candidates in groups.items():
+                by_interface.setdefault(key[0], []).append(candidates)
+            deadlines = {interface: None if deadline is None else _InterfaceDeadline(deadline)
+                         for interface in by_interface}
+            per_interface = [[(interface, candidates) for candidates in groups_list]
+                             for interface, groups_list in by_interface.items()]
+            tasks = []
+            for row in itertools.zip_longest(*per_interface):
+                tasks.extend(task for task in row if task is not None)
 
-            # Vérifier chaque ressource et éliminer les doublons
-            # (même instrument accessible via plusieurs adresses secondaires)
-            verified_resources = []
+            # Vérifier les adresses en parallèle et éliminer les doublons
+            # (même instrument accessible via plusieurs adresses)
             seen_idn = set()
 
-            for resource in sorted_resources:
-                try:
-                    instr = rm.open_resource(resource)
-                    instr.timeout = timeout
-                    idn = instr.query('*IDN?').strip()
-                    instr.close()
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [executor.submit(Keithley2000._probe_address, rm, candidates,
+                                           timeout, deadlines[interface])
+                           for interface, candidates in tasks]
+
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception:
+                        continue
+                    if result is None:
+                        continue
+                    resource, idn = result
 
                     # Ne garder que si c'est un nouvel instrument
-                    if idn not in seen_idn:
-                        seen_idn.add(idn)
-
-                        # Extraire le modèle du IDN (format: MANUFACTURER,MODEL,SERIAL,VERSION)
-                        idn_parts = idn.split(',')
-                        manufacturer = idn_parts[0] if len(idn_parts) > 0 else ''
-                        model = idn_parts[1] if len(idn_parts) > 1 else ''
-
-                        # Filtrer pour Keithley série 2000
-                        if filter_keithley:
-                            if 'KEITHLEY' in manufacturer.upper() and '2000' in model.upper():
-                                display_name = f"{resource} - {model.strip()}"
-                                verified_resources.append(display_name)
-                        else:
-                            display_name = f"{resource} - {manufacturer.strip()} {model.strip()}"
-                            verified_resources.append(display_name)
-                except:
-                    # L'instrument ne répond pas, on l'ignore
-                    pass
+                    if idn in seen_idn:
+                        continue
+                    seen_idn.add(idn)
 
-            return verified_resources
-        except:
-            return []
+                    display_name = Keithley2000.display_name(resource, idn, filter_keithley)
+                    if display_name is None:
+                        continue
+
+                    found.append(display_name)
+                    if on_found:
+                        on_found(display_name)
+
+            # Ordre stable indépendant de l'ordre des réponses
+            found.sort(key=lambda name: all_resources.index(name.split(' - ')[0]))
+        except Exception:
+            # Bibliothèque VISA absente, scan interrompu: résultats partiels
+            pass
+
+        for display_name in simulated:
+            if on_found:
+                on_found(display_name)
+        return found + simulated
+
+    @staticmethod
+    def display_name(resource, idn, filter_keithley=True):
+        """
+        Chaîne "adresse - modèle" affichée pour un instrument
+        Args:
+            resource (str): Adresse VISA
+            idn (str): Réponse à *IDN?
+            filter_keithley (bool): Si True, None pour un autre modèle que Keithley série 2000
+        Returns:
+            str: Chaîne affichée, ou None si l'instrument est filtré
+        """
+        # Extraire le modèle du IDN (format: MANUFACTURER,MODEL,SERIAL,VERSION)
+        idn_parts = idn.split(',')
+        manufacturer = idn_parts[0] if len(idn_parts) > 0 else ''
+        model = idn_parts[1] if len(idn_parts) > 1 else ''
+
+        # Filtrer pour Keithley série 2000
+        if filter_keithley:
+            if not ('KEITHLEY' in manufacturer.upper() and '2000' in model.upper()):
+                return None
+            return f"{resource} - {model.strip()}"
+        return f"{resource} - {manufacturer.strip()} {model.strip()}"
+
+    @staticmethod
+    def probe_resources(resources, timeout=300, max_workers=DISCOVERY_WORKERS):
+        """
+        Vérifie rapidement des adresses connues (une requête *IDN? chacune, en parallèle)
+        Args:
+            resources (list): Adresses VISA (ex: issues du cache de détection)
+            timeout (int): Timeout en ms par adresse
+            max_workers (int): Nombre maximal de vérifications simultanées
+        Returns:
+            dict: Adresse -> réponse *IDN? pour les instruments qui ont répondu
+        """
+        rm = None
+        if any(not r.upper().startswith(SIMULATOR_PREFIX) for r in resources):
+            try:
+                rm = resource_manager()
+            except Exception:
+                # Pas de bibliothèque VISA: seules les adresses simulées répondent
+                resources = [r for r in resources if r.upper().startswith(SIMULATOR_PREFIX)]
+
+        results = {}
+        if not resources:
+            return results
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [executor.submit(Keithley2000._probe_address, rm, [r], timeout, None)
+                       for r in resources]
+            for future in as_completed(futures):
+                result = future.result()
+                if result is not None:
+                    results[result[0]] = result[1]
+        return results
+
+    @staticmethod
+    def _physical_address(resource):
+        """
+        Clé d'adresse physique d'une ressource
+        Args:
+            resource (str): Ressource VISA (ex: 'GPIB0::16::0::INSTR')
+        Returns:
+            tuple: (interface, adresse primaire) pour GPIB, (interface, ressource) sinon
+        """
+        parts = resource.split('::')
+        interface = parts[0]
+        if interface.upper().startswith('GPIB') and len(parts) >= 3:
+            return interface, parts[1]
+        return interface, resource
+
+    @staticmethod
+    def _probe_address(rm, candidates, timeout, deadline):
+        """
+        Interroge les adresses d'un même instrument jusqu'à la première réponse
+        Args:
+            rm: ResourceManager pyvisa
+            candidates (list): Adresse primaire puis adresses secondaires
+            timeout (int): Timeout en ms par adresse
+            deadline (_InterfaceDeadline): Échéance de l'interface (None = aucune)
+        Returns:
+            tuple: (ressource, réponse *IDN?) ou None si aucune ne répond
+        """
+        for resource in candidates:
+            probe_timeout = timeout
+            if deadline is not None:
+                remaining = deadline.remaining()
+                if remaining <= 0:
+                    return None
+                probe_timeout = max(1, min(timeout, int(remaining * 1000)))
+            try:
+                if resource.upper().startswith(SIMULATOR_PREFIX):
+                    instr = SimulatedKeithley2000(resource)
+                else:
+                    instr = rm.open_resource(resource)
+                try:
+                    instr.timeout = probe_timeout
+                    return resource, instr.query('*IDN?').strip()
+                finally:
+                    instr.close()
+            except:
+                # L'instrument ne répond pas à cette adresse
+                pass
+        return None
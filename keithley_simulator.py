@@ -0,0 +1,986 @@
+"""
+Simulateur de Keithley 2000 pour tests et mesures de performance hors ligne
+Imite une ressource pyvisa (write/query/read, blocs binaires, SRQ, GET) et
+le sous-ensemble SCPI utilisé par Keithley2000: CONF, NPLC, RANG, AVER,
+TRIG, SAMP, INIT/ABOR/FETC/READ, TRAC:*, FORM:*, STAT:MEAS, *STB?, *SRE,
+*OPC?, *TRG, SYST:ERR?...
+Les durées suivent un modèle de latence (NPLC, autozero, affichage,
+filtre, bus) pour que les débits mesurés soient réalistes et reproductibles
+
+Utilisation: Keithley2000().connect('SIM0::16::INSTR')
+"""
+import threading
+import time
+
+import numpy as np
+from pyvisa import constants, util
+from pyvisa.errors import VisaIOError
+
+# Préfixe des adresses simulées (ex: 'SIM0::16::INSTR')
+SIMULATOR_PREFIX = 'SIM'
+
+# Ressources proposées par Keithley2000.list_resources() en mode simulé
+SIMULATED_RESOURCES = ['SIM0::16::INSTR']
+
+# Modèle de latence par défaut (secondes, Hz, octets/s)
+DEFAULT_LATENCY = {
+    'line_frequency': 50.0,     # Fréquence secteur (1 PLC = 20 ms)
+    'reading_overhead': 0.0003, # Conversion + traitement par lecture
+    'autozero_factor': 1.2,     # Multiplicateur d'intégration si autozero actif
+    'display_overhead': 0.0003, # Mise à jour de l'écran par lecture
+    'ac_reading_time': 0.05,    # Lecture ACV/ACI/FREQ/PER (pas de NPLC)
+    'read_overhead': 0.002,     # Traitement de READ? (ABOR + INIT + FETC)
+    'bus_overhead': 0.0005,     # Adressage + retournement GPIB par transfert
+    'bus_speed': 500e3,         # Débit du bus en octets/s
+    'command_time': 0.0002      # Analyse d'une commande SCPI
+}
+
+# Fonctions de mesure: valeur nominale et bruit à 1 PLC
+FUNCTIONS = {
+    'VOLT:DC': (1.0, 1e-6),
+    'VOLT:AC': (1.0, 1e-5),
+    'CURR:DC': (1e-3, 1e-9),
+    'CURR:AC': (1e-3, 1e-8),
+    'RES': (1000.0, 1e-3),
+    'FRES': (1000.0, 5e-4),
+    'FREQ': (1000.0, 1e-3),
+    'PER': (1e-3, 1e-9),
+    'TEMP': (23.0, 1e-3),
+    'DIOD': (0.6, 1e-5),
+    'CONT': (0.5, 1e-3)
+}
+
+# Fonctions dont le temps d'intégration se règle en NPLC
+NPLC_FUNCTIONS = {'VOLT:DC', 'CURR:DC', 'RES', 'FRES', 'TEMP'}
+
+# Bit "Buffer Full" du registre d'événements de mesure
+BUFFER_FULL = 512
+
+# Nombre de lectures pour un compteur infini (TRIG:COUN INF)
+INFINITE_COUNT = 10 ** 9
+
+
+def short_form(token):
+    """
+    Forme courte SCPI d'un mot-clé (VOLTage -> VOLT, TRIGger -> TRIG)
+    Args:
+        token (str): Mot-clé en majuscules, suffixe numérique éventuel
+    Returns:
+        str: Forme courte avec son suffixe (SENSE1 -> SENS1)
+    """
+    if token.startswith('*'):
+        return token
+    suffix = ''
+    while token and token[-1].isdigit():
+        suffix = token[-1] + suffix
+        token = token[:-1]
+    if len(token) > 4:
+        token = token[:4]
+        if token[3] in 'AEIOU':
+            token = token[:3]
+    return token + suffix
+
+
+def normalize_header(header):
+    """
+    Normalise un en-tête SCPI: formes courtes, SENSe implicite, VOLT -> VOLT:DC
+    Args:
+        header (str): En-tête (ex: 'SENSe:VOLTage:DC:NPLCycles')
+    Returns:
+        str: En-tête normalisé (ex: 'VOLT:DC:NPLC')
+    """
+    nodes = [short_form(n) for n in header.upper().strip(':').split(':') if n]
+    if nodes and nodes[0] in ('SENS', 'SENS1') and len(nodes) > 1:
+        nodes = nodes[1:]
+    if nodes and nodes[0] in ('VOLT', 'CURR') and (len(nodes) == 1 or nodes[1] not in ('DC', 'AC')):
+        nodes.insert(1, 'DC')
+    return ':'.join(nodes)
+
+
+def split_function(header):
+    """
+    Sépare la fonction de mesure en tête d'un en-tête normalisé
+    Args:
+        header (str): En-tête normalisé (ex: 'VOLT:DC:NPLC')
+    Returns:
+        tuple: (fonction, reste) ou (None, header)
+    """
+    for func in FUNCTIONS:
+        if header == func:
+            return func, ''
+        if header.startswith(func + ':'):
+            return func, header[len(func) + 1:]
+    return None, header
+
+
+def parse_bool(arg):
+    """Argument booléen SCPI (ON/OFF/1/0)"""
+    return arg.strip().upper() in ('ON', '1')
+
+
+def parse_count(arg):
+    """Compteur SCPI (entier, INF, MIN, MAX)"""
+    arg = arg.strip().upper()
+    if arg.startswith('INF'):
+        return INFINITE_COUNT
+    if arg.startswith('MIN'):
+        return 1
+    if arg.startswith('MAX'):
+        return 1024
+    return int(float(arg))
+
+
+class ScpiError(Exception):
+    """Erreur SCPI placée dans la file d'erreurs du simulateur"""
+
+    def __init__(self, code, message):
+        super().__init__(f'{code},"{message}"')
+        self.code = code
+
+
+class _Acquisition:
+    """Séquence de lectures déclenchée par INIT (modèle de trigger)"""
+
+    def __init__(self, t_init, total, samples, reading_time, source, timer, feed_buffer):
+        self.t_init = t_init
+        self.total = total                # Nombre total de lectures attendu
+        self.samples = samples            # Lectures par trigger (SAMP:COUN)
+        self.reading_time = reading_time  # Durée d'une lecture
+        self.source = source              # Source de trigger (IMM/TIM/BUS/EXT)
+        self.timer = timer                # Période TRIG:TIM
+        self.feed_buffer = feed_buffer    # Alimente le buffer (FEED:CONT NEXT)
+        self.triggers = []                # Instants des triggers BUS reçus
+        self.end_time = None              # Fixé par ABOR
+
+    def trigger_time(self, j):
+        """Instant du trigger j, ou None s'il n'a pas (encore) eu lieu"""
+        burst = self.samples * self.reading_time
+        if self.source == 'IMM':
+            return self.t_init + j * burst
+        if self.source == 'TIM':
+            return self.t_init + j * max(self.timer, burst)
+        if self.source == 'BUS' and j < len(self.triggers):
+            return self.triggers[j]
+        return None
+
+    def reading_done_time(self, k):
+        """Instant de fin de la lecture k, ou None si jamais atteinte"""
+        if k >= self.total:
+            return None
+        t = self.trigger_time(k // self.samples)
+        if t is None:
+            return None
+        t += (k % self.samples + 1) * self.reading_time
+        if self.end_time is not None and t > self.end_time:
+            return None
+        return t
+
+    def done_count(self, now):
+        """Nombre de lectures terminées à l'instant now"""
+        if self.reading_time <= 0:
+            if self.source in ('IMM', 'TIM'):
+                return self.total
+            return min(self.total, len(self.triggers) * self.samples)
+        # Recherche dichotomique (les lectures sont ordonnées dans le temps)
+        low, high = 0, self.total
+        while low < high:
+            mid = (low + high) // 2
+            t = self.reading_done_time(mid)
+            if t is not None and t <= now:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+
+class SimulatedKeithley2000:
+    """Ressource VISA simulée d'un Keithley 2000"""
+
+    # Modèle de latence modifiable globalement avant connexion
+    default_latency = dict(DEFAULT_LATENCY)
+
+    def __init__(self, resource_name='SIM0::16::INSTR', latency=None, time_scale=1.0, seed=0):
+        """
+        Args:
+            resource_name (str): Adresse simulée
+            latency (dict): Surcharges du modèle de latence
+            time_scale (float): Facteur appliqué à toutes les durées
+                                (0 = instantané, 1 = temps réel)
+            seed (int): Graine du générateur de bruit (reproductibilité)
+        """
+        self.resource_name = resource_name
+        self.timeout = 5000
+        self.latency = dict(self.default_latency)
+        if latency:
+            self.latency.update(latency)
+        self.time_scale = time_scale
+        self.rng = np.random.default_rng(seed)
+
+        self.lock = threading.RLock()
+        self._output = []           # Réponses en attente: (instant dispo, données)
+        self._srq_enabled = False
+        self._srq_ack_time = -float('inf')
+        self.last_trigger_time = None
+        self.transactions = 0       # Nombre de transferts sur le bus
+        self.bytes_transferred = 0  # Octets transférés (commandes + réponses)
+        self.closed = False
+        self._reset_state()
+
+    # ===== ÉTAT INSTRUMENT =====
+
+    def _reset_state(self):
+        """État après *RST"""
+        self.state = {
+            'func': 'VOLT:DC',
+            'nplc': {func: 1.0 for func in NPLC_FUNCTIONS},
+            'range': {func: 0.0 for func in FUNCTIONS},
+            'range_auto': {func: True for func in FUNCTIONS},
+            'aver_state': False,
+            'aver_count': 10,
+            'aver_tcon': 'MOV',
+            'trig_source': 'IMM',
+            'trig_count': 1,
+            'trig_timer': 0.1,
+            'trig_delay': 0.0,
+            'samp_count': 1,
+            'init_cont': False,
+            'display': True,
+            'azero': True,
+            'form_data': 'ASC',
+            'form_bord': 'NORM',
+            'form_elem': 'READ',
+            'trac_points': 1024,
+            'trac_feed': 'SENS1',
+            'trac_feed_cont': 'NEV',
+            'meas_enable': 0,
+            'sre': 0,
+            'null_state': False,
+            'null_offset': 0.0
+        }
+        self._errors = []
+        self._meas_events = 0
+        self._acq = None            # Acquisition en cours ou terminée
+        self._readings = np.array([])
+        self._buffer = np.array([])
+        self._bfl_latched = False
+        self._bfl_time = None       # Instant où le buffer s'est rempli
+
+    def reading_time(self):
+        """
+        Durée d'une lecture selon la configuration courante
+        Returns:
+            float: Secondes par lecture (modèle, avant time_scale)
+        """
+        lat = self.latency
+        func = self.state['func']
+        if func in NPLC_FUNCTIONS:
+            t = self.state['nplc'][func] / lat['line_frequency']
+            if self.state['azero']:
+                t *= lat['autozero_factor']
+        else:
+            t = lat['ac_reading_time']
+        t += lat['reading_overhead']
+        if self.state['display']:
+            t += lat['display_overhead']
+        if self.state['aver_state'] and self.state['aver_tcon'] == 'REP':
+            t *= self.state['aver_count']
+        return t
+
+    def _now(self):
+        return time.perf_counter()
+
+    def _sleep(self, duration):
+        if duration > 0:
+            time.sleep(duration)
+
+    def _scaled(self, duration):
+        return duration * self.time_scale
+
+    def _bus_time(self, nbytes):
+        """Durée d'un transfert sur le bus (temps réel)"""
+        lat = self.latency
+        return self._scaled(lat['bus_overhead'] + nbytes / lat['bus_speed'])
+
+    def _generate(self, count):
+        """Génère count lectures bruitées pour la fonction courante"""
+        func = self.state['func']
+        nominal, noise = FUNCTIONS[func]
+        nplc = self.state['nplc'].get(func, 1.0)
+        sigma = noise / np.sqrt(max(nplc, 0.01))
+        if self.state['aver_state']:
+            sigma /= np.sqrt(self.state['aver_count'])
+        values = nominal + sigma * self.rng.standard_normal(count)
+        if self.state['null_state']:
+            values -= self.state['null_offset']
+        return values
+
+    def _update(self, now):
+        """Fait avancer l'acquisition jusqu'à now (lectures, buffer, événements)"""
+        acq = self._acq
+        if acq is None:
+            return
+        done = acq.done_count(now)
+        full_time = None
+        if acq.feed_buffer and not self._bfl_latched:
+            full_time = self._buffer_full_time()
+        if done > len(self._readings):
+            new = self._generate(done - len(self._readings))
+            self._readings = np.concatenate([self._readings, new])
+            if acq.feed_buffer:
+                room = self.state['trac_points'] - len(self._buffer)
+                if room > 0:
+                    self._buffer = np.concatenate([self._buffer, new[:room]])
+        if (acq.feed_buffer and not self._bfl_latched
+                and len(self._buffer) >= self.state['trac_points']):
+            self._bfl_latched = True
+            self._bfl_time = full_time if full_time is not None else now
+            self._meas_events |= BUFFER_FULL
+            self.state['trac_feed_cont'] = 'NEV'
+
+    def _buffer_full_time(self):
+        """Instant de remplissage du buffer pour l'acquisition courante"""
+        acq = self._acq
+        if acq is None or not acq.feed_buffer:
+            return None
+        needed = self.state['trac_points'] - (len(self._buffer) - len(self._readings)) - 1
+        return acq.reading_done_time(max(0, needed))
+
+    def _acquisition_done_time(self):
+        """Instant de fin de l'acquisition (None si jamais terminée)"""
+        acq = self._acq
+        if acq is None:
+            return self._now()
+        return acq.reading_done_time(acq.total - 1)
+
+    def status_byte(self):
+        """
+        Octet d'état (*STB? / poll série)
+        Returns:
+            int: Bit 0 = MSB (événements de mesure), bit 6 = MSS/RQS
+        """
+        self._update(self._now())
+        stb = 0
+        if self._meas_events & self.state['meas_enable']:
+            stb |= 1
+        if self._errors:
+            stb |= 4
+        if self._output:
+            stb |= 16
+        if stb & self.state['sre']:
+            stb |= 64
+        return stb
+
+    # ===== INTERFACE RESSOURCE PYVISA =====
+
+    def write(self, message):
+        """Envoie une ligne de commandes SCPI"""
+        with self.lock:
+            self._check_open()
+            self._transfer(len(message) + 1)
+            self._execute(message.strip())
+        return len(message)
+
+    def read(self):
+        """Lit la prochaine réponse (texte)"""
+        data = self.read_raw()
+        return data.decode('latin-1') if isinstance(data, bytes) else data
+
+    def read_raw(self, size=None):
+        """Lit la prochaine réponse (octets)"""
+        with self.lock:
+            self._check_open()
+            deadline = self._now() + self.timeout / 1000.0
+            if not self._output:
+                self._sleep(self.timeout / 1000.0)
+                self._errors.append('-420,"Query UNTERMINATED"')
+                raise VisaIOError(constants.StatusCode.error_timeout)
+            ready, data = self._output[0]
+            if ready is None or ready > deadline:
+                # Donnée jamais/pas à temps disponible (ex: trigger BUS absent)
+                self._sleep(max(0.0, deadline - self._now()))
+                raise VisaIOError(constants.StatusCode.error_timeout)
+            self._sleep(ready - self._now())
+            self._output.pop(0)
+            if callable(data):
+                data = data()
+            raw = data if isinstance(data, bytes) else data.encode('latin-1')
+            self._transfer(len(raw))
+            return raw
+
+    def query(self, message, delay=None):
+        """Écrit une commande puis lit la réponse"""
+        with self.lock:
+            self.write(message)
+            return self.read()
+
+    def query_binary_values(self, message, datatype='f', is_big_endian=False,
+                            container=list, **kwargs):
+        """Écrit une requête puis décode le bloc IEEE-488.2 reçu"""
+        with self.lock:
+            self.write(message)
+            block = self.read_raw()
+        return util.from_ieee_block(block, datatype, is_big_endian, container)
+
+    def read_stb(self):
+        """Poll série: renvoie l'octet d'état et acquitte la demande de service"""
+        with self.lock:
+            self._check_open()
+            self._transfer(1)
+            stb = self.status_byte()
+            self._srq_ack_time = self._now()
+            return stb
+
+    def enable_event(self, event_type, mechanism, context=None):
+        if event_type == constants.EventType.service_request:
+            self._srq_enabled = True
+
+    def disable_event(self, event_type, mechanism):
+        if event_type == constants.EventType.service_request:
+            self._srq_enabled = False
+
+    def discard_events(self, event_type, mechanism):
+        pass
+
+    def wait_on_event(self, event_type, timeout, capture_timeout=False):
+        """
+        Attend une demande de service (SRQ)
+        Args:
+            timeout (int): Délai maximal en ms
+        Raises:
+            VisaIOError: Timeout si aucune demande de service n'arrive à temps
+        """
+        if not self._srq_enabled:
+            raise VisaIOError(constants.StatusCode.error_not_enabled)
+        deadline = self._now() + timeout / 1000.0
+        with self.lock:
+            self._update(self._now())
+            t_srq = self._srq_time()
+        if t_srq is not None and t_srq <= deadline:
+            self._sleep(t_srq - self._now())
+            return None
+        self._sleep(deadline - self._now())
+        raise VisaIOError(constants.StatusCode.error_timeout)
+
+    def _srq_time(self):
+        """Instant de la prochaine demande de service non acquittée (ou None)"""
+        if not self.state['sre'] & 1 or not self.state['meas_enable'] & BUFFER_FULL:
+            return None
+        if self._bfl_latched:
+            # Événement déjà survenu: en attente tant qu'il n'est ni lu ni acquitté
+            if not self._meas_events & BUFFER_FULL or self._srq_ack_time >= self._bfl_time:
+                return None
+            return self._bfl_time
+        # Remplissage à venir (None si l'acquisition ne le remplira jamais)
+        return self._buffer_full_time()
+
+    def assert_trigger(self):
+        """Group Execute Trigger (GET) adressé à cet instrument"""
+        with self.lock:
+            self._check_open()
+            self._transfer(1)
+            self.bus_trigger(self._now())
+
+    def bus_trigger(self, t):
+        """Trigger BUS reçu à l'instant t (*TRG ou GET)"""
+        acq = self._acq
+        if acq is not None and acq.source == 'BUS':
+            self._update(t)
+            previous = acq.reading_done_time(len(acq.triggers) * acq.samples - 1) if acq.triggers else None
+            acq.triggers.append(max(t, previous or t))
+            self.last_trigger_time = t
+
+    def trigger_times(self):
+        """
+        Instants (perf_counter) des triggers déjà survenus de la dernière
+        séquence INIT: référence des bancs de mesure, que l'instrument réel
+        ne fournit pas
+        Returns:
+            numpy.ndarray: Instants en secondes
+        """
+        with self.lock:
+            acq = self._acq
+            if acq is None:
+                return np.array([])
+            now = self._now()
+            times = []
+            for j in range(-(-acq.total // acq.samples)):
+                t = acq.trigger_time(j)
+                if t is None or t > now or acq.end_time is not None and t > acq.end_time:
+                    break
+                times.append(t)
+            return np.array(times)
+
+    def clear(self):
+        """Device clear (SDC): annule les opérations et vide les sorties"""
+        with self.lock:
+            self._transfer(1)
+            self._output = []
+            self._abort()
+
+    def close(self):
+        self.closed = True
+
+    def _check_open(self):
+        if self.closed:
+            raise VisaIOError(constants.StatusCode.error_invalid_object)
+
+    def _transfer(self, nbytes):
+        self.transactions += 1
+        self.bytes_transferred += nbytes
+        self._sleep(self._bus_time(nbytes))
+
+    # ===== INTERPRÉTEUR SCPI =====
+
+    def _execute(self, line):
+        """Exécute une ligne de commandes séparées par ';'"""
+        responses = []
+        path = ''
+        for segment in line.split(';'):
+            segment = segment.strip()
+            if not segment:
+                continue
+            header, _, arg = segment.partition(' ')
+            is_query = header.endswith('?')
+            header = header.rstrip('?')
+            if header.startswith('*'):
+                key = header.upper()
+            else:
+                # Chemin relatif au nœud précédent si pas de ':' initial
+                if not header.startswith(':') and path:
+                    header = path + ':' + header
+                key = normalize_header(header)
+                path = key.rsplit(':', 1)[0] if ':' in key else ''
+            self._sleep(self._scaled(self.latency['command_time']))
+            try:
+                response = self._command(key, arg.strip(), is_query)
+            except ScpiError as e:
+                self._errors.append(str(e))
+                continue
+            except (ValueError, IndexError):
+                self._errors.append('-220,"Parameter error"')
+                continue
+            if is_query and response is not None:
+                responses.append(response)
+
+        if responses:
+            self._queue_response(responses)
+
+    def _queue_response(self, responses):
+        """Place une réponse (éventuellement différée) dans la file de sortie"""
+        ready = self._now()
+        parts = []
+        for response in responses:
+            if isinstance(response, tuple):
+                # Réponse disponible à un instant donné (lecture en cours)
+                t_ready, producer = response
+                if t_ready is None:
+                    ready = None
+                elif ready is not None:
+                    ready = max(ready, t_ready)
+                parts.append(producer)
+            else:
+                parts.append(lambda r=response: r)
+
+        def produce():
+            data = [p() for p in parts]
+            if len(data) == 1 and isinstance(data[0], bytes):
+                return data[0]
+            return ';'.join(d.decode('latin-1') if isinstance(d, bytes) else d
+                            for d in data) + '\n'
+
+        self._output.append((ready, produce))
+
+    def _format_values(self, values):
+        """Formate des lectures selon FORM:DATA / FORM:BORD"""
+        fmt = self.state['form_data']
+        if fmt in ('SRE', 'DRE'):
+            datatype = 'f' if fmt == 'SRE' else 'd'
+            big_endian = self.state['form_bord'] == 'NORM'
+            return util.to_ieee_block(list(values), datatype, big_endian) + b'\n'
+        return ','.join(f'{v:+.8E}' for v in values)
+
+    def _command(self, key, arg, is_query):
+        """
+        Exécute une commande normalisée
+        Returns:
+            str/tuple/None: Réponse (requêtes) ou None
+        """
+        s = self.state
+        now = self._now()
+        self._update(now)
+
+        # --- Commandes communes ---
+        if key == '*IDN':
+            return 'KEITHLEY INSTRUMENTS INC.,MODEL 2000,0000001,A20 /A02 SIM'
+        if key == '*RST':
+            self._reset_state()
+            return None
+        if key == '*CLS':
+            self._errors = []
+            self._meas_events = 0
+            return None
+        if key == '*OPC':
+            if is_query:
+                done = self._acquisition_done_time() if s['trig_source'] != 'BUS' else now
+                return (done, lambda: '1')
+            return None
+        if key == '*STB':
+            return str(self.status_byte())
+        if key == '*SRE':
+            if is_query:
+                return str(s['sre'])
+            s['sre'] = int(float(arg))
+            return None
+        if key == '*TRG':
+            self.bus_trigger(now)
+            return None
+        if key in ('*ESE', '*ESR', '*WAI'):
+            return '0' if is_query else None
+
+        # --- Système / affichage ---
+        if key == 'SYST:ERR':
+            return self._errors.pop(0) if self._errors else '0,"No error"'
+        if key == 'SYST:AZER:STAT' or key == 'SYST:AZER':
+            if is_query:
+                return '1' if s['azero'] else '0'
+            s['azero'] = parse_bool(arg)
+            return None
+        if key in ('SYST:LOC', 'SYST:REM', 'SYST:BEEP', 'SYST:PRES'):
+            if key == 'SYST:PRES':
+                self._reset_state()
+            return None
+        if key == 'DISP:ENAB':
+            if is_query:
+                return '1' if s['display'] else '0'
+            s['display'] = parse_bool(arg)
+            return None
+        if key.startswith('DISP:'):
+            return None
+
+        # --- Fonction de mesure ---
+        if key.startswith('CONF:'):
+            func, _ = split_function(key[5:])
+            if func is None:
+                raise ScpiError(-113, 'Undefined header')
+            self._abort()
+            s['func'] = func
+            s['trig_source'] = 'IMM'
+            s['trig_count'] = 1
+            s['samp_count'] = 1
+            s['trig_delay'] = 0.0
+            s['init_cont'] = False
+            return None
+        if key == 'CONF':
+            return f'"{s["func"]}"'
+        if key == 'FUNC':
+            if is_query:
+                return f'"{s["func"]}"'
+            func, _ = split_function(normalize_header(arg.strip('\'"')))
+            if func is None:
+                raise ScpiError(-224, 'Illegal parameter value')
+            s['func'] = func
+            return None
+
+        func, rest = split_function(key)
+        if func is not None:
+            return self._function_setting(func, rest, arg, is_query)
+
+        # --- Filtre ---
+        if key.startswith('AVER'):
+            return self._average_setting(key, arg, is_query)
+
+        # --- Trigger ---
+        if key == 'TRIG:SOUR':
+            if is_query:
+                return s['trig_source']
+            source = short_form(arg.upper())
+            if source not in ('IMM', 'TIM', 'BUS', 'EXT', 'MAN', 'TLIN'):
+                raise ScpiError(-224, 'Illegal parameter value')
+            s['trig_source'] = source
+            return None
+        if key == 'TRIG:COUN':
+            if is_query:
+                return str(s['trig_count'])
+            s['trig_count'] = parse_count(arg)
+            return None
+        if key == 'TRIG:TIM':
+            if is_query:
+                return f'{s["trig_timer"]:.3f}'
+            s['trig_timer'] = max(0.001, float(arg))
+            return None
+        if key == 'TRIG:DEL' or key == 'TRIG:DEL:AUTO':
+            if is_query:
+                return f'{s["trig_delay"]}'
+            if key == 'TRIG:DEL':
+                s['trig_delay'] = float(arg)
+            return None
+        if key == 'SAMP:COUN':
+            if is_query:
+                return str(s['samp_count'])
+            count = parse_count(arg)
+            if count > 1024:
+                raise ScpiError(-222, 'Data out of range')
+            s['samp_count'] = count
+            return None
+
+        # --- Déclenchement / lecture ---
+        if key == 'INIT' or key == 'INIT:IMM':
+            self._initiate(now)
+            return None
+        if key == 'INIT:CONT':
+            if is_query:
+                return '1' if s['init_cont'] else '0'
+            s['init_cont'] = parse_bool(arg)
+            return None
+        if key == 'ABOR':
+            self._abort()
+            return None
+        if key == 'FETC' or key == 'FETC:LAT':
+            return self._fetch()
+        if key == 'READ':
+            self._abort()
+            self._initiate(now + self._scaled(self.latency['read_overhead']))
+            return self._fetch()
+        if key == 'DATA' or key == 'DATA:FRES' or key == 'DATA:LAT':
+            if len(self._readings) == 0:
+                raise ScpiError(-230, 'Data corrupt or stale')
+            return self._format_values(self._readings[-1:])
+
+        # --- Buffer ---
+        if key.startswith('TRAC') or key.startswith('DATA'):
+            return self._trace_command(key, arg, is_query)
+
+        # --- Format ---
+        if key == 'FORM:DATA' or key == 'FORM':
+            if is_query:
+                return {'ASC': 'ASC', 'SRE': 'SRE', 'DRE': 'DRE'}[s['form_data']]
+            fmt = short_form(arg.split(',')[0].strip().upper())
+            if fmt not in ('ASC', 'SRE', 'DRE'):
+                raise ScpiError(-224, 'Illegal parameter value')
+            s['form_data'] = fmt
+            return None
+        if key == 'FORM:BORD':
+            if is_query:
+                return s['form_bord']
+            s['form_bord'] = short_form(arg.upper())
+            return None
+        if key == 'FORM:ELEM':
+            if is_query:
+                return s['form_elem']
+            elements = [short_form(e.strip().upper()) for e in arg.split(',')]
+            if any(e not in ('READ', 'CHAN', 'UNIT') for e in elements):
+                raise ScpiError(-224, 'Illegal parameter value')
+            s['form_elem'] = ','.join(elements)
+            return None
+
+        # --- Registres d'état ---
+        if key == 'STAT:MEAS' or key == 'STAT:MEAS:EVEN':
+            events = self._meas_events
+            self._meas_events = 0
+            return str(events)
+        if key == 'STAT:MEAS:ENAB':
+            if is_query:
+                return str(s['meas_enable'])
+            s['meas_enable'] = int(float(arg))
+            return None
+        if key.startswith('STAT:'):
+            return '0' if is_query else None
+
+        # --- Calculs ---
+        if key == 'CALC:NULL:OFFS':
+            if is_query:
+                return str(s['null_offset'])
+            s['null_offset'] = float(arg)
+            return None
+        if key == 'CALC:NULL:STAT':
+            if is_query:
+                return '1' if s['null_state'] else '0'
+            s['null_state'] = parse_bool(arg)
+            return None
+        if key.startswith('CALC'):
+            return '0' if is_query else None
+
+        raise ScpiError(-113, 'Undefined header')
+
+    def _function_setting(self, func, rest, arg, is_query):
+        """Réglages par fonction: NPLC, RANG, RANG:AUTO, AVER..."""
+        s = self.state
+        if rest == 'NPLC':
+            if func not in NPLC_FUNCTIONS:
+                raise ScpiError(-113, 'Undefined header')
+            if is_query:
+                return f'{s["nplc"][func]:g}'
+            nplc = float(arg)
+            if not 0.01 <= nplc <= 10:
+                raise ScpiError(-222, 'Data out of range')
+            s['nplc'][func] = nplc
+            return None
+        if rest == 'RANG' or rest == 'RANG:UPP':
+            if is_query:
+                return f'{s["range"][func]:g}'
+            s['range'][func] = float(arg)
+            s['range_auto'][func] = False
+            return None
+        if rest == 'RANG:AUTO':
+            if is_query:
+                return '1' if s['range_auto'][func] else '0'
+            s['range_auto'][func] = parse_bool(arg)
+            return None
+        if rest.startswith('AVER'):
+            return self._average_setting(rest, arg, is_query)
+        if rest in ('DIG', 'REF', 'REF:STAT', 'THR', 'DET:BAND', 'APER'):
+            return '0' if is_query else None
+        raise ScpiError(-113, 'Undefined header')
+
+    def _average_setting(self, key, arg, is_query):
+        """Filtre numérique (AVER:STAT, AVER:COUN, AVER:TCON)"""
+        s = self.state
+        if key in ('AVER', 'AVER:STAT'):
+            if is_query:
+                return '1' if s['aver_state'] else '0'
+            s['aver_state'] = parse_bool(arg)
+            return None
+        if key == 'AVER:COUN':
+            if is_query:
+                return str(s['aver_count'])
+            count = parse_count(arg)
+            if not 1 <= count <= 100:
+                raise ScpiError(-222, 'Data out of range')
+            s['aver_count'] = count
+            return None
+        if key == 'AVER:TCON':
+            if is_query:
+                return s['aver_tcon']
+            s['aver_tcon'] = short_form(arg.upper())
+            return None
+        raise ScpiError(-113, 'Undefined header')
+
+    def _trace_command(self, key, arg, is_query):
+        """Commandes du buffer (TRAC:* / DATA:*)"""
+        s = self.state
+        key = 'TRAC' + key[4:] if key.startswith('DATA') else key
+        if key == 'TRAC:CLE':
+            self._buffer = np.array([])
+            self._bfl_latched = False
+            return None
+        if key == 'TRAC:POIN':
+            if is_query:
+                return str(s['trac_points'])
+            points = parse_count(arg)
+            if not 2 <= points <= 1024:
+                raise ScpiError(-222, 'Data out of range')
+            s['trac_points'] = points
+            return None
+        if key == 'TRAC:POIN:ACT' or key == 'TRAC:FREE':
+            return str(len(self._buffer))
+        if key == 'TRAC:FEED':
+            if is_query:
+                return s['trac_feed']
+            s['trac_feed'] = short_form(arg.upper())
+            return None
+        if key == 'TRAC:FEED:CONT':
+            if is_query:
+                return s['trac_feed_cont']
+            s['trac_feed_cont'] = short_form(arg.upper())
+            return None
+        if key == 'TRAC:DATA':
+            if len(self._buffer) == 0:
+                return self._format_values([]) if s['form_data'] != 'ASC' else ''
+            return self._format_values(self._buffer)
+        raise ScpiError(-113, 'Undefined header')
+
+    def _initiate(self, t_init):
+        """INIT: démarre une séquence de triggers"""
+        s = self.state
+        if self._acq is not None and self._acq.end_time is None:
+            done = self._acq.done_count(self._now())
+            if done < self._acq.total:
+                raise ScpiError(-213, 'Init ignored')
+        feed = s['trac_feed'] != 'NONE' and s['trac_feed_cont'] == 'NEXT'
+        self._acq = _Acquisition(
+            t_init=t_init,
+            total=s['trig_count'] * s['samp_count'],
+            samples=s['samp_count'],
+            reading_time=self._scaled(self.reading_time()),
+            source=s['trig_source'],
+            timer=self._scaled(s['trig_timer']),
+            feed_buffer=feed
+        )
+        self._readings = np.array([])
+
+    def _abort(self):
+        """ABOR: arrête la séquence en cours (les lectures faites sont conservées)"""
+        if self._acq is not None and self._acq.end_time is None:
+            now = self._now()
+            self._update(now)
+            self._acq.end_time = now
+            self._acq.total = len(self._readings)
+            self._acq.feed_buffer = False
+
+    def _fetch(self):
+        """FETC?: lectures de la dernière séquence (attend sa fin)"""
+        acq = self._acq
+        if acq is None:
+            raise ScpiError(-230, 'Data corrupt or stale')
+        if acq.total > 1024:
+            raise ScpiError(-214, 'Trigger deadlock')
+        if acq.source == 'EXT':
+            return (None, lambda: '')
+        if acq.source == 'BUS' and len(acq.triggers) * acq.samples < acq.total:
+            # Triggers manquants: la lecture expire (comme sur l'instrument)
+            return (None, lambda: self._fetch_values(acq))
+        t_done = acq.reading_done_time(acq.total - 1) if acq.total > 0 else self._now()
+        return (t_done, lambda: self._fetch_values(acq))
+
+    def _fetch_values(self, acq):
+        """Lectures disponibles d'une séquence (après attente)"""
+        self._update(self._now())
+        return self._format_values(self._readings[:acq.total])
+
+
+class SimulatedInterface:
+    """Contrôleur de bus simulé ('SIM0::INTFC'): GET groupé"""
+
+    def __init__(self, resource_name='SIM0::INTFC', latency=None, time_scale=1.0):
+        """
+        Args:
+            resource_name (str): Adresse de la carte simulée
+            latency (dict): Surcharges du modèle de latence
+            time_scale (float): Facteur appliqué à toutes les durées
+        """
+        self.resource_name = resource_name
+        self.timeout = 5000
+        self.latency = dict(SimulatedKeithley2000.default_latency)
+        if latency:
+            self.latency.update(latency)
+        self.time_scale = time_scale
+        self.transactions = 0
+        self.closed = False
+
+    def group_execute_trigger(self, *resources):
+        """
+        GET adressé à plusieurs instruments en une commande bus
+        Args:
+            *resources (SimulatedKeithley2000): Instruments de la carte
+        Note: Tous les instruments reçoivent le trigger au même instant
+        """
+        if self.closed:
+            raise VisaIOError(constants.StatusCode.error_invalid_object)
+        board = self.resource_name.split('::')[0].upper()
+        for resource in resources:
+            if resource.resource_name.split('::')[0].upper() != board:
+                raise ValueError(f"{resource.resource_name} n'est pas sur la carte {board}")
+        # Adressage des écouteurs puis GET: une seule commande sur le bus
+        lat = self.latency
+        self.transactions += 1
+        duration = (lat['bus_overhead'] + (len(resources) + 2) / lat['bus_speed']) * self.time_scale
+        if duration > 0:
+            time.sleep(duration)
+        t = time.perf_counter()
+        for resource in resources:
+            with resource.lock:
+                resource._check_open()
+                resource.bus_trigger(t)
+
+    def close(self):
+        self.closed = True
@@ -0,0 +1,567 @@
+"""
+Acquisition simultanée sur plusieurs Keithley 2000
+Un thread par carte GPIB: à chaque tour, tous les instruments de la carte
+sont armés (INIT) puis relus (FETC?), ils mesurent donc en parallèle
+pendant que le bus sert les autres. Les cartes différentes travaillent en
+parallèle. Toutes les lectures sont datées sur la même horloge monotone
+et fusionnées en un flux ordonné dans le temps
+
+Mode synchronisé (capture_synchronized): tous les instruments sont armés
+sur trigger bus (TRIG:SOUR BUS) puis déclenchés par un seul GET groupé par
+carte; les lectures démarrent ensemble au lieu d'être décalées d'une
+transaction bus par instrument (mesures différentielles)
+
+Utilisation:
+    manager = AcquisitionManager()
+    manager.add_instrument('dmm1', 'GPIB0::16::INSTR', nplc=0.1)
+    manager.add_instrument('dmm2', 'GPIB0::17::INSTR', nplc=0.1)
+    manager.start()
+    block = manager.get_merged(timeout=1.0)
+    manager.stop()
+
+    capture = manager.capture_synchronized(samples=10)
+    print(capture['trigger']['skew'])   # Borne de l'écart entre instruments (s)
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+import threading
+import time
+
+import numpy as np
+from pyvisa.errors import VisaIOError
+
+from keithley2000 import Keithley2000
+from visa_pool import PRIORITY_HIGH, get_pool, io_priority
+
+
+def board_of(address):
+    """
+    Bus physique d'une adresse VISA
+    Args:
+        address (str): Adresse (ex: 'GPIB0::16::INSTR', 'SIM0::16::INSTR')
+    Returns:
+        str: Carte partagée ('GPIB0', 'SIM0') ou l'adresse elle-même pour un
+             lien point à point (USB, TCPIP, série)
+    """
+    interface = address.split('::')[0].upper()
+    if interface.startswith(('GPIB', 'SIM')):
+        return interface
+    return address
+
+
+def _high_priority(func, *args):
+    """Exécute func avec la priorité d'accès de l'acquisition (PRIORITY_HIGH)"""
+    with io_priority(PRIORITY_HIGH):
+        return func(*args)
+
+
+def _trigger_board(board, group, clock, barrier=None):
+    """
+    Déclenche les instruments armés d'une carte
+    Returns:
+        tuple: (instants par adresse, fenêtres (début, fin) contenant le
+                trigger par adresse, méthode, durées des commandes)
+    Note: La session de chaque instrument est réservée (capture) pendant
+          le trigger: aucune transaction d'un autre thread ne s'intercale
+    """
+    session = None
+    synchronized = barrier is None
+    with ExitStack() as leases:
+        for k in group:
+            leases.enter_context(k.capture())
+        try:
+            session = get_pool().acquire(f'{board}::INTFC')
+            if not synchronized:
+                synchronized = True
+                barrier.wait()
+            t_start = clock()
+            session.resource.group_execute_trigger(*[k.meter for k in group])
+            t_end = clock()
+            for k in group:
+                k.batch_trigger_time = (t_start + t_end) / 2
+            times = {k.session.resource_name: (t_start + t_end) / 2 for k in group}
+            windows = {k.session.resource_name: (t_start, t_end) for k in group}
+            return times, windows, 'GET groupé', [t_end - t_start]
+        except (VisaIOError, ValueError, AttributeError, OSError):
+            # Pas de contrôleur (USB, TCPIP, pilote sans INTFC): un trigger
+            # par instrument, le plus rapprochés possible
+            if not synchronized:
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+            times, windows, durations = {}, {}, []
+            for k in group:
+                t_start = clock()
+                times[k.session.resource_name] = k.bus_trigger()
+                t_end = clock()
+                windows[k.session.resource_name] = (t_start, t_end)
+                durations.append(t_end - t_start)
+            return times, windows, 'GET successifs', durations
+        finally:
+            if session is not None:
+                get_pool().release(session)
+
+
+def _trigger_stats(results):
+    """
+    Statistiques de trigger de plusieurs cartes (voir group_trigger)
+    Args:
+        results (list): (carte, résultat de _trigger_board)
+    """
+    times, windows, methods, durations = {}, {}, {}, []
+    for board, (board_times, board_windows, method, board_durations) in results:
+        times.update(board_times)
+        windows.update(board_windows)
+        methods[board] = method
+        durations.extend(board_durations)
+
+    # Tous les triggers ont eu lieu entre le début de la première commande
+    # et la fin de la dernière: borne de l'écart, pas une mesure
+    return {
+        'times': times,
+        'methods': methods,
+        'skew': (max(end for _, end in windows.values())
+                 - min(start for start, _ in windows.values())) if windows else 0.0,
+        'uncertainty': max(durations) if durations else 0.0
+    }
+
+
+def group_trigger(keithleys, clock=time.perf_counter):
+    """
+    Déclenche plusieurs instruments armés par arm_bus_trigger()
+    Un GET groupé par carte (contrôleur 'GPIB0::INTFC'): une seule commande
+    bus, tous les instruments de la carte sont déclenchés au même instant.
+    Sans contrôleur accessible, GET adressés (ou *TRG) envoyés à la suite.
+    Les cartes distinctes sont déclenchées en parallèle (un thread par carte)
+    Args:
+        keithleys (list): Instances Keithley2000 connectées et armées
+        clock (callable): Horloge des instants de trigger
+    Returns:
+        dict: {'times': {adresse: instant (milieu de la commande)},
+              'methods': {carte: 'GET groupé' | 'GET successifs'},
+              'skew': borne supérieure de l'écart entre instants de trigger
+              (s): durée de la fenêtre contenant toutes les commandes de
+              trigger, l'instant exact de réception n'étant pas observable;
+              'uncertainty': durée max d'une commande de trigger (s)}
+    Note: Chaque carte réserve les sessions de ses instruments (capture)
+          pendant son trigger; avec plusieurs cartes, l'appelant ne doit
+          pas détenir ces captures (threads distincts)
+    """
+    boards = {}
+    for k in keithleys:
+        boards.setdefault(board_of(k.session.resource_name), []).append(k)
+
+    if len(boards) == 1:
+        results = [_trigger_board(board, group, clock) for board, group in boards.items()]
+    else:
+        barrier = threading.Barrier(len(boards), timeout=5.0)
+        with ThreadPoolExecutor(max_workers=len(boards)) as executor:
+            futures = [executor.submit(_high_priority, _trigger_board, board, group,
+                                       clock, barrier)
+                       for board, group in boards.items()]
+        results = [f.result() for f in futures]
+    return _trigger_stats(list(zip(boards, results)))
+
+
+class InstrumentChannel:
+    """Un instrument géré: configuration, driver et compteurs"""
+
+    def __init__(self, name, address, meas_type='DCV', nplc=None, range_val='AUTO',
+                 timeout=5000):
+        self.name = name
+        self.address = address
+        self.board = board_of(address)
+        self.meas_type = meas_type
+        self.nplc = nplc
+        self.range_val = range_val
+        self.keithley = Keithley2000(timeout=timeout)
+
+        self.reading_time = None  # Durée d'une lecture (meilleure estimation)
+        self.samples = 0
+        self.rounds = 0
+        self.first_time = None
+        self.last_time = None
+        self.error = None
+
+    def rate(self):
+        """
+        Returns:
+            float: Cadence mesurée en lectures/s
+        """
+        if self.samples < 2 or self.last_time == self.first_time:
+            return 0.0
+        return (self.samples - 1) / (self.last_time - self.first_time)
+
+
+class MergedStream:
+    """Fusion ordonnée dans le temps des lectures de plusieurs instruments"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending = {}     # Nom -> liste de (temps, valeurs)
+        self.watermark = {}   # Nom -> dernier instant reçu
+        self.closed = set()   # Instruments terminés (ne retiennent plus la fusion)
+
+    def register(self, name):
+        with self.condition:
+            self.pending[name] = []
+            self.watermark[name] = -np.inf
+
+    def push(self, name, times, values):
+        """Ajoute un bloc (instants croissants) d'un instrument"""
+        with self.condition:
+            self.pending[name].append((np.asarray(times), np.asarray(values)))
+            self.watermark[name] = float(times[-1])
+            self.condition.notify_all()
+
+    def close(self, name):
+        """Un instrument ne produira plus de lectures"""
+        with self.condition:
+            self.closed.add(name)
+            self.condition.notify_all()
+
+    def _horizon(self):
+        """Instant jusqu'auquel tous les instruments actifs ont livré leurs lectures"""
+        active = [w for n, w in self.watermark.items() if n not in self.closed]
+        return min(active) if active else np.inf
+
+    def pop_ready(self, timeout=None):
+        """
+        Lectures de tous les instruments antérieures à l'horizon commun
+        Args:
+            timeout (float): Attente maximale en s (None = sans attente)
+        Returns:
+            dict: {'times', 'values', 'instruments'} triés par temps, ou None
+        """
+        with self.condition:
+            if timeout:
+                deadline = time.perf_counter() + timeout
+                while not self._has_ready():
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        return None
+                    self.condition.wait(remaining)
+            horizon = self._horizon()
+
+            times, values, names = [], [], []
+            for name, blocks in self.pending.items():
+                kept = []
+                for t, v in blocks:
+                    ready = t <= horizon
+                    if ready.any():
+                        times.append(t[ready])
+                        values.append(v[ready])
+                        names.append(np.full(int(ready.sum()), name, dtype=object))
+                    if not ready.all():
+                        kept.append((t[~ready], v[~ready]))
+                self.pending[name] = kept
+
+        if not times:
+            return None
+        times = np.concatenate(times)
+        order = np.argsort(times, kind='stable')
+        return {
+            'times': times[order],
+            'values': np.concatenate(values)[order],
+            'instruments': np.concatenate(names)[order]
+        }
+
+    def _has_ready(self):
+        horizon = self._horizon()
+        return any(len(t) and t[0] <= horizon for blocks in self.pending.values()
+                   for t, _ in blocks)
+
+
+class AcquisitionManager:
+    """Acquisition concurrente de N instruments, un thread par carte GPIB"""
+
+    # Durée visée d'un tour d'acquisition (s): taille des lots de lectures
+    ROUND_DURATION = 0.1
+
+    def __init__(self, round_duration=ROUND_DURATION, clock=time.perf_counter):
+        """
+        Args:
+            round_duration (float): Durée visée d'un tour (armement + relecture)
+            clock (callable): Horloge monotone commune à tous les instruments
+        """
+        self.round_duration = round_duration
+        self.clock = clock
+        self.channels = {}
+        self.merged = MergedStream()
+        self.workers = []
+        self.stop_event = threading.Event()
+        self.t0 = None
+        self.last_trigger_stats = {}
+
+    def add_instrument(self, name, address, **config):
+        """
+        Ajoute un instrument
+        Args:
+            name (str): Nom unique (colonne de sortie)
+            address (str): Adresse VISA
+            **config: meas_type, nplc, range_val, timeout (voir InstrumentChannel)
+        Returns:
+            InstrumentChannel: Canal créé
+        """
+        if name in self.channels:
+            raise ValueError(f"Instrument déjà ajouté: {name}")
+        channel = InstrumentChannel(name, address, **config)
+        self.channels[name] = channel
+        self.merged.register(name)
+        return channel
+
+    def boards(self):
+        """
+        Returns:
+            dict: Carte -> liste des canaux qui la partagent
+        """
+        boards = {}
+        for channel in self.channels.values():
+            boards.setdefault(channel.board, []).append(channel)
+        return boards
+
+    def start(self):
+        """Connecte, configure et lance un thread d'acquisition par carte"""
+        self.stop_event.clear()
+        self.t0 = self.clock()
+        for board, channels in self.boards().items():
+            worker = threading.Thread(target=_high_priority, args=(self._board_loop, channels),
+                                      name=f'acq-{board}', daemon=True)
+            self.workers.append(worker)
+            worker.start()
+
+    def stop(self, timeout=2.0):
+        """Arrête les threads (le tour en cours se termine)"""
+        self.stop_event.set()
+        for worker in self.workers:
+            worker.join(timeout=timeout)
+        self.workers = []
+
+    @property
+    def running(self):
+        return any(worker.is_alive() for worker in self.workers)
+
+    def _setup(self, channel):
+        """Connexion et configuration d'un instrument (thread de sa carte)"""
+        k = channel.keithley
+        if not k.connected:
+            k.connect(channel.address)
+        with k.batch():
+            k.configure_measurement(channel.meas_type, channel.range_val)
+            if channel.nplc is not None:
+                k.set_nplc(channel.nplc, channel.meas_type)
+
+    def _board_loop(self, channels):
+        """Tours d'acquisition d'une carte: armer tous les instruments puis relire"""
+        active = []
+        for channel in channels:
+            try:
+                self._setup(channel)
+                active.append(channel)
+            except Exception as e:
+                channel.error = str(e)
+                self.merged.close(channel.name)
+
+        try:
+            while active and not self.stop_event.is_set():
+                # Armement: une écriture par instrument, mesures en parallèle
+                armed = []
+                for channel in active:
+                    try:
+                        count = channel.keithley.batch_size(self.round_duration)
+                        channel.keithley.initiate_batch(count)
+                        armed.append(channel)
+                    except Exception as e:
+                        self._fail(channel, e)
+
+                # Relecture dans l'ordre d'armement
+                for channel in armed:
+                    try:
+                        values, t_end = channel.keithley.fetch_batch()
+                        self._deliver(channel, values, t_end)
+                    except Exception as e:
+                        self._fail(channel, e)
+
+                active = [c for c in active if c.error is None]
+        finally:
+            for channel in channels:
+                self.merged.close(channel.name)
+                try:
+                    if channel.error is None:
+                        channel.keithley.write('ABOR')
+                except Exception:
+                    pass
+
+    def capture_synchronized(self, samples=1, deliver=True):
+        """
+        Capture simultanée: armement sur trigger bus, un GET groupé par
+        carte, puis relecture; les cartes sont traitées en parallèle, chacune
+        sous la capture de ses instruments de l'armement à la relecture
+        Args:
+            samples (int): Lectures par instrument après le trigger (1 à 1024)
+            deliver (bool): Transmet aussi les lectures au flux fusionné
+        Returns:
+            dict: {'readings': {nom: (instants s depuis t0, valeurs)},
+                  'trigger': statistiques de group_trigger(), 'errors': {nom: msg}}
+        Note: Utilisable hors acquisition continue (start/stop); 'skew' borne
+              le décalage entre instruments (fenêtre des commandes de trigger)
+        """
+        if self.running:
+            raise Exception("Acquisition en cours: arrêter avant une capture synchronisée")
+        return _high_priority(self._capture_synchronized, samples, deliver)
+
+    def _capture_synchronized(self, samples, deliver):
+        if self.t0 is None:
+            self.t0 = self.clock()
+
+        boards, errors = {}, {}
+        for channel in self.channels.values():
+            try:
+                if not channel.keithley.connected:
+                    self._setup(channel)
+                boards.setdefault(channel.board, []).append(channel)
+            except Exception as e:
+                errors[channel.name] = str(e)
+        if not boards:
+            return {'readings': {}, 'trigger': {}, 'errors': errors}
+
+        # Un thread par carte: les cartes distinctes répondent en même temps
+        if len(boards) == 1:
+            results = [self._capture_board(board, channels, samples)
+                       for board, channels in boards.items()]
+        else:
+            barrier = threading.Barrier(len(boards), timeout=5.0)
+            with ThreadPoolExecutor(max_workers=len(boards)) as executor:
+                futures = [executor.submit(_high_priority, self._capture_board, board,
+                                           channels, samples, barrier)
+                           for board, channels in boards.items()]
+            results = [f.result() for f in futures]
+
+        triggered, fetched = [], {}
+        for board, (board_trigger, board_fetched, board_errors) in zip(boards, results):
+            if board_trigger is not None:
+                triggered.append((board, board_trigger))
+            fetched.update(board_fetched)
+            errors.update(board_errors)
+        if not triggered:
+            return {'readings': {}, 'trigger': {}, 'errors': errors}
+        trigger = _trigger_stats(triggered)
+        self.last_trigger_stats = trigger
+
+        readings = {}
+        for name, (values, t_end) in fetched.items():
+            channel = self.channels[name]
+            n = len(values)
+            if n == 0:
+                continue
+            t_trigger = trigger['times'][channel.address]
+            reading_time = channel.reading_time or (t_end - t_trigger) / n
+            times = t_trigger + np.arange(1, n + 1) * reading_time - self.t0
+            readings[channel.name] = (times, values)
+            if deliver:
+                self.merged.push(channel.name, times, values)
+        return {'readings': readings, 'trigger': trigger, 'errors': errors}
+
+    def _capture_board(self, board, channels, samples, barrier=None):
+        """
+        Capture synchronisée d'une carte: armement, trigger et relecture
+        sous la capture de chaque instrument (aucune transaction d'un autre
+        thread, ex: interface, ne s'intercale entre les trois)
+        Returns:
+            tuple: (résultat de _trigger_board ou None, {nom: (valeurs,
+                    instant de réponse)}, {nom: erreur})
+        """
+        armed, fetched, errors = [], {}, {}
+        with ExitStack() as leases:
+            for channel in channels:
+                try:
+                    leases.enter_context(channel.keithley.capture())
+                    channel.keithley.arm_bus_trigger(samples)
+                    armed.append(channel)
+                except Exception as e:
+                    errors[channel.name] = str(e)
+
+            if not armed:
+                # Les autres cartes ne doivent pas attendre celle-ci
+                if barrier is not None:
+                    try:
+                        barrier.wait()
+                    except threading.BrokenBarrierError:
+                        pass
+                return None, fetched, errors
+
+            trigger = _trigger_board(board, [c.keithley for c in armed], self.clock, barrier)
+            for channel in armed:
+                try:
+                    fetched[channel.name] = channel.keithley.fetch_batch()
+                except Exception as e:
+                    errors[channel.name] = str(e)
+        return trigger, fetched, errors
+
+    def _deliver(self, channel, values, t_end):
+        """Date les lectures d'un lot et les transmet au flux fusionné"""
+        n = len(values)
+        if n == 0:
+            return
+        k = channel.keithley
+        t_arm = k.batch_trigger_time
+
+        # Un instrument relu tard (bus occupé) a fini avant sa réponse: la
+        # durée de lecture retenue est la plus courte observée
+        reading_time = (t_end - t_arm) / n
+        if channel.reading_time is None or reading_time < channel.reading_time:
+            channel.reading_time = reading_time
+        k.batch_reading_time = channel.reading_time
+
+        times = t_arm + np.arange(1, n + 1) * channel.reading_time - self.t0
+        channel.samples += n
+        channel.rounds += 1
+        if channel.first_time is None:
+            channel.first_time = times[0]
+        channel.last_time = times[-1]
+        self.merged.push(channel.name, times, values)
+
+    def _fail(self, channel, error):
+        channel.error = str(error)
+        self.merged.close(channel.name)
+
+    def get_merged(self, timeout=None):
+        """
+        Lectures fusionnées disponibles (ordonnées dans le temps)
+        Args:
+            timeout (float): Attente maximale en s (None = sans attente)
+        Returns:
+            dict: {'times' (s depuis start), 'values', 'instruments'} ou None
+        """
+        return self.merged.pop_ready(timeout)
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: {'instruments': {nom: {'samples', 'rate', 'rounds', 'board',
+                  'error'}}, 'total_samples', 'aggregate_rate'}
+        """
+        instruments = {}
+        for name, channel in self.channels.items():
+            instruments[name] = {
+                'samples': channel.samples,
+                'rate': channel.rate(),
+                'rounds': channel.rounds,
+                'board': channel.board,
+                'error': channel.error
+            }
+        return {
+            'instruments': instruments,
+            'total_samples': sum(c.samples for c in self.channels.values()),
+            'aggregate_rate': sum(i['rate'] for i in instruments.values())
+        }
+
+    def close(self):
+        """Arrête l'acquisition et déconnecte tous les instruments"""
+        self.stop()
+        for channel in self.channels.values():
+            try:
+                channel.keithley.disconnect()
+            except Exception:
+                pass
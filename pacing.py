@@ -0,0 +1,104 @@
+"""
+Cadencement des acquisitions sur une grille temporelle absolue
+Les échéances sont calculées depuis l'instant de départ (horloge monotone)
+et non depuis la mesure précédente: la latence GPIB ne fait pas dériver
+la période et les créneaux manqués sont comptés au lieu d'être décalés
+"""
+import time
+
+
+class PacedScheduler:
+    """Cadenceur à échéances absolues pour les mesures périodiques"""
+
+    def __init__(self, interval, start=None, clock=time.perf_counter):
+        """
+        Initialise la grille d'échantillonnage
+        Args:
+            interval (float): Période entre deux mesures en secondes
+            start (float): Instant du créneau 0 (défaut: maintenant)
+            clock (callable): Horloge monotone en secondes
+        """
+        if interval <= 0:
+            raise ValueError(f"Intervalle invalide: {interval}")
+        self.interval = interval
+        self.clock = clock
+        self.start = clock() if start is None else start
+
+        # Prochain créneau à servir et compteurs de ponctualité
+        self.slot = 0
+        self.count = 0
+        self.missed = 0
+        self.last_lateness = 0.0
+        self.lateness_sum = 0.0
+        self.lateness_max = 0.0
+
+    def deadline(self, slot):
+        """
+        Échéance absolue d'un créneau
+        Args:
+            slot (int): Numéro du créneau
+        Returns:
+            float: Instant du créneau (horloge self.clock)
+        """
+        return self.start + slot * self.interval
+
+    def wait_next(self, stop_event=None):
+        """
+        Attend l'échéance du prochain créneau de la grille
+        Args:
+            stop_event (threading.Event): Interrompt l'attente s'il est levé
+        Returns:
+            tuple: (créneau, échéance, retard en s) ou None si arrêt demandé
+        Note: Les créneaux dépassés de plus d'une période sont sautés et
+              comptés dans self.missed (la grille n'est jamais décalée)
+        """
+        now = self.clock()
+        target = self.deadline(self.slot)
+
+        if now - target >= self.interval:
+            skipped = int((now - target) // self.interval)
+            self.slot += skipped
+            self.missed += skipped
+            target = self.deadline(self.slot)
+
+        remaining = target - now
+        if remaining > 0:
+            if stop_event is not None:
+                if stop_event.wait(remaining):
+                    return None
+            else:
+                time.sleep(remaining)
+
+        lateness = max(0.0, self.clock() - target)
+        self.last_lateness = lateness
+        self.lateness_sum += lateness
+        self.lateness_max = max(self.lateness_max, lateness)
+        self.count += 1
+
+        slot = self.slot
+        self.slot += 1
+        return slot, target, lateness
+
+    def resume(self):
+        """
+        Reprise après une pause: la grille continue au prochain créneau à
+        venir, les créneaux écoulés pendant la pause ne sont pas comptés manqués
+        """
+        now = self.clock()
+        target = self.deadline(self.slot)
+        if now > target:
+            self.slot += int((now - target) // self.interval) + 1
+
+    def get_stats(self):
+        """
+        Statistiques de ponctualité
+        Returns:
+            dict: Créneaux servis, manqués, retard moyen/max/dernier (s)
+        """
+        return {
+            'count': self.count,
+            'missed': self.missed,
+            'lateness_mean': self.lateness_sum / self.count if self.count else 0.0,
+            'lateness_max': self.lateness_max,
+            'lateness_last': self.last_lateness
+        }
@@ -0,0 +1,266 @@
+"""
+Buffer circulaire d'échantillons (temps, valeur) préalloué en numpy
+Un seul thread écrit (acquisition), un seul thread lit (interface):
+les données sont écrites avant l'incrément de l'index d'écriture, le
+lecteur voit donc toujours des échantillons complets. Le producteur
+annonce d'abord la fin de l'écriture en cours (index réservé): une copie
+vérifie après coup qu'aucun de ses points n'a été réécrit pendant la
+lecture. Le lecteur n'écrit jamais l'index: clear() masque les points
+déjà écrits (index plancher)
+
+SharedSampleRingBuffer place le même buffer en mémoire partagée
+(multiprocessing.shared_memory): un processus d'acquisition écrit, le
+processus de l'interface s'y attache en lecture seule
+"""
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SampleRingBuffer:
+    """Buffer circulaire mono-producteur / mono-consommateur"""
+
+    DEFAULT_CAPACITY = 100000
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Préalloue le buffer
+        Args:
+            capacity (int): Nombre maximal d'échantillons conservés
+        Note: Chaque échantillon est écrit deux fois (indices i et i+capacity)
+              pour que les N derniers points soient toujours contigus et
+              lisibles sans copie
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacité invalide: {capacity}")
+        self.capacity = int(capacity)
+        self._time = np.zeros(2 * self.capacity)
+        self._value = np.zeros(2 * self.capacity)
+        self.write_index = 0    # Nombre total d'échantillons écrits (croissant)
+        self.reserve_index = 0  # Fin de l'écriture en cours (>= write_index)
+        self.floor = 0          # Index d'effacement (lecteur): points masqués
+
+    def __len__(self):
+        return min(self.write_index - self.floor, self.capacity)
+
+    def append(self, t, value):
+        """
+        Ajoute un échantillon
+        Args:
+            t (float): Temps en secondes
+            value (float): Valeur mesurée
+        """
+        w = self.write_index
+        self.reserve_index = w + 1
+        i = w % self.capacity
+        self._time[i] = self._time[i + self.capacity] = t
+        self._value[i] = self._value[i + self.capacity] = value
+        self.write_index = w + 1
+
+    def extend(self, times, values):
+        """
+        Ajoute un bloc d'échantillons
+        Args:
+            times (array): Temps en secondes
+            values (array): Valeurs mesurées (même longueur que times)
+        """
+        times = np.asarray(times, dtype=float)
+        values = np.asarray(values, dtype=float)
+        count = len(times)
+        if count == 0:
+            return
+
+        # Au-delà de la capacité, seuls les derniers points sont conservés
+        start = self.write_index
+        if count > self.capacity:
+            start += count - self.capacity
+            times = times[-self.capacity:]
+            values = values[-self.capacity:]
+
+        self.reserve_index = self.write_index + count
+        idx = (start + np.arange(len(times))) % self.capacity
+        self._time[idx] = self._time[idx + self.capacity] = times
+        self._value[idx] = self._value[idx + self.capacity] = values
+        self.write_index = self.reserve_index
+
+    def latest(self, n=None):
+        """
+        Vue sans copie des n derniers échantillons
+        Args:
+            n (int): Nombre de points (None = tout le contenu)
+        Returns:
+            tuple: (temps, valeurs) en numpy.ndarray (vues en lecture seule)
+        Note: Les vues peuvent être réécrites par le producteur après un
+              tour complet du buffer: copier pour une conservation durable.
+              Les points antérieurs au dernier clear() sont exclus
+        """
+        w = self.write_index
+        size = min(w - self.floor, self.capacity)
+        n = size if n is None else max(0, min(n, size))
+        end = w % self.capacity + self.capacity
+        t = self._time[end - n:end]
+        v = self._value[end - n:end]
+        t.flags.writeable = False
+        v.flags.writeable = False
+        return t, v
+
+    def snapshot(self, n=None):
+        """
+        Copie cohérente des n derniers échantillons (export, traitements longs)
+        Args:
+            n (int): Nombre de points (None = tout le contenu)
+        Returns:
+            tuple: (temps, valeurs) en numpy.ndarray
+        Note: Les points réécrits par le producteur pendant la copie sont
+              retirés du résultat
+        """
+        w = self.write_index
+        size = min(w - self.floor, self.capacity)
+        n = size if n is None else max(0, min(n, size))
+        return self._copy_before(w, n)
+
+    def since(self, index):
+        """
+        Copie des échantillons écrits depuis un index (suivi incrémental)
+        Args:
+            index (int): Index d'écriture de la lecture précédente
+        Returns:
+            tuple: (temps, valeurs, index courant, points perdus)
+        Note: Les points déjà réécrits (lecteur en retard de plus d'un tour,
+              ou rattrapé pendant la copie) sont comptés comme perdus; la
+              lecture suivante reprend à l'index courant retourné
+        """
+        w = self.write_index
+        count = max(0, w - index)
+        t, v = self._copy_before(w, min(count, self.capacity))
+        return t, v, w, count - len(t)
+
+    def _copy_before(self, w, n):
+        """
+        Copie des n échantillons précédant l'index w (lu une seule fois)
+        Returns:
+            tuple: (temps, valeurs) sans les points réécrits pendant la copie
+        """
+        end = w % self.capacity + self.capacity
+        t = self._time[end - n:end].copy()
+        v = self._value[end - n:end].copy()
+
+        # Index i réécrit par l'écriture de i + capacity: vérification après
+        # la copie, écriture en cours comprise (index réservé)
+        overwritten = min(n, self.reserve_index - w - (self.capacity - n))
+        if overwritten > 0:
+            t, v = t[overwritten:], v[overwritten:]
+        return t, v
+
+    def last(self):
+        """
+        Dernier échantillon écrit
+        Returns:
+            tuple: (temps, valeur) ou None si vide
+        """
+        w = self.write_index
+        if w <= self.floor:
+            return None
+        i = (w - 1) % self.capacity
+        return self._time[i], self._value[i]
+
+    def clear(self):
+        """
+        Vide le buffer vu par le lecteur (sans réallocation)
+        Note: Seul l'index plancher est modifié: appelable par le lecteur
+              pendant que le producteur écrit
+        """
+        self.floor = self.write_index
+
+
+class SharedSampleRingBuffer(SampleRingBuffer):
+    """Buffer circulaire en mémoire partagée (un processus écrit, les autres lisent)"""
+
+    # En-tête int64: index d'écriture, capacité, index réservé
+    HEADER_SIZE = 3
+
+    def __init__(self, capacity=SampleRingBuffer.DEFAULT_CAPACITY, name=None, readonly=False):
+        """
+        Crée le segment partagé, ou s'attache à un segment existant
+        Args:
+            capacity (int): Nombre maximal d'échantillons (création seulement)
+            name (str): Nom du segment existant (None = création)
+            readonly (bool): Vues en lecture seule, écriture refusée
+        Note: Le créateur est propriétaire du segment: close() le supprime.
+              L'index d'écriture est publié après les données: un lecteur
+              ne voit que des échantillons complets
+        """
+        self.owner = name is None
+        if self.owner:
+            if capacity < 1:
+                raise ValueError(f"Capacité invalide: {capacity}")
+            capacity = int(capacity)
+            size = 8 * (self.HEADER_SIZE + 4 * capacity)
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+        self._header = np.ndarray(self.HEADER_SIZE, dtype=np.int64, buffer=self.shm.buf)
+        if self.owner:
+            self._header[:] = (0, capacity, 0)
+        self.capacity = int(self._header[1])
+        data = np.ndarray((2, 2 * self.capacity), dtype=float, buffer=self.shm.buf,
+                          offset=8 * self.HEADER_SIZE)
+        self._time = data[0]
+        self._value = data[1]
+        self.floor = 0  # Index d'effacement propre à ce processus
+        self.readonly = False
+        if readonly:
+            self.set_readonly()
+
+    @property
+    def write_index(self):
+        """Nombre total d'échantillons écrits (lu dans le segment partagé)"""
+        return int(self._header[0])
+
+    @write_index.setter
+    def write_index(self, value):
+        self._header[0] = value
+
+    @property
+    def reserve_index(self):
+        """Fin de l'écriture en cours (lu dans le segment partagé)"""
+        return int(self._header[2])
+
+    @reserve_index.setter
+    def reserve_index(self, value):
+        self._header[2] = value
+
+    def set_readonly(self):
+        """Passe ce processus en lecture seule (vues numpy non modifiables)"""
+        self.readonly = True
+        self._header.flags.writeable = False
+        self._time.flags.writeable = False
+        self._value.flags.writeable = False
+
+    def _check_writable(self):
+        if self.readonly:
+            raise PermissionError(f"Buffer partagé {self.name} en lecture seule")
+
+    def append(self, t, value):
+        self._check_writable()
+        super().append(t, value)
+
+    def extend(self, times, values):
+        self._check_writable()
+        super().extend(times, values)
+
+    def close(self):
+        """Détache le segment (et le supprime si ce processus l'a créé)"""
+        self._header = self._time = self._value = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # Vues encore utilisées (graphique): libérées avec elles
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+            self.owner = False
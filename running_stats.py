@@ -0,0 +1,250 @@
+"""
+Statistiques incrémentales (algorithme de Welford)
+Chaque échantillon met à jour compte, min, max, moyenne et variance en
+O(1), sans reparcourir l'historique; des résultats partiels (blocs,
+threads) peuvent être fusionnés (formule de Chan et al.)
+"""
+from collections import deque
+import math
+
+import numpy as np
+
+
+class RunningStats:
+    """Statistiques cumulées sur toutes les valeurs reçues"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Somme des carrés des écarts à la moyenne
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, x):
+        """
+        Ajoute une valeur
+        Args:
+            x (float): Valeur
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def push_many(self, values):
+        """
+        Ajoute un bloc de valeurs (calcul vectorisé puis fusion)
+        Args:
+            values (array): Valeurs
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        chunk = RunningStats()
+        chunk.count = len(values)
+        chunk.mean = float(np.mean(values))
+        chunk.m2 = float(np.sum((values - chunk.mean) ** 2))
+        chunk.min = float(np.min(values))
+        chunk.max = float(np.max(values))
+        self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Fusionne les statistiques d'un autre ensemble de valeurs
+        Args:
+            other (RunningStats): Résultat partiel à intégrer
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self):
+        """Variance de population (comme numpy.var, ddof=0)"""
+        return self.m2 / self.count if self.count > 0 else 0.0
+
+    @property
+    def std(self):
+        """Écart-type de population (comme numpy.std, ddof=0)"""
+        return math.sqrt(max(self.variance, 0.0))
+
+    def reset(self):
+        """Remet les statistiques à zéro"""
+        self.__init__()
+
+
+class WindowedStats:
+    """Statistiques glissantes sur les N dernières valeurs"""
+
+    def __init__(self, window):
+        """
+        Args:
+            window (int): Nombre de valeurs de la fenêtre
+        """
+        if window < 1:
+            raise ValueError(f"Fenêtre invalide: {window}")
+        self.window = int(window)
+        self.reset()
+
+    def push(self, x):
+        """
+        Ajoute une valeur (la plus ancienne sort si la fenêtre est pleine)
+        Args:
+            x (float): Valeur
+        """
+        index = self._index
+        self._index += 1
+        self._values.append(x)
+
+        # Recalcul exact une fois par fenêtre: les arrondis du glissement
+        # ne s'accumulent pas (O(1) amorti)
+        if self._index % self.window == 0 and len(self._values) > self.window:
+            self._values.popleft()
+            self._recompute()
+            self._push_extrema(index, x)
+            return
+
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            # Remplacement de old par x (Welford à taille constante)
+            delta = x - old
+            old_mean = self.mean
+            self.mean += delta / self.window
+            self.m2 += delta * (x - self.mean + old - old_mean)
+        else:
+            delta = x - self.mean
+            self.mean += delta / len(self._values)
+            self.m2 += delta * (x - self.mean)
+
+        self._push_extrema(index, x)
+
+    def _recompute(self):
+        """Moyenne et somme des carrés des écarts recalculées sur la fenêtre"""
+        values = np.fromiter(self._values, dtype=float, count=len(self._values))
+        self.mean = float(np.mean(values))
+        self.m2 = float(np.sum((values - self.mean) ** 2))
+
+    def _push_extrema(self, index, x):
+        """Min/max par files monotones: O(1) amorti"""
+        first = self._index - len(self._values)
+        while self._min_queue and self._min_queue[-1][1] >= x:
+            self._min_queue.pop()
+        self._min_queue.append((index, x))
+        while self._min_queue[0][0] < first:
+            self._min_queue.popleft()
+        while self._max_queue and self._max_queue[-1][1] <= x:
+            self._max_queue.pop()
+        self._max_queue.append((index, x))
+        while self._max_queue[0][0] < first:
+            self._max_queue.popleft()
+
+    def push_many(self, values):
+        """
+        Ajoute un bloc de valeurs
+        Args:
+            values (array): Valeurs
+        """
+        values = np.asarray(values, dtype=float)
+        for x in values[-self.window:].tolist():
+            self.push(x)
+
+    @property
+    def count(self):
+        return len(self._values)
+
+    @property
+    def min(self):
+        return self._min_queue[0][1] if self._min_queue else math.inf
+
+    @property
+    def max(self):
+        return self._max_queue[0][1] if self._max_queue else -math.inf
+
+    @property
+    def variance(self):
+        """Variance de population sur la fenêtre (ddof=0)"""
+        return max(self.m2, 0.0) / self.count if self.count > 0 else 0.0
+
+    @property
+    def std(self):
+        """Écart-type de population sur la fenêtre (ddof=0)"""
+        return math.sqrt(self.variance)
+
+    def reset(self):
+        """Vide la fenêtre"""
+        self._values = deque()
+        self._min_queue = deque()
+        self._max_queue = deque()
+        self._index = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+
+class SeriesStats:
+    """Statistiques d'une série horodatée: valeurs et intervalles entre mesures"""
+
+    def __init__(self, window=1000):
+        """
+        Args:
+            window (int): Taille de la fenêtre glissante des valeurs récentes
+        """
+        self.values = RunningStats()
+        self.intervals = RunningStats()
+        self.recent = WindowedStats(window)
+        self.last_time = None
+        self.last_value = None
+
+    def push(self, t, value):
+        """
+        Ajoute un échantillon
+        Args:
+            t (float): Temps en secondes
+            value (float): Valeur mesurée
+        """
+        if self.last_time is not None:
+            self.intervals.push(t - self.last_time)
+        self.values.push(value)
+        self.recent.push(value)
+        self.last_time = t
+        self.last_value = value
+
+    def push_many(self, times, values):
+        """
+        Ajoute un bloc d'échantillons
+        Args:
+            times (array): Temps en secondes
+            values (array): Valeurs mesurées
+        """
+        times = np.asarray(times, dtype=float)
+        values = np.asarray(values, dtype=float)
+        if len(times) == 0:
+            return
+        if self.last_time is not None:
+            self.intervals.push(times[0] - self.last_time)
+        self.intervals.push_many(np.diff(times))
+        self.values.push_many(values)
+        self.recent.push_many(values)
+        self.last_time = float(times[-1])
+        self.last_value = float(values[-1])
+
+    def reset(self):
+        """Remet toutes les statistiques à zéro"""
+        self.values.reset()
+        self.intervals.reset()
+        self.recent.reset()
+        self.last_time = None
+        self.last_value = None
@@ -0,0 +1,28 @@
+"""
+Configuration pytest: modules du projet importables depuis tests/ et
+instrument simulé ('SIM0::16::INSTR') pour les tests sans matériel
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from keithley2000 import Keithley2000  # noqa: E402
+from visa_pool import get_pool  # noqa: E402
+
+# Adresse de l'instrument simulé
+SIM_ADDRESS = 'SIM0::16::INSTR'
+
+
+@pytest.fixture
+def keithley():
+    """Keithley2000 connecté au simulateur, DCV à NPLC 0.01 (lectures rapides)"""
+    k = Keithley2000(SIM_ADDRESS)
+    k.configure_measurement('DCV')
+    k.set_nplc(0.01)
+    yield k
+    k.disconnect()
+    # Session fermée: chaque test repart d'un simulateur neuf
+    get_pool().close_all()
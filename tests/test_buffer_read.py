@@ -0,0 +1,41 @@
+"""Lecture du buffer: transfert binaire et repli ASCII"""
+import numpy as np
+import pytest
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
+
+
+def fill_buffer(keithley, points):
+    keithley.buffer_configure(points)
+    keithley.buffer_start(points)
+    assert keithley.buffer_wait_complete(timeout=5.0)
+
+
+@pytest.mark.parametrize('data_format', ['SREAL', 'DREAL', 'ASC'])
+def test_buffer_read_formats(keithley, data_format):
+    fill_buffer(keithley, 100)
+    values = keithley.buffer_read(data_format)
+    assert len(values) == 100
+    assert np.allclose(values, 1.0, atol=1e-3)
+
+
+def test_binary_failure_falls_back_after_device_clear(keithley):
+    fill_buffer(keithley, 50)
+    reference = keithley.buffer_read('DREAL')
+    fill_buffer(keithley, 50)
+
+    # Bloc binaire demandé puis lecture interrompue: le bloc reste en sortie
+    def broken(message, **kwargs):
+        keithley.meter.write(message)
+        raise VisaIOError(constants.StatusCode.error_timeout)
+
+    keithley.meter.query_binary_values = broken
+    try:
+        values = keithley.buffer_read('SREAL')
+    finally:
+        del keithley.meter.query_binary_values
+
+    assert len(values) == 50
+    assert np.allclose(values, reference, atol=1e-3)
+    # Instrument resté utilisable en texte
+    assert np.isfinite(keithley.measure_single())
@@ -0,0 +1,95 @@
+"""Capture: session réservée de l'armement à la lecture (autres threads en attente)"""
+import threading
+import time
+
+from keithley2000 import Keithley2000
+from visa_pool import PRIORITY_LOW, io_priority
+
+from conftest import SIM_ADDRESS
+
+
+def _intrude(results):
+    """Mesure unique d'un autre thread (priorité interface), sur la même session"""
+    other = Keithley2000(SIM_ADDRESS)
+    try:
+        with io_priority(PRIORITY_LOW):
+            results.append(other.measure_single())
+    finally:
+        other.disconnect()
+
+
+class _IntrudingEvent(threading.Event):
+    """Lance une mesure concurrente pendant l'attente du lot (entre INIT et FETC?)"""
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = results
+        self.thread = None
+
+    def wait(self, timeout=None):
+        self.thread = threading.Thread(target=_intrude, args=(self.results,))
+        self.thread.start()
+        time.sleep(0.05)
+        return super().wait(timeout)
+
+
+def test_batch_not_rearmed_by_other_thread(keithley):
+    keithley.measure_batch_timed(20)  # Durée de lecture connue: attente non nulle
+    results = []
+    stop_event = _IntrudingEvent(results)
+    values, times = keithley.measure_batch_timed(300, stop_event=stop_event)
+    stop_event.thread.join(5.0)
+    assert len(values) == 300
+    assert len(results) == 1 and abs(results[0] - 1.0) < 1e-3
+
+
+def test_stream_rearms_after_other_thread(keithley):
+    deadline = time.perf_counter() + 10.0
+    sizes = []
+    for chunk in keithley.buffer_stream(100, max_points=300,
+                                        should_stop=lambda: time.perf_counter() > deadline):
+        sizes.append(len(chunk['values']))
+        # Entre deux blocs: un autre thread reconfigure pour une mesure unique
+        results = []
+        thread = threading.Thread(target=_intrude, args=(results,))
+        thread.start()
+        thread.join(5.0)
+        assert len(results) == 1
+    assert sizes == [100, 100, 100]
+
+
+def test_synchronized_capture_not_interleaved(monkeypatch):
+    from multi_instrument import AcquisitionManager
+    from visa_pool import get_pool
+
+    manager = AcquisitionManager()
+    manager.add_instrument('dmm1', SIM_ADDRESS, nplc=0.01)
+    manager.add_instrument('dmm2', 'SIM0::17::INSTR', nplc=0.01)
+    second = manager.channels['dmm2'].keithley
+    arm = second.arm_bus_trigger
+    results = []
+    threads = []
+
+    def arm_then_intrude(count=1):
+        # Entre l'armement et le GET: un autre thread mesure sur dmm1
+        arm(count)
+        thread = threading.Thread(target=_intrude, args=(results,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(second, 'arm_bus_trigger', arm_then_intrude)
+    try:
+        capture = manager.capture_synchronized(samples=10, deliver=False)
+        threads[0].join(5.0)
+    finally:
+        manager.close()
+        get_pool().close_all()
+
+    assert not capture['errors'], capture['errors']
+    assert [len(v) for _, v in capture['readings'].values()] == [10, 10]
+    assert len(results) == 1 and abs(results[0] - 1.0) < 1e-3
+    trigger = capture['trigger']
+    assert trigger['methods'] == {'SIM0': 'GET groupé'}
+    # GET groupé: borne = durée de la commande
+    assert trigger['skew'] == trigger['uncertainty'] > 0.0
@@ -0,0 +1,66 @@
+"""Détection des instruments: échéance par interface, résultats partiels"""
+import time
+
+import pytest
+
+import keithley2000
+from keithley2000 import Keithley2000
+
+IDN = 'KEITHLEY INSTRUMENTS INC.,MODEL 2000,1234567,A19'
+
+
+class FakeInstrument:
+    def __init__(self, delay, idn):
+        self.delay = delay
+        self.idn = idn
+        self.timeout = None
+
+    def query(self, command):
+        time.sleep(min(self.delay, self.timeout / 1000))
+        if self.idn is None:
+            raise TimeoutError("Pas de réponse")
+        return self.idn
+
+    def close(self):
+        pass
+
+
+class FakeManager:
+    """GPIB0: adresses muettes et lentes; USB0: un Keithley qui répond vite"""
+
+    def __init__(self, silent=20, delay=0.2):
+        self.silent = [f'GPIB0::{i}::INSTR' for i in range(1, silent + 1)]
+        self.delay = delay
+
+    def list_resources(self):
+        return tuple(self.silent) + ('USB0::0x05E6::0x2000::1234567::INSTR',)
+
+    def open_resource(self, resource):
+        if resource.startswith('USB0'):
+            return FakeInstrument(0.01, IDN)
+        return FakeInstrument(self.delay, None)
+
+
+@pytest.fixture
+def fake_visa(monkeypatch):
+    manager = FakeManager()
+    monkeypatch.setattr(keithley2000, 'resource_manager', lambda: manager)
+    monkeypatch.delenv(Keithley2000.SIMULATOR_ENV, raising=False)
+    return manager
+
+
+def test_slow_interface_does_not_starve_others(fake_visa):
+    t_start = time.perf_counter()
+    found = Keithley2000.list_resources(timeout=1000, max_workers=2, deadline=0.3)
+    elapsed = time.perf_counter() - t_start
+    assert found == ['USB0::0x05E6::0x2000::1234567::INSTR - MODEL 2000']
+    # GPIB0 abandonnée à son échéance au lieu de 20 x 0.2 s / 2
+    assert elapsed < 1.0
+
+
+def test_partial_results_kept_on_error(fake_visa):
+    def on_found(name):
+        raise RuntimeError("Interface fermée")
+
+    found = Keithley2000.list_resources(on_found=on_found, max_workers=4, deadline=0.3)
+    assert found == ['USB0::0x05E6::0x2000::1234567::INSTR - MODEL 2000']
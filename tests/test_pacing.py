@@ -0,0 +1,108 @@
+"""Cadenceur à grille absolue (horloge simulée, sans attente réelle)"""
+import pytest
+
+from pacing import PacedScheduler
+
+
+class _FakeClock:
+    """Horloge simulée; l'attente d'un créneau avance l'horloge (stop_event factice)"""
+
+    def __init__(self, now=100.0):
+        self.now = now
+        self.stop = False
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, duration):
+        self.now += duration
+
+    def wait(self, timeout):
+        # Interface threading.Event.wait: True = arrêt demandé
+        if self.stop:
+            return True
+        self.now += timeout
+        return False
+
+
+# Valeurs binaires exactes: pas d'arrondi dans les comparaisons
+INTERVAL = 0.125
+MEASURE = 0.03125
+
+
+def test_no_drift_over_many_slots():
+    clock = _FakeClock()
+    scheduler = PacedScheduler(INTERVAL, clock=clock)
+    for k in range(10000):
+        slot, target, lateness = scheduler.wait_next(clock)
+        assert slot == k
+        assert target == scheduler.start + k * INTERVAL
+        assert lateness == 0.0
+        clock.advance(MEASURE)  # Durée de la mesure: ne décale pas la grille
+
+    # Après 10000 créneaux, l'horloge reste sur la grille (aucune accumulation)
+    assert clock.now == scheduler.start + 9999 * INTERVAL + MEASURE
+    assert scheduler.get_stats()['missed'] == 0
+
+
+def test_overrun_skips_ahead_on_grid():
+    clock = _FakeClock()
+    scheduler = PacedScheduler(INTERVAL, clock=clock)
+    scheduler.wait_next(clock)
+    clock.advance(MEASURE)
+    scheduler.wait_next(clock)                  # Créneau 1
+    clock.advance(3.5 * INTERVAL)               # Mesure bien trop longue
+
+    slot, target, lateness = scheduler.wait_next(clock)
+    # Créneaux 2 et 3 dépassés de plus d'une période: sautés et comptés
+    assert slot == 4
+    assert target == scheduler.start + 4 * INTERVAL
+    assert lateness == 0.5 * INTERVAL
+    assert scheduler.missed == 2
+
+    # Retour sur la grille d'origine, sans décalage
+    clock.advance(MEASURE)
+    slot, target, lateness = scheduler.wait_next(clock)
+    assert (slot, target, lateness) == (5, scheduler.start + 5 * INTERVAL, 0.0)
+
+    stats = scheduler.get_stats()
+    assert stats['count'] == 4
+    assert stats['lateness_max'] == 0.5 * INTERVAL
+
+
+def test_late_within_one_period_is_not_skipped():
+    clock = _FakeClock()
+    scheduler = PacedScheduler(INTERVAL, clock=clock)
+    scheduler.wait_next(clock)
+    clock.advance(1.5 * INTERVAL)
+    slot, _, lateness = scheduler.wait_next(clock)
+    assert slot == 1
+    assert lateness == 0.5 * INTERVAL
+    assert scheduler.missed == 0
+
+
+def test_resume_after_pause_does_not_count_missed():
+    clock = _FakeClock()
+    scheduler = PacedScheduler(INTERVAL, clock=clock)
+    scheduler.wait_next(clock)
+    clock.advance(10 * INTERVAL + MEASURE)      # Pause
+    scheduler.resume()
+    slot, target, lateness = scheduler.wait_next(clock)
+    assert slot == 11
+    assert target == scheduler.start + 11 * INTERVAL
+    assert lateness == 0.0
+    assert scheduler.missed == 0
+
+
+def test_stop_interrupts_wait():
+    clock = _FakeClock()
+    scheduler = PacedScheduler(INTERVAL, clock=clock)
+    scheduler.wait_next(clock)
+    clock.stop = True
+    assert scheduler.wait_next(clock) is None
+    assert scheduler.count == 1
+
+
+def test_invalid_interval():
+    with pytest.raises(ValueError):
+        PacedScheduler(0)
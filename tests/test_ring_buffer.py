@@ -0,0 +1,112 @@
+"""Buffer circulaire d'échantillons (local et en mémoire partagée)"""
+import sys
+import threading
+
+import numpy as np
+
+from ring_buffer import SampleRingBuffer, SharedSampleRingBuffer
+
+
+def test_latest_is_contiguous_after_wrap():
+    ring = SampleRingBuffer(5)
+    ring.extend(np.arange(12.0), np.arange(12.0) * 2)
+    t, v = ring.latest()
+    assert list(t) == [7, 8, 9, 10, 11]
+    assert list(v) == [14, 16, 18, 20, 22]
+    assert ring.last() == (11, 22)
+
+
+def test_clear_masks_without_touching_write_index():
+    ring = SampleRingBuffer(10)
+    ring.extend(np.arange(4.0), np.arange(4.0))
+    ring.clear()
+    assert ring.write_index == 4
+    assert len(ring) == 0
+    assert ring.last() is None
+    ring.append(4.0, 40.0)
+    t, v = ring.latest()
+    assert list(t) == [4.0] and list(v) == [40.0]
+
+
+def test_clear_while_producer_writes():
+    # Le producteur seul écrit l'index: aucun point perdu ni compté deux fois
+    ring = SampleRingBuffer(100000)
+    total = 50000
+    done = threading.Event()
+
+    def produce():
+        for i in range(total):
+            ring.append(float(i), float(i))
+        done.set()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    clears = 0
+    while not done.is_set():
+        ring.clear()
+        clears += 1
+    thread.join()
+
+    assert ring.write_index == total
+    t, _ = ring.latest()
+    # Points restants: suite continue jusqu'au dernier écrit
+    assert len(t) == total - ring.floor
+    assert np.array_equal(t, np.arange(ring.floor, total, dtype=float))
+    assert clears > 0
+
+
+def _follow(ring, total):
+    """
+    Suit le buffer par since() pendant que le producteur écrit
+    Returns:
+        tuple: (valeurs reçues, points perdus)
+    """
+    index = 0
+    received = []
+    lost_total = 0
+    while index < total:
+        t, v, w, lost = ring.since(index)
+        # Points reçus: suite continue finissant juste avant l'index courant
+        assert len(t) + lost == w - index
+        assert np.array_equal(t, np.arange(w - len(t), w, dtype=float))
+        assert np.array_equal(v, t)
+        received.extend(t)
+        lost_total += lost
+        index = w
+    return received, lost_total
+
+
+def test_shared_since_with_concurrent_producer():
+    # Petite capacité: le producteur double souvent le lecteur; bascules
+    # fréquentes entre threads pour interrompre les copies
+    ring = SharedSampleRingBuffer(64)
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        total = 200000
+
+        def produce():
+            i = 0
+            while i < total:
+                if i % 7 == 0:
+                    ring.append(float(i), float(i))
+                    i += 1
+                else:
+                    n = min(total - i, 1 + i % 50)
+                    block = np.arange(i, i + n, dtype=float)
+                    ring.extend(block, block)
+                    i += n
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        received, lost = _follow(ring, total)
+        thread.join()
+
+        # Ni doublon ni trou non compté
+        assert len(received) + lost == total
+        assert np.all(np.diff(received) > 0)
+        t, _ = ring.snapshot()
+        assert np.array_equal(t, np.arange(total - 64, total, dtype=float))
+    finally:
+        sys.setswitchinterval(switch_interval)
+        ring.close()
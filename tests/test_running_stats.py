@@ -0,0 +1,89 @@
+"""Statistiques incrémentales comparées à NumPy"""
+import numpy as np
+import pytest
+
+from ring_buffer import SampleRingBuffer
+from running_stats import RunningStats, SeriesStats, WindowedStats
+
+RNG = np.random.default_rng(1)
+# Valeurs à fort décalage: met en défaut une formule naïve sum(x²) - n·mean²
+VALUES = 1e6 + RNG.normal(scale=1e-3, size=5000)
+
+
+def assert_matches(stats, values):
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(np.mean(values), rel=1e-12)
+    assert stats.std == pytest.approx(np.std(values), rel=1e-6)
+    assert stats.min == np.min(values)
+    assert stats.max == np.max(values)
+
+
+def test_welford_push():
+    stats = RunningStats()
+    for x in VALUES:
+        stats.push(x)
+    assert_matches(stats, VALUES)
+
+
+def test_chan_merge_of_blocks():
+    stats = RunningStats()
+    for block in np.array_split(VALUES, 17):
+        stats.push_many(block)
+    assert_matches(stats, VALUES)
+
+    left, right = RunningStats(), RunningStats()
+    left.push_many(VALUES[:1234])
+    right.push_many(VALUES[1234:])
+    left.merge(right)
+    assert_matches(left, VALUES)
+
+
+def test_reset():
+    stats = RunningStats()
+    stats.push_many(VALUES)
+    stats.reset()
+    assert stats.count == 0 and stats.std == 0.0
+    stats.push_many(VALUES[:100])
+    assert_matches(stats, VALUES[:100])
+
+
+@pytest.mark.parametrize('window', [1, 7, 1000])
+def test_windowed_after_wrap(window):
+    stats = WindowedStats(window)
+    for i, x in enumerate(VALUES[:3000]):
+        stats.push(x)
+        if i % 97 == 0 or i == 2999:
+            assert_matches(stats, VALUES[max(0, i + 1 - window):i + 1])
+
+
+def test_windowed_push_many_and_reset():
+    stats = WindowedStats(100)
+    for block in np.array_split(VALUES, 13):
+        stats.push_many(block)
+    assert_matches(stats, VALUES[-100:])
+    stats.reset()
+    stats.push_many(VALUES[:10])
+    assert_matches(stats, VALUES[:10])
+
+
+def test_series_stats_with_wrapping_ring():
+    # Statistiques cumulées: toutes les valeurs, même sorties du buffer
+    times = np.cumsum(RNG.uniform(0.001, 0.002, size=len(VALUES)))
+    ring = SampleRingBuffer(1000)
+    series = SeriesStats(window=500)
+    for t_block, v_block in zip(np.array_split(times, 9), np.array_split(VALUES, 9)):
+        ring.extend(t_block, v_block)
+        series.push_many(t_block, v_block)
+
+    assert len(ring) == 1000
+    assert_matches(series.values, VALUES)
+    assert_matches(series.recent, VALUES[-500:])
+    assert_matches(series.intervals, np.diff(times))
+    _, recent = ring.latest(500)
+    assert series.recent.mean == pytest.approx(np.mean(recent), rel=1e-12)
+
+    series.reset()
+    ring.clear()
+    series.push(1.0, 2.0)
+    series.push(1.5, 4.0)
+    assert series.values.mean == 3.0 and series.intervals.mean == 0.5
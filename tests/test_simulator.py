@@ -0,0 +1,63 @@
+"""Parcours complet du pilote sur l'instrument simulé (adresse SIM...)"""
+import numpy as np
+
+from conftest import SIM_ADDRESS
+
+
+def test_connect_and_identify(keithley):
+    assert keithley.connected
+    assert keithley.session.resource_name == SIM_ADDRESS
+    assert 'MODEL 2000' in keithley.get_id()
+
+
+def test_single_and_fast(keithley):
+    assert abs(keithley.measure_single() - 1.0) < 1e-3
+    assert abs(keithley.measure_fast() - 1.0) < 1e-3
+
+
+def test_batch(keithley):
+    values, times = keithley.measure_batch_timed(50)
+    assert len(values) == 50
+    assert np.all(np.diff(times) > 0)
+    assert keithley.batch_size(0.1) >= 1
+
+
+def test_buffer(keithley):
+    keithley.buffer_configure(200)
+    keithley.buffer_start(200)
+    assert keithley.buffer_wait_complete(timeout=5.0)
+    values, times = keithley.buffer_read_timed()
+    assert len(values) == 200 and len(times) == 200
+    assert keithley.last_wait_stats['method'] in ('srq', 'poll')
+
+
+def test_stream(keithley):
+    chunks = list(keithley.buffer_stream(100, max_points=350))
+    assert sum(len(c['values']) for c in chunks) == 350
+    assert keithley.stream_stats['chunks'] == 4
+
+
+def test_error_queue(keithley):
+    assert keithley.get_error().startswith('0,')
+    keithley.write_raw('BOGUS:CMD')
+    code = int(keithley.get_error().split(',')[0])
+    assert code < 0
+    keithley.clear_errors()
+    assert keithley.get_error().startswith('0,')
+
+
+def test_timer_stream_stays_on_grid(keithley):
+    # Blocs réarmés sur la grille du timer: instants réels (simulateur) réguliers
+    interval = 0.05
+    truth, stamped = [], []
+    for chunk in keithley.buffer_stream(10, max_points=30, timer_interval=interval):
+        truth.extend(keithley.meter.trigger_times()[:len(chunk['values'])])
+        stamped.extend(chunk['times'])
+    keithley.set_trigger_source('IMM')
+
+    truth, stamped = np.array(truth), np.array(stamped)
+    assert len(truth) == 30
+    assert np.max(np.abs(np.diff(truth) - interval)) < 0.003
+    assert np.max(np.abs(stamped - truth)) < 0.003
+    assert keithley.stream_stats['lost_samples'] == 0
+    assert keithley.stream_stats['slip_max'] < 0.003
@@ -0,0 +1,115 @@
+"""Latence d'arrêt et de pause des acquisitions (instrument simulé)"""
+import threading
+import time
+
+from acquisition_process import run_paced, run_stream
+from ring_buffer import SampleRingBuffer
+
+# Latence maximale tolérée entre la demande et la fin de l'attente (s)
+LATENCY_BUDGET = 0.1
+
+
+def _stop_latency(target, stop_event, delay):
+    """
+    Exécute target dans un thread et lève stop_event après delay secondes
+    Returns:
+        float: Durée entre la demande d'arrêt et la fin du thread (s)
+    """
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    time.sleep(delay)
+    t_stop = time.perf_counter()
+    stop_event.set()
+    thread.join(5.0)
+    assert not thread.is_alive()
+    return time.perf_counter() - t_stop
+
+
+def _assert_session_free(keithley):
+    """Instrument utilisable aussitôt après l'arrêt (ni lecture ni session en suspens)"""
+    assert abs(keithley.measure_single() - 1.0) < 1e-2
+
+
+def test_single_stop(keithley):
+    ring = SampleRingBuffer()
+    stop_event = threading.Event()
+    latency = _stop_latency(lambda: run_paced(keithley, ring, stop_event, {'interval': 0.05}),
+                            stop_event, 0.3)
+    assert latency < LATENCY_BUDGET
+    assert len(ring) > 0
+    _assert_session_free(keithley)
+
+
+def test_batch_stop_mid_batch(keithley):
+    # Lot d'étalonnage (10 lectures) au créneau 0, lot de ~0.8 s au créneau 1
+    keithley.set_nplc(1)
+    ring = SampleRingBuffer()
+    stop_event = threading.Event()
+    config = {'interval': 1.0, 'batch': True, 'batch_fill': 0.8}
+    latency = _stop_latency(lambda: run_paced(keithley, ring, stop_event, config),
+                            stop_event, 1.3)
+    assert latency < LATENCY_BUDGET
+    assert len(ring) == keithley.BATCH_CALIBRATION  # Lot interrompu abandonné
+    keithley.set_nplc(0.01)
+    _assert_session_free(keithley)
+
+
+def test_buffer_stop(keithley):
+    keithley.buffer_configure(1024)
+    keithley.buffer_start(1024, timer_interval=0.01)  # ~10 s d'acquisition
+    stop_event = threading.Event()
+    result = []
+    latency = _stop_latency(
+        lambda: result.append(keithley.buffer_wait_complete(stop_event=stop_event)),
+        stop_event, 0.2)
+    assert latency < LATENCY_BUDGET
+    assert result == [False]
+    keithley.abort(clear=True)
+    keithley.set_trigger_source('IMM')
+    _assert_session_free(keithley)
+
+
+def test_stream_stop(keithley):
+    ring = SampleRingBuffer()
+    stop_event = threading.Event()
+    config = {'chunk_points': 100, 'timer_interval': 0.01}  # Blocs de ~1 s
+    result = []
+    latency = _stop_latency(
+        lambda: result.append(run_stream(keithley, ring, stop_event, config)),
+        stop_event, 0.3)
+    assert latency < LATENCY_BUDGET
+    assert result == ['stopped']
+    assert len(ring) == 0
+    keithley.set_trigger_source('IMM')
+    _assert_session_free(keithley)
+
+
+def test_pause_resume(keithley):
+    interval = 0.05
+    ring = SampleRingBuffer()
+    stop_event = threading.Event()
+    resume_event = threading.Event()
+    resume_event.set()
+    thread = threading.Thread(target=run_paced, daemon=True,
+                              args=(keithley, ring, stop_event, {'interval': interval}),
+                              kwargs={'resume_event': resume_event})
+    thread.start()
+    time.sleep(0.3)
+
+    # Pause: au plus la mesure du créneau déjà attendu
+    resume_event.clear()
+    time.sleep(interval + LATENCY_BUDGET)
+    paused_count = ring.write_index
+    time.sleep(0.3)
+    assert ring.write_index == paused_count
+
+    # Reprise: mesure au créneau suivant
+    t_resume = time.perf_counter()
+    resume_event.set()
+    while ring.write_index == paused_count:
+        assert time.perf_counter() - t_resume < interval + LATENCY_BUDGET
+        time.sleep(0.001)
+
+    stop_event.set()
+    thread.join(5.0)
+    assert not thread.is_alive()
@@ -0,0 +1,263 @@
+"""
+Interface en mode strict sur l'instrument simulé: aucun appel VISA depuis
+le thread Tk, aucun blocage du thread Tk au-delà du budget (UIDispatcher)
+Les onglets demandent un affichage Tk (test ignoré sans $DISPLAY); la
+paire dispatcher / exécuteur est aussi vérifiée sans affichage, avec une
+boucle after minimale
+"""
+from contextlib import contextmanager
+import heapq
+import itertools
+import sys
+import threading
+import time
+import traceback
+
+import pytest
+
+from gui.ui_dispatcher import CommandExecutor, UIDispatcher
+from keithley2000 import Keithley2000
+from visa_pool import PRIORITY_HIGH, SessionPool, get_pool, io_priority
+
+from conftest import SIM_ADDRESS
+
+
+@pytest.fixture
+def visa_guard(monkeypatch):
+    """
+    Enregistre tout accès VISA (transaction, ouverture de session) fait
+    depuis le thread courant (thread Tk du test)
+    Returns:
+        list: Piles d'appel des accès fautifs
+    """
+    tk_thread = threading.current_thread()
+    violations = []
+    transaction = Keithley2000._transaction
+    acquire = SessionPool.acquire
+
+    def check():
+        if threading.current_thread() is tk_thread:
+            violations.append(''.join(traceback.format_stack(limit=10)))
+
+    @contextmanager
+    def guarded_transaction(self):
+        check()
+        with transaction(self):
+            yield
+
+    def guarded_acquire(self, *args, **kwargs):
+        check()
+        return acquire(self, *args, **kwargs)
+
+    monkeypatch.setattr(Keithley2000, '_transaction', guarded_transaction)
+    monkeypatch.setattr(SessionPool, 'acquire', guarded_acquire)
+    yield violations
+    get_pool().close_all()
+
+
+class _AfterLoop:
+    """Boucle after minimale (sans Tk) exécutée sur le thread du test"""
+
+    def __init__(self):
+        self.jobs = []
+        self.order = itertools.count()
+        self.errors = []
+
+    def after(self, ms, func):
+        job = [time.perf_counter() + ms / 1000, next(self.order), func]
+        heapq.heappush(self.jobs, job)
+        return job
+
+    def after_cancel(self, job):
+        job[2] = None
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.errors.append(exc)
+
+    def run_until(self, condition, timeout=10.0):
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            assert time.perf_counter() < deadline, "Délai dépassé"
+            if self.jobs and self.jobs[0][0] <= time.perf_counter():
+                func = heapq.heappop(self.jobs)[2]
+                if func is not None:
+                    try:
+                        func()
+                    except Exception:
+                        self.report_callback_exception(*sys.exc_info())
+            else:
+                time.sleep(0.001)
+
+
+def test_dispatcher_executor_strict(visa_guard):
+    loop = _AfterLoop()
+    dispatcher = UIDispatcher(loop, strict=True)
+    dispatcher.start()
+    executor = CommandExecutor(dispatcher)
+    keithley = Keithley2000()
+    results = {}
+
+    # Connexion et réglages par l'exécuteur, résultats sur le thread "Tk"
+    executor.submit(keithley.connect, SIM_ADDRESS)
+    executor.submit(keithley.configure_measurement, 'DCV')
+    executor.submit(keithley.set_nplc, 0.01)
+    executor.submit(keithley.get_id, on_done=lambda idn: results.setdefault('idn', idn))
+    loop.run_until(lambda: 'idn' in results)
+    assert 'MODEL 2000' in results['idn']
+
+    # Acquisition (thread prioritaire) et commandes de l'interface en même temps
+    stop_event = threading.Event()
+    received = []
+
+    def acquire():
+        with io_priority(PRIORITY_HIGH):
+            while not stop_event.is_set():
+                batch = keithley.measure_batch_timed(50, stop_event=stop_event)
+                if batch is None:
+                    break
+                received.extend(batch[0])
+                dispatcher.post_latest('graph', lambda: results.__setitem__('points', len(received)))
+
+    thread = threading.Thread(target=acquire, daemon=True)
+    thread.start()
+    for _ in range(5):
+        executor.submit(keithley.query_raw, '*IDN?')
+        executor.submit(keithley.measure_single,
+                        on_done=lambda v: results.setdefault('single', []).append(v))
+    loop.run_until(lambda: len(results.get('single', [])) == 5 and results.get('points', 0) > 200)
+    stop_event.set()
+    thread.join(5.0)
+    loop.run_until(lambda: not executor.busy)
+
+    executor.submit(keithley.disconnect)
+    executor.shutdown(wait=True)
+    loop.run_until(lambda: dispatcher.queue.empty())
+    dispatcher.stop()
+
+    assert not visa_guard, visa_guard[0]
+    assert not loop.errors, loop.errors
+    dispatcher.assert_within_budget()
+
+
+def test_executor_suspended_rejects_commands():
+    loop = _AfterLoop()
+    dispatcher = UIDispatcher(loop)
+    dispatcher.start()
+    executor = CommandExecutor(dispatcher)
+    calls, errors = [], []
+
+    # Instrument piloté par un processus séparé: aucune commande exécutée
+    executor.suspend("Acquisition en processus séparé")
+    executor.submit(calls.append, 'refusée', on_error=errors.append)
+    loop.run_until(lambda: errors)
+    assert calls == []
+    assert str(errors[0]) == "Acquisition en processus séparé"
+    assert executor.stats['rejected'] == 1 and not executor.busy
+
+    executor.resume()
+    executor.submit(calls.append, 'acceptée', on_done=lambda _: errors.append(None))
+    loop.run_until(lambda: len(errors) == 2)
+    assert calls == ['acceptée']
+
+    executor.shutdown(wait=True)
+    dispatcher.stop()
+    assert not loop.errors, loop.errors
+
+
+# ===== Onglets (affichage Tk requis) =====
+
+@pytest.fixture
+def window(visa_guard, monkeypatch, tmp_path):
+    """Fenêtre principale en mode strict, sans dialogues ni scan au démarrage"""
+    tk = pytest.importorskip('tkinter')
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Affichage Tk indisponible: {e}")
+
+    from tkinter import messagebox
+    from discovery_cache import DiscoveryCache
+    from gui import settings_tab
+    from gui.main_window import MainWindow
+
+    dialogs = []
+    for name in ('showinfo', 'showwarning', 'showerror'):
+        monkeypatch.setattr(messagebox, name, lambda *args, **kw: dialogs.append(args))
+    monkeypatch.setattr(messagebox, 'askyesno', lambda *args, **kw: True)
+    monkeypatch.setattr(settings_tab.SettingsTab, 'quick_connect', lambda self: None)
+    monkeypatch.setattr(settings_tab, 'DiscoveryCache',
+                        lambda: DiscoveryCache(str(tmp_path / 'cache.json')))
+
+    errors = []
+    root.report_callback_exception = lambda exc_type, exc, tb: errors.append(exc)
+    main = MainWindow(root)
+    main.dispatcher.strict = True
+    main.callback_errors = errors
+    main.dialogs = dialogs
+    yield main
+    try:
+        main.confirm_exit()
+    finally:
+        root.destroy()
+
+
+def _pump_until(window, condition, timeout=10.0):
+    """Fait tourner la boucle Tk jusqu'à condition()"""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "Délai dépassé"
+        window.root.update()
+        time.sleep(0.002)
+
+
+def _pump_for(window, duration):
+    deadline = time.perf_counter() + duration
+    _pump_until(window, lambda: time.perf_counter() >= deadline, timeout=duration + 1.0)
+
+
+def test_tabs_strict(window, visa_guard):
+    settings = window.settings_tab
+    quick = window.quick_measure_tab
+    advanced = window.advanced_tab
+
+    settings.resource_var.set(SIM_ADDRESS)
+    settings.connect_instrument()
+    _pump_until(window, lambda: window.keithley.connected and not window.executor.busy)
+
+    # Démarrage (création des fenêtres, premier rendu) hors budget
+    _pump_for(window, 0.5)
+    window.dispatcher.stats.update(stalls=0, stall_max=0.0, last_stall=None)
+
+    quick.nplc_var.set(0.01)
+    quick.interval_var.set(0.01)
+    modes = {
+        'single': {},
+        'fast': {'fast_mode_var': True},
+        'batch': {'batch_mode_var': True},
+        'buffer': {'buffer_mode_var': True, 'buffer_points_var': 200},
+        'stream': {'buffer_mode_var': True, 'stream_mode_var': True, 'buffer_points_var': 100},
+    }
+    for name, variables in modes.items():
+        for var in ('fast_mode_var', 'batch_mode_var', 'buffer_mode_var', 'stream_mode_var'):
+            getattr(quick, var).set(False)
+        quick.duration_mode_var.set('infinite')
+        for var, value in variables.items():
+            getattr(quick, var).set(value)
+        quick.toggle_buffer_mode()
+
+        quick.start_measurement()
+        _pump_until(window, lambda: quick.measuring or quick.stop_error)
+        # Commandes de l'interface pendant l'acquisition (en file derrière elle)
+        advanced.quick_command('*IDN?')
+        advanced.acquire_null()
+        _pump_for(window, 0.5)
+        if quick.measuring:
+            quick.stop_measurement()
+        _pump_until(window, lambda: quick.start_btn.cget('state') == 'normal'
+                    and not window.executor.busy)
+        assert not quick.stop_error, f"{name}: {quick.stop_error}"
+        assert len(quick.samples) > 0, name
+
+    assert not visa_guard, visa_guard[0]
+    assert not window.callback_errors, window.callback_errors
+    window.dispatcher.assert_within_budget()
@@ -0,0 +1,96 @@
+"""Pool de sessions: ouverture hors verrou, timeout par instance"""
+import threading
+import time
+
+from keithley2000 import Keithley2000
+from keithley_simulator import SimulatedKeithley2000
+from visa_pool import SessionPool
+
+
+class SlowPool(SessionPool):
+    """Ouverture lente des adresses 'SLOW...' (instrument qui tarde à répondre)"""
+
+    def __init__(self):
+        super().__init__()
+        self.opened = []
+
+    def _open(self, resource_name):
+        self.opened.append(resource_name)
+        if resource_name.startswith('SLOW'):
+            time.sleep(0.5)
+        return SimulatedKeithley2000(resource_name)
+
+
+def test_slow_open_does_not_block_other_addresses():
+    pool = SlowPool()
+    fast = pool.acquire('SIM0::16::INSTR')
+    pool.release(fast)
+
+    slow = threading.Thread(target=pool.acquire, args=('SLOW0::1::INSTR',))
+    slow.start()
+    time.sleep(0.05)
+    t_start = time.perf_counter()
+    reused = pool.acquire('SIM0::16::INSTR')
+    pool.release(reused)
+    assert time.perf_counter() - t_start < 0.1
+    slow.join()
+    pool.close_all()
+
+
+def test_concurrent_acquire_opens_once():
+    pool = SlowPool()
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(pool.acquire('SLOW0::2::INSTR')))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert pool.opened == ['SLOW0::2::INSTR']
+    assert len({id(s) for s in sessions}) == 1
+    assert sessions[0].refcount == 4
+    pool.close_all()
+
+
+def test_failed_open_lets_waiters_retry():
+    pool = SlowPool()
+    calls = []
+
+    def failing_open(resource_name):
+        calls.append(resource_name)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            raise OSError("Ressource occupée")
+        return SimulatedKeithley2000(resource_name)
+
+    pool._open = failing_open
+    errors = []
+
+    def first():
+        try:
+            pool.acquire('SIM0::3::INSTR')
+        except OSError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    time.sleep(0.05)
+    session = pool.acquire('SIM0::3::INSTR')
+    thread.join()
+    assert len(errors) == 1 and session.refcount == 1 and len(calls) == 2
+    pool.close_all()
+
+
+def test_timeout_applied_per_instance():
+    short = Keithley2000('SIM0::17::INSTR', timeout=1000)
+    long = Keithley2000('SIM0::17::INSTR', timeout=7000)
+    assert short.session is long.session
+
+    short.get_id()
+    assert short.meter.timeout == 1000
+    long.get_id()
+    assert long.meter.timeout == 7000
+    short.get_id()
+    assert short.meter.timeout == 1000
+    short.disconnect()
+    long.disconnect()
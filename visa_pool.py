@@ -0,0 +1,359 @@
+"""
+ResourceManager pyvisa partagé et pool de sessions VISA
+Le chargement de la bibliothèque VISA n'est fait qu'une fois par processus;
+les sessions sont partagées entre instances Keithley2000 (compteur de
+références, verrou par session) et restent ouvertes après déconnexion pour
+une reconnexion immédiate
+
+Le verrou de session sérialise les transactions avec deux priorités:
+l'acquisition (PRIORITY_HIGH) passe devant l'interface et la console
+(PRIORITY_LOW), qui s'intercalent entre deux lots sans interrompre une
+transaction en cours
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+import heapq
+import itertools
+import threading
+import time
+
+import pyvisa
+
+from keithley_simulator import SIMULATOR_PREFIX, SimulatedInterface, SimulatedKeithley2000
+
+# Verrou de création des ResourceManager (un par backend)
+_managers_lock = threading.Lock()
+_managers = {}
+_manager_load_times = {}
+
+
+def resource_manager(backend=''):
+    """
+    ResourceManager pyvisa partagé par tout le processus
+    Args:
+        backend (str): Backend VISA ('' = défaut, '@py' = pyvisa-py...)
+    Returns:
+        pyvisa.ResourceManager: Créé au premier appel puis réutilisé
+    """
+    with _managers_lock:
+        rm = _managers.get(backend)
+        if rm is None:
+            t_start = time.perf_counter()
+            rm = pyvisa.ResourceManager(backend) if backend else pyvisa.ResourceManager()
+            _manager_load_times[backend] = time.perf_counter() - t_start
+            _managers[backend] = rm
+        return rm
+
+
+# Priorités d'accès à une session (la plus petite passe en premier)
+PRIORITY_HIGH = 0   # Acquisition (threads de mesure)
+PRIORITY_LOW = 1    # Interface, console SCPI, diagnostics
+
+# Priorité courante de chaque thread (PRIORITY_LOW par défaut)
+_priority = threading.local()
+
+
+def current_priority():
+    """
+    Returns:
+        int: Priorité d'accès aux sessions du thread appelant
+    """
+    return getattr(_priority, 'level', PRIORITY_LOW)
+
+
+@contextmanager
+def io_priority(level):
+    """
+    Fixe la priorité des transactions du thread dans le bloc
+    Args:
+        level (int): PRIORITY_HIGH ou PRIORITY_LOW
+    Usage:
+        with io_priority(PRIORITY_HIGH):
+            keithley.measure_batch(100)
+    """
+    previous = current_priority()
+    _priority.level = level
+    try:
+        yield
+    finally:
+        _priority.level = previous
+
+
+class PriorityLock:
+    """
+    Verrou réentrant à deux files: à la libération, la session est remise
+    directement au demandeur le plus prioritaire (puis le plus ancien); un
+    thread qui revient plus tard ne peut pas doubler un demandeur déjà servi
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._owner = None
+        self._depth = 0
+        self._waiters = []              # Tas de [priorité, ordre, thread, servi]
+        self._order = itertools.count()
+        self.stats = {level: {'acquires': 0, 'contended': 0, 'wait_total': 0.0,
+                              'wait_max': 0.0, 'wait_last': 0.0}
+                      for level in (PRIORITY_HIGH, PRIORITY_LOW)}
+
+    def acquire(self, blocking=True, timeout=-1, priority=None):
+        """
+        Args:
+            blocking (bool): Attend la session si elle est occupée
+            timeout (float): Attente maximale en s (-1 = sans limite)
+            priority (int): Priorité (None = celle du thread, voir io_priority)
+        Returns:
+            bool: True si la session est obtenue
+        """
+        me = threading.get_ident()
+        level = current_priority() if priority is None else priority
+        with self._condition:
+            if self._owner == me:
+                self._depth += 1
+                return True
+            if self._owner is None and not self._waiters:
+                self._owner, self._depth = me, 1
+                self._record(level, 0.0, contended=False)
+                return True
+            if not blocking:
+                return False
+
+            t_start = time.perf_counter()
+            deadline = None if timeout is None or timeout < 0 else t_start + timeout
+            entry = [level, next(self._order), me, False]
+            heapq.heappush(self._waiters, entry)
+            while not entry[3]:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    return False
+                self._condition.wait(remaining)
+            self._record(level, time.perf_counter() - t_start, contended=True)
+            return True
+
+    def release(self):
+        with self._condition:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("Libération d'un verrou non détenu")
+            self._depth -= 1
+            if self._depth:
+                return
+            self._owner = None
+            if self._waiters:
+                # Remise directe au premier de la file
+                entry = heapq.heappop(self._waiters)
+                entry[3] = True
+                self._owner, self._depth = entry[2], 1
+                self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def _record(self, level, wait, contended):
+        stats = self.stats[level]
+        stats['acquires'] += 1
+        stats['wait_last'] = wait
+        if contended:
+            stats['contended'] += 1
+            stats['wait_total'] += wait
+            stats['wait_max'] = max(stats['wait_max'], wait)
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Par priorité ('high', 'low'): acquisitions, attentes,
+                  attente cumulée / maximale / dernière (s), attente moyenne
+                  des accès en conflit; 'queued' = demandeurs en attente
+        """
+        with self._condition:
+            result = {'queued': len(self._waiters)}
+            for name, level in (('high', PRIORITY_HIGH), ('low', PRIORITY_LOW)):
+                stats = dict(self.stats[level])
+                stats['wait_mean'] = (stats['wait_total'] / stats['contended']
+                                      if stats['contended'] else 0.0)
+                result[name] = stats
+        return result
+
+
+class PooledSession:
+    """Session VISA partagée: ressource ouverte, verrou et compteur de références"""
+
+    def __init__(self, resource_name, resource):
+        self.resource_name = resource_name
+        self.resource = resource
+        self.lock = PriorityLock()     # Une transaction à la fois, acquisition prioritaire
+        self.state = {}                # Cache de configuration commun aux instances
+        self.timeout = getattr(resource, 'timeout', None)  # Timeout VISA appliqué (ms)
+        self.refcount = 0
+        self.released_at = None        # Instant de mise au repos (perf_counter)
+
+
+class SessionPool:
+    """Pool de sessions VISA ouvertes, indexées par adresse"""
+
+    # Nombre maximal de sessions inutilisées gardées ouvertes
+    MAX_IDLE = 4
+
+    def __init__(self, backend='', max_idle=MAX_IDLE):
+        """
+        Args:
+            backend (str): Backend VISA du ResourceManager partagé
+            max_idle (int): Sessions inutilisées conservées (les plus anciennes
+                            sont fermées au-delà)
+        """
+        self.backend = backend
+        self.max_idle = max_idle
+        self.lock = threading.Lock()
+        self.sessions = OrderedDict()  # Adresse -> PooledSession
+        self.opening = {}              # Adresse -> Event levé à la fin de l'ouverture
+        self.stats = {
+            'opens': 0, 'open_time': 0.0,
+            'reuses': 0, 'reuse_time': 0.0,
+            'closes': 0, 'close_time': 0.0,
+            'last': None
+        }
+
+    def _record(self, operation, resource_name, duration):
+        """Cumule les durées d'ouverture / réutilisation / fermeture"""
+        key = {'open': 'opens', 'reuse': 'reuses', 'close': 'closes'}[operation]
+        self.stats[key] += 1
+        self.stats[f'{operation}_time'] += duration
+        self.stats['last'] = {'operation': operation, 'resource': resource_name,
+                              'time': duration}
+
+    def _open(self, resource_name):
+        """Ouvre une nouvelle session (simulateur pour les adresses 'SIM...')"""
+        if resource_name.upper().startswith(SIMULATOR_PREFIX):
+            if resource_name.upper().endswith('::INTFC'):
+                return SimulatedInterface(resource_name)
+            return SimulatedKeithley2000(resource_name)
+        return resource_manager(self.backend).open_resource(resource_name)
+
+    def acquire(self, resource_name, timeout=None):
+        """
+        Obtient une session (réutilisée si déjà ouverte)
+        Args:
+            resource_name (str): Adresse VISA
+            timeout (int): Timeout VISA en ms, appliqué à l'ouverture
+                           seulement (une session partagée garde le sien:
+                           chaque Keithley2000 applique le sien par transaction)
+        Returns:
+            PooledSession: Session à rendre par release()
+        Note: L'ouverture (open_resource, parfois plusieurs secondes) se
+              fait hors du verrou du pool: seules les demandes de la même
+              adresse l'attendent
+        """
+        t_start = time.perf_counter()
+        while True:
+            with self.lock:
+                session = self.sessions.get(resource_name)
+                if session is not None:
+                    self._take(session)
+                    self._record('reuse', resource_name, time.perf_counter() - t_start)
+                    return session
+                opening = self.opening.get(resource_name)
+                if opening is None:
+                    opening = self.opening[resource_name] = threading.Event()
+                    break
+            # Ouverture en cours par un autre thread: réutilisation (ou
+            # nouvel essai s'il a échoué) dès qu'elle se termine
+            opening.wait()
+
+        try:
+            resource = self._open(resource_name)
+            if timeout is not None:
+                resource.timeout = timeout
+        except BaseException:
+            with self.lock:
+                self.opening.pop(resource_name).set()
+            raise
+
+        with self.lock:
+            session = PooledSession(resource_name, resource)
+            self.sessions[resource_name] = session
+            self._take(session)
+            self.opening.pop(resource_name).set()
+            self._record('open', resource_name, time.perf_counter() - t_start)
+        return session
+
+    def _take(self, session):
+        """Compte une utilisation de plus (verrou du pool tenu)"""
+        session.refcount += 1
+        session.released_at = None
+        self.sessions.move_to_end(session.resource_name)
+
+    def release(self, session, close=False):
+        """
+        Rend une session au pool
+        Args:
+            session (PooledSession): Session obtenue par acquire()
+            close (bool): Ferme la session si plus personne ne l'utilise
+                          (ex: instrument qui ne répond plus)
+        """
+        with self.lock:
+            session.refcount = max(0, session.refcount - 1)
+            if session.refcount > 0:
+                return
+            if close:
+                self._close(session)
+                return
+            session.released_at = time.perf_counter()
+            self._trim()
+
+    def _trim(self):
+        """Ferme les sessions inutilisées les plus anciennes au-delà de max_idle"""
+        idle = [s for s in self.sessions.values() if s.refcount == 0]
+        for session in idle[:max(0, len(idle) - self.max_idle)]:
+            self._close(session)
+
+    def _close(self, session):
+        t_start = time.perf_counter()
+        self.sessions.pop(session.resource_name, None)
+        try:
+            session.resource.close()
+        except Exception:
+            pass
+        self._record('close', session.resource_name, time.perf_counter() - t_start)
+
+    def close_all(self):
+        """Ferme toutes les sessions (fin de l'application)"""
+        with self.lock:
+            for session in list(self.sessions.values()):
+                self._close(session)
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: Compteurs et durées cumulées (s) des ouvertures, réutilisations
+                  et fermetures, sessions ouvertes / inutilisées, temps de
+                  chargement de la bibliothèque VISA
+        """
+        with self.lock:
+            stats = dict(self.stats)
+            stats['open_sessions'] = len(self.sessions)
+            stats['idle_sessions'] = sum(1 for s in self.sessions.values() if s.refcount == 0)
+        stats['library_load_time'] = _manager_load_times.get(self.backend)
+        return stats
+
+
+# Pool par défaut du processus
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    Pool de sessions partagé par toute l'application
+    Returns:
+        SessionPool: Créé au premier appel
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+        return _default_pool